@@ -0,0 +1,95 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of `collate_rollouts` against a per-sample Python padding loop.
+
+Generates random rollouts with lengths up to `--max-length` tokens and times
+collating them into padded and packed training arrays.
+
+Usage:
+    python examples/benchmarks/collate.py --batch-size 1000 --max-length 16384
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+import numpy as np
+
+from strands_env.core import TokenObservation, collate_rollouts
+
+
+def make_rollouts(batch_size: int, max_length: int, seed: int = 0) -> tuple[list[TokenObservation], list[float]]:
+    rng = np.random.default_rng(seed)
+    observations = []
+    for length in rng.integers(max_length // 4, max_length + 1, size=batch_size):
+        prompt_length = int(rng.integers(16, 512))
+        observations.append(
+            TokenObservation(
+                token_ids=rng.integers(0, 150_000, size=length).tolist(),
+                prompt_length=prompt_length,
+                loss_mask=[0] * prompt_length + [1] * (length - prompt_length),
+                logprobs=[None] * prompt_length + rng.normal(-1.0, 0.5, size=length - prompt_length).tolist(),
+            )
+        )
+    return observations, rng.random(batch_size).tolist()
+
+
+def python_loop_collate(observations: list[TokenObservation], rewards: list[float], pad_token_id: int = 0) -> dict:
+    """Baseline: pad each field of each sample in Python."""
+    width = max(len(obs.token_ids) for obs in observations)
+    batch = {"token_ids": [], "loss_mask": [], "logprobs": [], "position_ids": [], "rewards": []}
+    for obs, reward in zip(observations, rewards):
+        pad = width - len(obs.token_ids)
+        batch["token_ids"].append(obs.token_ids + [pad_token_id] * pad)
+        batch["loss_mask"].append(obs.loss_mask + [0] * pad)
+        batch["logprobs"].append([lp if lp is not None else 0.0 for lp in obs.logprobs] + [0.0] * pad)
+        batch["position_ids"].append(list(range(len(obs.token_ids))) + [0] * pad)
+        batch["rewards"].append([reward] * len(obs.token_ids) + [0.0] * pad)
+    return {name: np.array(rows) for name, rows in batch.items()}
+
+
+def timed(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--batch-size", type=int, default=1000, help="Number of rollouts.")
+@click.option("--max-length", type=int, default=16384, help="Maximum tokens per rollout.")
+@click.option("--repeats", type=int, default=3, help="Timed repetitions (best is reported).")
+def main(batch_size: int, max_length: int, repeats: int) -> None:
+    """Compare collation strategies on a synthetic batch."""
+    observations, rewards = make_rollouts(batch_size, max_length)
+    arrays = [obs.to_arrays() for obs in observations]
+    total = sum(len(obs.token_ids) for obs in observations)
+    click.echo(f"{batch_size} rollouts, {total / 1e6:.1f}M tokens")
+
+    cases = {
+        "python loop (padded)": lambda: python_loop_collate(observations, rewards),
+        "collate_rollouts (padded)": lambda: collate_rollouts(observations, rewards),
+        "collate_rollouts (packed)": lambda: collate_rollouts(observations, rewards, packed=True),
+        "collate_rollouts (packed, TokenArrays)": lambda: collate_rollouts(arrays, rewards, packed=True),
+    }
+    for name, fn in cases.items():
+        click.echo(f"{name:<40} {timed(fn, repeats):>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
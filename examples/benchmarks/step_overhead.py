@@ -0,0 +1,117 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark of `Environment.step` overhead (everything except the model call).
+
+Runs steps against an instant in-process model, so the measured time is the
+per-step scaffolding: building tools, the `ToolLimiter`, the `Agent` and its tool
+registry, metrics and the observation. Compares `cache_tools=False` (tools rebuilt
+every step) with the default `cache_tools=True`.
+
+Usage:
+    python examples/benchmarks/step_overhead.py --steps 500 --num-tools 16
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import click
+from strands import tool
+from strands.models import Model
+
+from strands_env.core.environment import Environment
+from strands_env.core.types import Action
+
+
+class InstantModel(Model):
+    """Model that answers immediately with a fixed text response."""
+
+    def update_config(self, **model_config: Any) -> None:
+        pass
+
+    def get_config(self) -> dict:
+        return {}
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs) -> AsyncGenerator[dict, None]:
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {}}}
+        yield {"contentBlockDelta": {"delta": {"text": "42"}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {
+            "metadata": {"usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2}, "metrics": {"latencyMs": 0}}
+        }
+
+
+class ToolkitEnv(Environment):
+    """Environment exposing `num_tools` tools built from an instance method, like the bundled toolkits."""
+
+    def __init__(self, num_tools: int, **kwargs):
+        super().__init__(**kwargs)
+        self.num_tools = num_tools
+
+    def lookup(self, key: str, limit: int = 10) -> str:
+        """Look up a key.
+
+        Args:
+            key: Key to look up.
+            limit: Maximum number of results.
+        """
+        return key
+
+    def get_tools(self) -> list:
+        # Decorating introspects the signature and builds the JSON schema for each tool
+        return [tool(name=f"lookup_{i}")(self.lookup) for i in range(self.num_tools)]
+
+
+async def measure(env: Environment, steps: int) -> list[float]:
+    action = Action(message="What is 6 * 7?")
+    await env.step(action)  # Warm-up
+    durations = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        await env.step(action)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+@click.command()
+@click.option("--steps", type=int, default=500, help="Steps per configuration.")
+@click.option("--num-tools", type=int, default=16, help="Number of tools exposed by the environment.")
+def main(steps: int, num_tools: int) -> None:
+    """Compare per-step overhead with and without cached tools."""
+    results = {}
+    for cache_tools in (False, True):
+        env = ToolkitEnv(num_tools, model_factory=InstantModel)
+        env.cache_tools = cache_tools
+        results[cache_tools] = asyncio.run(measure(env, steps))
+
+    click.echo(f"{'cache_tools':<12} {'median (us)':>12} {'p90 (us)':>10}")
+    for cache_tools, durations in results.items():
+        median = statistics.median(durations) * 1e6
+        p90 = statistics.quantiles(durations, n=10)[-1] * 1e6
+        click.echo(f"{str(cache_tools):<12} {median:>12.0f} {p90:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -95,7 +95,19 @@ class EvalConfig:
     max_concurrency: int = 10
     output_dir: Path | None = None  # Defaults to {benchmark}_eval/
     save_interval: int = 10
+    metrics_interval: int | None = None  # Log live metrics every N samples
     keep_tokens: bool = False
+    pack_tokens: bool = False  # Store kept tokens in a binary sidecar instead of JSON
+    streaming: bool = False
+    results_format: Literal["jsonl", "parquet"] = "jsonl"
+    num_workers: int = 1
+    work_queue: Path | None = None  # Shared SQLite work queue for distributed workers
+    adaptive_concurrency: bool = False  # AIMD limit between min_concurrency and max_concurrency
+    min_concurrency: int = 1
+    latency_threshold: float | None = None  # Seconds; slower samples count as congestion
+    schedule: Literal["sample", "prompt"] = "sample"
+    prefix_warmup: bool = False
+    sample_timeout: float | None = None  # Seconds per sample (reset + step)
 
     def get_output_dir(self, benchmark_name: str) -> Path:
         """Get output directory, using default if not set."""
@@ -103,8 +115,13 @@ class EvalConfig:
             return self.output_dir
         return Path(f"{benchmark_name}_eval")
 
+    def get_results_path(self, benchmark_name: str) -> Path:
+        """Get results checkpoint path; the suffix selects the result store backend."""
+        return self.get_output_dir(benchmark_name) / f"results.{self.results_format}"
+
     def to_dict(self) -> dict:
         """Convert to dict for serialization."""
         d = dataclasses.asdict(self)
         d["output_dir"] = str(self.output_dir) if self.output_dir else None
+        d["work_queue"] = str(self.work_queue) if self.work_queue else None
         return d
@@ -17,10 +17,15 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import click
 
@@ -29,8 +34,13 @@ from strands_env.eval import get_benchmark, list_benchmarks, list_unavailable_be
 from .config import EnvConfig, EvalConfig, ModelConfig, SamplingConfig
 from .utils import build_model_factory, load_env_hook, load_evaluator_hook
 
+if TYPE_CHECKING:
+    from strands_env.eval import AsyncEnvFactory, Evaluator
+
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 
 @click.group("eval")
 def eval_group():
@@ -182,6 +192,42 @@ def list_cmd():
     default=10,
     help="Maximum concurrent evaluations.",
 )
+@click.option(
+    "--adaptive-concurrency",
+    is_flag=True,
+    default=False,
+    help="Adapt in-flight samples (AIMD) to latency, timeouts and throttling, up to --max-concurrency.",
+)
+@click.option(
+    "--min-concurrency",
+    type=int,
+    default=1,
+    help="Lower bound for --adaptive-concurrency.",
+)
+@click.option(
+    "--latency-threshold",
+    type=float,
+    default=None,
+    help="With --adaptive-concurrency, samples slower than this many seconds reduce the limit.",
+)
+@click.option(
+    "--schedule",
+    type=click.Choice(["sample", "prompt"]),
+    default="sample",
+    help="'prompt' dispatches the samples of a prompt together to share the server's prefix cache.",
+)
+@click.option(
+    "--prefix-warmup",
+    is_flag=True,
+    default=False,
+    help="With --schedule prompt, prefill each prompt once before dispatching its samples.",
+)
+@click.option(
+    "--sample-timeout",
+    type=float,
+    default=None,
+    help="Per-sample wall-clock deadline in seconds; overrunning samples are recorded as timeouts.",
+)
 @click.option(
     "--output",
     "-o",
@@ -195,12 +241,48 @@ def list_cmd():
     default=10,
     help="Save results every N samples.",
 )
+@click.option(
+    "--metrics-interval",
+    type=int,
+    default=None,
+    help="Log live metrics (pass@k, reward, termination reasons, usage) every N samples.",
+)
 @click.option(
     "--keep-tokens",
     is_flag=True,
     default=False,
     help="Keep token-level observations in results.",
 )
+@click.option(
+    "--pack-tokens",
+    is_flag=True,
+    default=False,
+    help="With --keep-tokens, store tokens in a packed binary sidecar (<results>.tokens/) instead of JSON.",
+)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Stream the dataset and keep finished samples only on disk (bounded memory).",
+)
+@click.option(
+    "--results-format",
+    type=click.Choice(["jsonl", "parquet"]),
+    default="jsonl",
+    help="Checkpoint format. 'parquet' stores scalar columns separately from messages (requires pyarrow).",
+)
+@click.option(
+    "--num-workers",
+    type=int,
+    default=1,
+    help="Number of worker processes. Prompts are sharded by id and --max-concurrency is split across workers.",
+)
+@click.option(
+    "--work-queue",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Shared SQLite work queue. Run the same command on several machines to evaluate as distributed workers.",
+)
 # Debug
 @click.option(
     "--debug",
@@ -233,9 +315,21 @@ def run_cmd(
     # Eval
     n_samples_per_prompt: int,
     max_concurrency: int,
+    adaptive_concurrency: bool,
+    min_concurrency: int,
+    latency_threshold: float | None,
+    schedule: Literal["sample", "prompt"],
+    prefix_warmup: bool,
+    sample_timeout: float | None,
     output: Path,
     save_interval: int,
+    metrics_interval: int | None,
     keep_tokens: bool,
+    pack_tokens: bool,
+    streaming: bool,
+    results_format: Literal["jsonl", "parquet"],
+    num_workers: int,
+    work_queue: Path | None,
     debug: bool,
 ):
     """Run benchmark evaluation.
@@ -249,7 +343,7 @@ def run_cmd(
     """
     # Setup logging
     level = logging.DEBUG if debug else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.basicConfig(level=level, format=LOG_FORMAT)
 
     # Validate: either benchmark or evaluator_path, not both, not neither
     if benchmark and evaluator_path:
@@ -261,7 +355,7 @@ def run_cmd(
     if benchmark:
         try:
             evaluator_cls = get_benchmark(benchmark)
-        except KeyError as e:
+        except (KeyError, ImportError) as e:
             raise click.ClickException(str(e))
         benchmark_name = benchmark
     else:
@@ -300,8 +394,33 @@ def run_cmd(
         max_concurrency=max_concurrency,
         output_dir=output,
         save_interval=save_interval,
+        metrics_interval=metrics_interval,
         keep_tokens=keep_tokens,
+        pack_tokens=pack_tokens,
+        streaming=streaming,
+        results_format=results_format,
+        num_workers=num_workers,
+        work_queue=work_queue,
+        adaptive_concurrency=adaptive_concurrency,
+        min_concurrency=min_concurrency,
+        latency_threshold=latency_threshold,
+        schedule=schedule,
+        prefix_warmup=prefix_warmup,
+        sample_timeout=sample_timeout,
     )
+    if eval_config.num_workers < 1:
+        raise click.ClickException("--num-workers must be at least 1")
+    if eval_config.work_queue is not None and eval_config.num_workers > 1:
+        raise click.ClickException("--work-queue and --num-workers are mutually exclusive")
+    if eval_config.work_queue is not None and (
+        eval_config.adaptive_concurrency or eval_config.schedule != "sample" or eval_config.prefix_warmup
+    ):
+        # Queue workers lease units one by one and do not go through `Evaluator.run`
+        raise click.UsageError(
+            "--work-queue cannot be combined with --adaptive-concurrency, --schedule or --prefix-warmup"
+        )
+    if eval_config.pack_tokens and not eval_config.keep_tokens:
+        raise click.ClickException("--pack-tokens requires --keep-tokens")
 
     # Build model factory
     model_factory = build_model_factory(model_config, eval_config.max_concurrency)
@@ -311,7 +430,7 @@ def run_cmd(
 
     # Get output paths based on benchmark name
     output_dir = eval_config.get_output_dir(benchmark_name)
-    results_path = output_dir / "results.jsonl"
+    results_path = eval_config.get_results_path(benchmark_name)
     metrics_path = output_dir / "metrics.json"
     config_path = output_dir / "config.json"
 
@@ -319,24 +438,21 @@ def run_cmd(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Create evaluator
-    evaluator = evaluator_cls(
-        env_factory=env_factory,
-        max_concurrency=eval_config.max_concurrency,
-        n_samples_per_prompt=eval_config.n_samples_per_prompt,
-        output_path=results_path,
-        save_interval=eval_config.save_interval,
-        keep_tokens=eval_config.keep_tokens,
-    )
+    evaluator = _create_evaluator(evaluator_cls, env_factory, eval_config, results_path)
+    if eval_config.work_queue is not None and evaluator.early_stopping is not None:
+        raise click.UsageError(f"--work-queue does not support early stopping (set by {evaluator_cls.__name__})")
 
-    # Load dataset once (convert to list since we need to iterate twice if resolving system_prompt)
-    actions = list(evaluator.load_dataset())
+    # Load dataset once (peek at the first action without materializing the rest)
+    dataset = iter(evaluator.load_dataset())
+    first_action = next(dataset, None)
+    actions = itertools.chain([first_action], dataset) if first_action is not None else iter(())
 
     # Resolve system_prompt from environment if not provided via CLI
     resolved_system_prompt = env_config.system_prompt
-    if resolved_system_prompt is None and actions:
+    if resolved_system_prompt is None and first_action is not None:
         # Use first action from dataset to create environment and get system_prompt
         async def get_env_system_prompt():
-            env = await env_factory(actions[0])
+            env = await env_factory(first_action)
             prompt = env.system_prompt
             await env.cleanup()
             return prompt
@@ -356,8 +472,7 @@ def run_cmd(
         },
         "eval": eval_config.to_dict(),
     }
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config_data, f, indent=2)
+    _write_json(config_path, config_data)
     click.echo(f"Saved config to {config_path}")
 
     # Run evaluation
@@ -366,10 +481,153 @@ def run_cmd(
     click.echo(f"  Samples per prompt: {n_samples_per_prompt}, Concurrency: {max_concurrency}")
     click.echo(f"  Output directory: {output_dir}")
 
-    results = asyncio.run(evaluator.run(actions))
-    metrics = evaluator.compute_metrics(results)
+    if eval_config.work_queue is not None:
+        from strands_env.eval.distributed import SQLiteWorkQueue, collect, default_worker_id, enqueue, run_worker
+
+        click.echo(f"  Work queue: {eval_config.work_queue}")
+        queue = SQLiteWorkQueue(eval_config.work_queue)
+        worker_id = default_worker_id()
+        actions = list(actions)
+        enqueue(evaluator, queue, actions)
+        asyncio.run(run_worker(evaluator, queue, actions, worker_id=worker_id))
+        # Workers may share the output directory, so exactly one of them writes results and metrics
+        if not queue.claim_collection(worker_id):
+            click.echo("Queue drained; results and metrics are written by the collecting worker")
+            return
+        collect(evaluator, queue)
+        metrics = evaluator.compute_metrics()
+    elif eval_config.num_workers > 1:
+        from strands_env.eval.sharding import check_merge_target, merge_shards, shard_output_path
+        from strands_env.eval.storage import create_result_store
+
+        click.echo(f"  Workers: {eval_config.num_workers}")
+        shard_stores = [
+            create_result_store(shard_output_path(results_path, i, eval_config.num_workers))
+            for i in range(eval_config.num_workers)
+        ]
+        # Fail before evaluating rather than discard existing non-sharded results when merging
+        try:
+            check_merge_target(shard_stores, evaluator.store)
+        except FileExistsError as e:
+            raise click.ClickException(str(e)) from e
+        _run_sharded(benchmark, evaluator_path, env_path, model_config, env_config, eval_config, results_path, level)
+        merge_shards(shard_stores, evaluator.store)
+        metrics = evaluator.compute_metrics()
+    else:
+        results = asyncio.run(evaluator.run(actions))
+        # In streaming mode results live only on disk, so metrics are computed from the checkpoint
+        metrics = evaluator.compute_metrics(None if eval_config.streaming else results)
+        # Reward, termination and usage aggregates tracked during the run
+        metrics = {**evaluator.live_metrics(), **metrics}
+        if evaluator.concurrency_limiter is not None:
+            metrics.update(evaluator.concurrency_limiter.metrics())
 
     # Save metrics to JSON
-    with open(metrics_path, "w", encoding="utf-8") as f:
-        json.dump(metrics, f, indent=2)
+    _write_json(metrics_path, metrics)
     click.echo(f"Saved metrics to {metrics_path}")
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write JSON via a temporary file renamed into place, so no reader or other worker sees a partial file."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _create_evaluator(
+    evaluator_cls: type[Evaluator],
+    env_factory: AsyncEnvFactory,
+    eval_config: EvalConfig,
+    output_path: Path,
+    *,
+    shard_index: int = 0,
+) -> Evaluator:
+    """Create an evaluator from config; with multiple workers, for one shard with its share of concurrency."""
+    num_shards = eval_config.num_workers
+    max_concurrency = max(1, math.ceil(eval_config.max_concurrency / num_shards))
+    limiter = None
+    if eval_config.adaptive_concurrency:
+        from strands_env.eval import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(
+            max_concurrency,
+            min_limit=min(eval_config.min_concurrency, max_concurrency),
+            latency_threshold=eval_config.latency_threshold,
+        )
+    return evaluator_cls(
+        env_factory=env_factory,
+        max_concurrency=max_concurrency,
+        n_samples_per_prompt=eval_config.n_samples_per_prompt,
+        output_path=output_path,
+        save_interval=eval_config.save_interval,
+        metrics_interval=eval_config.metrics_interval,
+        keep_tokens=eval_config.keep_tokens,
+        pack_tokens=eval_config.pack_tokens,
+        streaming=eval_config.streaming,
+        shard_index=shard_index,
+        num_shards=num_shards,
+        concurrency_limiter=limiter,
+        schedule=eval_config.schedule,
+        prefix_warmup=eval_config.prefix_warmup,
+        sample_timeout=eval_config.sample_timeout,
+    )
+
+
+def _run_shard(
+    shard_index: int,
+    benchmark: str | None,
+    evaluator_path: Path | None,
+    env_path: Path,
+    model_config: ModelConfig,
+    env_config: EnvConfig,
+    eval_config: EvalConfig,
+    results_path: Path,
+    log_level: int,
+) -> None:
+    """Worker process entry point: evaluate one prompt shard with its own event loop and model client."""
+    from strands_env.eval.sharding import shard_output_path
+
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+
+    evaluator_cls = get_benchmark(benchmark) if benchmark else load_evaluator_hook(evaluator_path)
+    max_concurrency = max(1, math.ceil(eval_config.max_concurrency / eval_config.num_workers))
+    model_factory = build_model_factory(model_config, max_concurrency)
+    env_factory = load_env_hook(env_path)(model_factory, env_config)
+
+    shard_path = shard_output_path(results_path, shard_index, eval_config.num_workers)
+    evaluator = _create_evaluator(evaluator_cls, env_factory, eval_config, shard_path, shard_index=shard_index)
+    asyncio.run(evaluator.run(evaluator.load_dataset()))
+
+
+def _run_sharded(
+    benchmark: str | None,
+    evaluator_path: Path | None,
+    env_path: Path,
+    model_config: ModelConfig,
+    env_config: EnvConfig,
+    eval_config: EvalConfig,
+    results_path: Path,
+    log_level: int,
+) -> None:
+    """Run one `_run_shard` per worker in spawned processes and wait for all of them."""
+    num_workers = eval_config.num_workers
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _run_shard,
+                i,
+                benchmark,
+                evaluator_path,
+                env_path,
+                model_config,
+                env_config,
+                eval_config,
+                results_path,
+                log_level,
+            )
+            for i in range(num_workers)
+        ]
+        for future in futures:
+            future.result()
@@ -12,18 +12,42 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .environment import Environment
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .models import ModelFactory
-from .types import (
-    Action,
-    Observation,
-    RewardFunction,
-    RewardResult,
-    StepResult,
-    TaskContext,
-    TerminationReason,
-    TokenObservation,
-)
+
+if TYPE_CHECKING:
+    from .environment import Environment
+    from .tokens import RolloutBatch, TokenArrays, collate_rollouts
+    from .types import (
+        Action,
+        Observation,
+        RewardFunction,
+        RewardResult,
+        StepResult,
+        TaskContext,
+        TerminationReason,
+        TokenObservation,
+    )
+
+# Loaded on first access (PEP 562): `types` and `environment` import the Strands SDK, whose
+# package import loads boto3 and the Bedrock model, and `tokens` pulls in NumPy. Importing
+# `strands_env.core.models` alone (e.g. from the CLI) therefore stays cheap.
+_LAZY = {
+    "Action": ".types",
+    "Environment": ".environment",
+    "Observation": ".types",
+    "RewardFunction": ".types",
+    "RewardResult": ".types",
+    "RolloutBatch": ".tokens",
+    "StepResult": ".types",
+    "TaskContext": ".types",
+    "TerminationReason": ".types",
+    "TokenArrays": ".tokens",
+    "TokenObservation": ".types",
+    "collate_rollouts": ".tokens",
+}
 
 __all__ = [
     "Action",
@@ -32,8 +56,23 @@ __all__ = [
     "Observation",
     "RewardFunction",
     "RewardResult",
+    "RolloutBatch",
     "StepResult",
     "TaskContext",
     "TerminationReason",
+    "TokenArrays",
     "TokenObservation",
+    "collate_rollouts",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
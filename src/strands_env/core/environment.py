@@ -16,7 +16,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -24,6 +27,7 @@ from strands import Agent
 from strands.agent.conversation_manager import ConversationManager, NullConversationManager
 from strands.handlers.callback_handler import PrintingCallbackHandler
 from strands.telemetry.metrics import EventLoopMetrics
+from strands.types.tools import ToolSpec
 from strands_sglang import TokenManager, ToolLimiter
 
 from .models import ModelFactory
@@ -44,6 +48,10 @@ class Environment:
 
     default_system_prompt_path: ClassVar[Path | None] = None
 
+    cache_tools: ClassVar[bool] = True
+    """Build the tool list once per instance and reuse it across steps. Disable for
+    environments whose `get_tools()` changes between steps."""
+
     def __init__(
         self,
         *,
@@ -53,12 +61,17 @@ class Environment:
         max_tool_iters: int | None = None,
         max_tool_calls: int | None = None,
         verbose: bool = False,
+        step_timeout: float | None = None,
     ):
         self.model_factory = model_factory
         self.reward_fn = reward_fn
         self.max_tool_iters = max_tool_iters
         self.max_tool_calls = max_tool_calls
         self.verbose = verbose
+        # Wall-clock limit (seconds) for the agent loop in `step`; on expiry the step ends with TIMEOUT
+        self.step_timeout = step_timeout
+        self._tools: list | None = None
+        self._tool_specs: list[ToolSpec] | None = None
 
         path = self.default_system_prompt_path
         self.system_prompt = system_prompt or (path.read_text() if path and path.exists() else None)
@@ -69,6 +82,14 @@ class Environment:
 
     async def step(self, action: Action) -> StepResult:
         """Run one agent episode and return observation + reward + termination."""
+        step_result = await self.rollout(action)
+        step_result.reward = (
+            (await self.reward_fn.compute(action=action, step_result=step_result)) if self.reward_fn else None
+        )
+        return step_result
+
+    async def rollout(self, action: Action) -> StepResult:
+        """Run one agent episode and return observation + termination, without computing the reward."""
         conversation_history = action.task_context.conversation_history
         tool_limiter = ToolLimiter(
             max_tool_iters=self.max_tool_iters,
@@ -79,7 +100,7 @@ class Environment:
         agent = Agent(
             model=model,
             messages=list(conversation_history),
-            tools=list(self.get_tools()),
+            tools=list(self.tools),
             system_prompt=self.system_prompt,
             hooks=[tool_limiter] + list(self.get_hooks()),
             conversation_manager=self.get_conversation_manager(),
@@ -87,7 +108,11 @@ class Environment:
         )
         error = None
         try:
-            await agent.invoke_async(action.message)
+            if self.step_timeout is None:
+                await agent.invoke_async(action.message)
+            else:
+                # Partial messages and metrics are kept on timeout
+                await asyncio.wait_for(agent.invoke_async(action.message), timeout=self.step_timeout)
         except Exception as e:
             error = e
         termination_reason = TerminationReason.from_error(error)
@@ -102,11 +127,126 @@ class Environment:
             **self.compute_metrics(agent.event_loop_metrics, tool_parse_errors=tool_parse_errors),
         }
         observation = Observation(messages=step_messages, tokens=token_obs, metrics=metrics)
-        step_result = StepResult(observation=observation, termination_reason=termination_reason)
-        step_result.reward = (
-            (await self.reward_fn.compute(action=action, step_result=step_result)) if self.reward_fn else None
+        return StepResult(observation=observation, termination_reason=termination_reason)
+
+    async def step_many(self, actions: Sequence[Action], *, max_concurrency: int | None = None) -> list[StepResult]:
+        """Run `step` for a batch of actions concurrently and return results in input order.
+
+        See `iter_step_many` for concurrency and error handling. If the reward function is
+        `batched` and `step` is not overridden, all episodes run first (via `rollout`) and their
+        rewards are computed with a single `compute_batch` call. If that call raises, the error is
+        logged and recorded as `observation.metrics["reward_error"]`; those results keep their
+        rollout's `TerminationReason` and get no reward.
+        """
+        batch_rewards = self.reward_fn is not None and self.reward_fn.batched and not self._step_overridden()
+        results: list[StepResult | None] = [None] * len(actions)
+        completed: list[int] = []
+        step_fn = self.rollout if batch_rewards else self.step
+        async with aclosing(self._run_many(actions, max_concurrency, step_fn)) as steps:
+            async for index, step_result, ok in steps:
+                results[index] = step_result
+                if ok:
+                    completed.append(index)
+        if batch_rewards and completed:
+            completed.sort()
+            try:
+                rewards = await self.reward_fn.compute_batch([(actions[i], results[i]) for i in completed])
+                if len(rewards) != len(completed):
+                    raise ValueError(f"compute_batch returned {len(rewards)} results for {len(completed)} samples")
+            except Exception as e:
+                logger.error(f"Batched reward computation failed for {len(completed)} steps: {e}")
+                for i in completed:
+                    results[i].observation.metrics["reward_error"] = str(e)
+            else:
+                for i, reward in zip(completed, rewards):
+                    results[i].reward = reward
+        return results
+
+    def _step_overridden(self) -> bool:
+        """Whether `step` was replaced (by a subclass or on the instance), so `rollout` alone is not an episode."""
+        return getattr(self.step, "__func__", None) is not Environment.step
+
+    async def iter_step_many(
+        self, actions: Sequence[Action], *, max_concurrency: int | None = None
+    ) -> AsyncIterator[tuple[int, StepResult]]:
+        """Run `step` for a batch of actions concurrently, yielding `(index, result)` as each finishes.
+
+        All steps share this instance, so tools (and any clients they hold) are
+        built once for the batch. Environments that keep per-episode state on the
+        instance (set up in `reset`) must not be stepped concurrently; use one
+        instance per action instead. An action whose step raises yields a result
+        with empty observation and the mapped `TerminationReason`, without
+        affecting the others. Closing the iterator early (e.g. breaking out of it
+        inside `contextlib.aclosing`) cancels the pending steps.
+
+        Args:
+            actions: Actions to run.
+            max_concurrency: Maximum steps in flight. `None` runs all at once.
+        """
+        async with aclosing(self._run_many(actions, max_concurrency, self.step)) as steps:
+            async for index, step_result, _ in steps:
+                yield index, step_result
+
+    async def _run_many(
+        self,
+        actions: Sequence[Action],
+        max_concurrency: int | None,
+        step_fn: Callable[[Action], Awaitable[StepResult]],
+    ) -> AsyncIterator[tuple[int, StepResult, bool]]:
+        """Run `step_fn` over `actions` concurrently, yielding `(index, result, succeeded)` as each finishes."""
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(index: int, action: Action) -> tuple[int, StepResult, bool]:
+            if semaphore is None:
+                return index, *await self._step_isolated(action, step_fn)
+            async with semaphore:
+                return index, *await self._step_isolated(action, step_fn)
+
+        tasks = [asyncio.create_task(run(i, action)) for i, action in enumerate(actions)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _step_isolated(
+        self, action: Action, step_fn: Callable[[Action], Awaitable[StepResult]]
+    ) -> tuple[StepResult, bool]:
+        try:
+            return await step_fn(action), True
+        except Exception as e:
+            logger.error(f"Step failed for task {action.task_context.id}: {e}")
+            return StepResult(observation=Observation(), termination_reason=TerminationReason.from_error(e)), False
+
+    async def prefill(self, action: Action) -> None:
+        """Send the episode's initial prompt to the model and stop once the server has responded.
+
+        Warms server-side prefix caches (e.g. SGLang's radix cache) before several
+        samples of the same prompt run concurrently. No tools are executed. Models
+        configured with `sampling_params` (SGLang) generate a single token; for other
+        models the stream is closed at the first event produced from the response.
+        """
+        message = (
+            action.message
+            if isinstance(action.message, dict)
+            else {"role": "user", "content": [{"text": action.message}]}
         )
-        return step_result
+        messages = [*action.task_context.conversation_history, message]
+        model = self.model_factory()
+        model.token_manager = TokenManager()
+        config = model.get_config()
+        if isinstance(config, dict) and "sampling_params" in config:
+            model.update_config(sampling_params={**(config["sampling_params"] or {}), "max_new_tokens": 1})
+        stream = model.stream(messages, tool_specs=self.tool_specs or None, system_prompt=self.system_prompt)
+        try:
+            async for event in stream:
+                # Models may emit the message and content block starts before sending the request
+                if not ({"messageStart", "contentBlockStart"} & event.keys()):
+                    break
+        finally:
+            await stream.aclose()
 
     async def cleanup(self) -> None:
         """Release resources. Override in subclasses."""
@@ -116,6 +256,26 @@ class Environment:
         """Tools available to the agent. Override in subclasses."""
         return []
 
+    @property
+    def tools(self) -> list:
+        """Tools passed to the agent: `get_tools()`, built once per instance if `cache_tools`.
+
+        Building the list binds `@tool` methods to the instance, so caching avoids
+        redoing that work on every step (and across samples with `EnvironmentPool`).
+        """
+        if not self.cache_tools:
+            return list(self.get_tools())
+        if self._tools is None:
+            self._tools = list(self.get_tools())
+        return self._tools
+
+    @property
+    def tool_specs(self) -> list[ToolSpec]:
+        """Tool specs of `tools`, cached together with them."""
+        if self._tool_specs is None or not self.cache_tools:
+            self._tool_specs = [tool.tool_spec for tool in self.tools if hasattr(tool, "tool_spec")]
+        return self._tool_specs
+
     def get_hooks(self) -> list:
         """Agent hooks. Override and call `super()` to extend."""
         return []
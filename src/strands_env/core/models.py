@@ -40,20 +40,22 @@ Example:
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
-
-import boto3
-import botocore.config
-import httpx
-from strands.models import Model
-from strands.models.bedrock import BedrockModel
-from strands.models.openai import OpenAIModel
-from strands_sglang import SGLangClient, SGLangModel
-from strands_sglang.tool_parsers import HermesToolParser, ToolParser
-from transformers import PreTrainedTokenizerBase
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+# Backend SDKs are imported inside the factories so that importing this module (and
+# `strands_env.core`) does not pay for boto3, httpx or transformers when unused.
+if TYPE_CHECKING:
+    import boto3
+    import botocore.config
+    from strands.models import Model
+    from strands.models.bedrock import BedrockModel
+    from strands_sglang import SGLangClient
+    from strands_sglang.tool_parsers import ToolParser
+    from transformers import PreTrainedTokenizerBase
 
 #: Factory that produces a fresh `Model` per step (for concurrent step isolation).
-ModelFactory = Callable[[], Model]
+ModelFactory = Callable[[], "Model"]
 
 # Other parameters like temperature and top_p will be set to model's default values if provided
 DEFAULT_SAMPLING_PARAMS = {"max_new_tokens": 16384}
@@ -82,6 +84,9 @@ def sglang_model_factory(
         return_logprob: Whether to return logprobs for each token.
         enable_thinking: Enable thinking mode for Qwen3 hybrid models.
     """
+    from strands_sglang import SGLangModel
+    from strands_sglang.tool_parsers import HermesToolParser
+
     if tool_parser is None:
         tool_parser = HermesToolParser()
 
@@ -100,19 +105,24 @@ def sglang_model_factory(
 # ---------------------------------------------------------------------------
 
 
-DEFAULT_BOTO_CLIENT_CONFIG = botocore.config.Config(
-    retries={"max_attempts": 5, "mode": "adaptive"},
-    max_pool_connections=100,
-    connect_timeout=5.0,
-    read_timeout=600.0,
-)
+@cache
+def _default_boto_client_config() -> botocore.config.Config:
+    """Build `DEFAULT_BOTO_CLIENT_CONFIG` on first use."""
+    import botocore.config
+
+    return botocore.config.Config(
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        max_pool_connections=100,
+        connect_timeout=5.0,
+        read_timeout=600.0,
+    )
 
 
 def bedrock_model_factory(
     *,
     model_id: str,
     boto_session: boto3.Session,
-    boto_client_config: botocore.config.Config = DEFAULT_BOTO_CLIENT_CONFIG,
+    boto_client_config: botocore.config.Config | None = None,
     sampling_params: dict[str, Any] = DEFAULT_SAMPLING_PARAMS,
 ) -> ModelFactory:
     """Return a factory that creates `BedrockModel` instances.
@@ -127,9 +137,13 @@ def bedrock_model_factory(
     Args:
         model_id: Bedrock model ID (e.g. "us.anthropic.claude-sonnet-4-20250514-v1:0").
         boto_session: Boto3 session for AWS credentials.
-        boto_client_config: Botocore client configuration.
+        boto_client_config: Botocore client configuration. Defaults to `DEFAULT_BOTO_CLIENT_CONFIG`.
         sampling_params: Sampling parameters for the model (e.g. `{"max_new_tokens": 4096}`).
     """
+    from strands.models.bedrock import BedrockModel
+
+    if boto_client_config is None:
+        boto_client_config = _default_boto_client_config()
     sampling_params = dict(sampling_params)
     if "max_new_tokens" in sampling_params:
         sampling_params["max_tokens"] = sampling_params.pop("max_new_tokens")
@@ -157,20 +171,25 @@ def bedrock_model_factory(
 # OpenAI Model
 # ---------------------------------------------------------------------------
 
-# OpenAI client arguments for SGLang server
-DEFAULT_OPENAI_CLIENT_ARGS = {
-    "api_key": "EMPTY",
-    "base_url": "http://localhost:30000/v1",
-    "timeout": httpx.Timeout(timeout=600.0, connect=5.0),
-    "max_retries": 5,
-}
+
+@cache
+def _default_openai_client_args() -> dict[str, Any]:
+    """Build `DEFAULT_OPENAI_CLIENT_ARGS` (OpenAI client arguments for SGLang server) on first use."""
+    import httpx
+
+    return {
+        "api_key": "EMPTY",
+        "base_url": "http://localhost:30000/v1",
+        "timeout": httpx.Timeout(timeout=600.0, connect=5.0),
+        "max_retries": 5,
+    }
 
 
 def openai_model_factory(
     *,
     model_id: str,
     sampling_params: dict[str, Any] = DEFAULT_SAMPLING_PARAMS,
-    client_args: dict[str, Any] = DEFAULT_OPENAI_CLIENT_ARGS,
+    client_args: dict[str, Any] | None = None,
 ) -> ModelFactory:
     """Return a factory that creates `OpenAIModel` instances.
 
@@ -178,7 +197,12 @@ def openai_model_factory(
         model_id: OpenAI model ID (e.g. "gpt-4o").
         sampling_params: Sampling parameters for the model (e.g. `{"max_new_tokens": 4096}`).
         client_args: Arguments for the OpenAI client (e.g. `{"api_key": "...", "base_url": "..."}`).
+            Defaults to `DEFAULT_OPENAI_CLIENT_ARGS`.
     """
+    from strands.models.openai import OpenAIModel
+
+    if client_args is None:
+        client_args = _default_openai_client_args()
     sampling_params = dict(sampling_params)
     if "max_new_tokens" in sampling_params:
         sampling_params["max_tokens"] = sampling_params.pop("max_new_tokens")
@@ -262,3 +286,20 @@ def kimi_model_factory(
         params=sampling_params,
         client_args=client_args,
     )
+
+
+# ---------------------------------------------------------------------------
+# Lazy module attributes
+# ---------------------------------------------------------------------------
+
+_LAZY_DEFAULTS = {
+    "DEFAULT_BOTO_CLIENT_CONFIG": _default_boto_client_config,
+    "DEFAULT_OPENAI_CLIENT_ARGS": _default_openai_client_args,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: build client defaults (which need botocore / httpx) only when accessed
+    if name in _LAZY_DEFAULTS:
+        return _LAZY_DEFAULTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
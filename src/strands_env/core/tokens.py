@@ -0,0 +1,258 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact NumPy representation of token observations and batch collation for training."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+
+from .types import TokenObservation
+
+TOKEN_DTYPE = np.int32
+MASK_DTYPE = np.int8
+LOGPROB_DTYPE = np.float32
+
+
+@dataclass(frozen=True)
+class TokenArrays:
+    """Array-backed `TokenObservation`: `int32` token ids, `int8` loss mask, `float32` logprobs.
+
+    Missing logprobs (`None` in `TokenObservation`) are stored as NaN. The
+    `rollout_*` and `initial_prompt_token_ids` properties return views, not
+    copies. Roughly 9 bytes per token versus ~100 for the list-backed model.
+
+    Example:
+        >>> arrays = step_result.observation.tokens.to_arrays()
+        >>> arrays.rollout_token_ids  # view into arrays.token_ids
+
+    Attributes:
+        token_ids: All token ids (prompt + rollout).
+        prompt_length: Number of initial-prompt tokens at the start of `token_ids`.
+        loss_mask: Loss mask over all tokens.
+        logprobs: Log probabilities over all tokens; NaN where unavailable.
+    """
+
+    token_ids: np.ndarray
+    prompt_length: int
+    loss_mask: np.ndarray
+    logprobs: np.ndarray
+
+    def __post_init__(self):
+        n = len(self.token_ids)
+        if len(self.loss_mask) != n or len(self.logprobs) != n:
+            raise ValueError(
+                f"Length mismatch: token_ids={n}, loss_mask={len(self.loss_mask)}, logprobs={len(self.logprobs)}"
+            )
+        if not 0 <= self.prompt_length <= n:
+            raise ValueError(f"prompt_length must be in [0, {n}], got {self.prompt_length}")
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    @classmethod
+    def from_lists(
+        cls, token_ids: list[int], prompt_length: int, loss_mask: list[int], logprobs: list[float | None]
+    ) -> TokenArrays:
+        """Build from list-backed fields, mapping `None` logprobs to NaN."""
+        return cls(
+            token_ids=np.asarray(token_ids, dtype=TOKEN_DTYPE),
+            prompt_length=prompt_length,
+            loss_mask=np.asarray(loss_mask, dtype=MASK_DTYPE),
+            logprobs=np.array([np.nan if lp is None else lp for lp in logprobs], dtype=LOGPROB_DTYPE),
+        )
+
+    @classmethod
+    def from_token_observation(cls, obs: TokenObservation) -> TokenArrays:
+        return cls.from_lists(obs.token_ids, obs.prompt_length, obs.loss_mask, obs.logprobs)
+
+    def to_token_observation(self) -> TokenObservation:
+        """Convert back to the pydantic `TokenObservation` (NaN logprobs become `None`)."""
+        logprobs = self.logprobs.tolist()
+        return TokenObservation(
+            token_ids=self.token_ids.tolist(),
+            prompt_length=self.prompt_length,
+            loss_mask=self.loss_mask.tolist(),
+            logprobs=[None if lp != lp else lp for lp in logprobs],  # NaN != NaN
+        )
+
+    @property
+    def rollout_token_ids(self) -> np.ndarray:
+        return self.token_ids[self.prompt_length :]
+
+    @property
+    def rollout_logprobs(self) -> np.ndarray:
+        return self.logprobs[self.prompt_length :]
+
+    @property
+    def rollout_loss_mask(self) -> np.ndarray:
+        return self.loss_mask[self.prompt_length :]
+
+    @property
+    def initial_prompt_token_ids(self) -> np.ndarray:
+        return self.token_ids[: self.prompt_length]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the arrays in bytes."""
+        return self.token_ids.nbytes + self.loss_mask.nbytes + self.logprobs.nbytes
+
+
+# ---------------------------------------------------------------------------
+# Batch collation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RolloutBatch:
+    """Training arrays for a batch of rollouts, right-padded `(B, L)` or sequence-packed `(T,)`.
+
+    Missing logprobs and padding are filled with 0, so `logprobs * loss_mask` is safe.
+
+    Attributes:
+        token_ids: Token ids (`int32`), padded with `pad_token_id`.
+        loss_mask: Loss mask (`int8`), 0 on padding.
+        logprobs: Log probabilities (`float32`).
+        position_ids: Position of each token within its sequence (`int32`), 0 on padding.
+        rewards: Each sequence's reward repeated over its tokens (`float32`), 0 on padding.
+        attention_mask: 1 on real tokens, 0 on padding (`int8`).
+        cu_seqlens: Sequence boundaries, `(B + 1,)` cumulative lengths (`int32`). Sequence `i`
+            spans `cu_seqlens[i]:cu_seqlens[i + 1]` of the packed stream.
+        prompt_lengths: Initial-prompt length of each sequence (`int32`).
+        sequence_rewards: One reward per sequence (`float32`).
+        packed: Whether the token arrays are packed `(T,)` rather than padded `(B, L)`.
+    """
+
+    token_ids: np.ndarray
+    loss_mask: np.ndarray
+    logprobs: np.ndarray
+    position_ids: np.ndarray
+    rewards: np.ndarray
+    attention_mask: np.ndarray
+    cu_seqlens: np.ndarray
+    prompt_lengths: np.ndarray
+    sequence_rewards: np.ndarray
+    packed: bool
+
+    def __len__(self) -> int:
+        return len(self.prompt_lengths)
+
+    @property
+    def seqlens(self) -> np.ndarray:
+        return np.diff(self.cu_seqlens)
+
+
+def _concat(items: Sequence[TokenObservation | TokenArrays], name: str, dtype: type, total: int) -> np.ndarray:
+    """Concatenate one field of all items into a flat array in a single pass."""
+    if items and all(isinstance(item, TokenArrays) for item in items):
+        return np.concatenate([getattr(item, name) for item in items]).astype(dtype, copy=False)
+    # `None` logprobs become NaN
+    return np.fromiter(
+        chain.from_iterable(getattr(item, name) for item in items),
+        dtype=dtype,
+        count=total,
+    )
+
+
+def collate_rollouts(
+    tokens: Sequence[TokenObservation | TokenArrays],
+    rewards: Sequence[float | None] | None = None,
+    *,
+    packed: bool = False,
+    pad_token_id: int = 0,
+    pad_to_multiple_of: int | None = None,
+) -> RolloutBatch:
+    """Collate token observations into training arrays with vectorized NumPy operations.
+
+    Each field of all observations is concatenated once; padding is a single masked
+    scatter into `(B, L)` arrays, and position ids and per-token rewards are derived
+    from the sequence boundaries without per-sample Python loops.
+
+    Example:
+        >>> batch = collate_rollouts(
+        ...     [r.observation.tokens for r in step_results],
+        ...     [r.reward.reward for r in step_results],
+        ...     packed=True,
+        ... )
+        >>> torch.from_numpy(batch.token_ids)
+
+    Args:
+        tokens: Token observations (list-backed or `TokenArrays`), one per sequence.
+        rewards: Reward per sequence; `None` entries (and `rewards=None`) count as 0.
+        packed: Concatenate sequences into one `(T,)` stream instead of right-padding to `(B, L)`.
+        pad_token_id: Token id used for padding.
+        pad_to_multiple_of: Round the padded length `L` (or packed length `T`) up to a multiple of this.
+
+    Raises:
+        ValueError: If `rewards` does not have one entry per sequence.
+    """
+    if rewards is not None and len(rewards) != len(tokens):
+        raise ValueError(f"Expected {len(tokens)} rewards, got {len(rewards)}")
+    lengths = np.fromiter((len(item.token_ids) for item in tokens), dtype=np.int32, count=len(tokens))
+    cu_seqlens = np.zeros(len(tokens) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=cu_seqlens[1:])
+    total = int(cu_seqlens[-1])
+
+    flat_ids = _concat(tokens, "token_ids", TOKEN_DTYPE, total)
+    flat_mask = _concat(tokens, "loss_mask", MASK_DTYPE, total)
+    flat_logprobs = np.nan_to_num(_concat(tokens, "logprobs", LOGPROB_DTYPE, total), nan=0.0)
+    flat_positions = np.arange(total, dtype=np.int32) - np.repeat(cu_seqlens[:-1], lengths)
+    sequence_rewards = np.array(
+        [0.0 if r is None else r for r in rewards] if rewards is not None else np.zeros(len(tokens)),
+        dtype=np.float32,
+    )
+    flat_rewards = np.repeat(sequence_rewards, lengths)
+    prompt_lengths = np.fromiter((item.prompt_length for item in tokens), dtype=np.int32, count=len(tokens))
+
+    def round_up(n: int) -> int:
+        return -(-n // pad_to_multiple_of) * pad_to_multiple_of if pad_to_multiple_of else n
+
+    if packed:
+        pad = round_up(total) - total
+        fields = {
+            "token_ids": np.pad(flat_ids, (0, pad), constant_values=pad_token_id),
+            "loss_mask": np.pad(flat_mask, (0, pad)),
+            "logprobs": np.pad(flat_logprobs, (0, pad)),
+            "position_ids": np.pad(flat_positions, (0, pad)),
+            "rewards": np.pad(flat_rewards, (0, pad)),
+            "attention_mask": np.pad(np.ones(total, dtype=MASK_DTYPE), (0, pad)),
+        }
+    else:
+        width = round_up(int(lengths.max(initial=0)))
+        valid = np.arange(width) < lengths[:, None]
+
+        def scatter(flat: np.ndarray, fill: int | float = 0) -> np.ndarray:
+            out = np.full((len(tokens), width), fill, dtype=flat.dtype)
+            out[valid] = flat  # Row-major order of `valid` matches the concatenation order
+            return out
+
+        fields = {
+            "token_ids": scatter(flat_ids, pad_token_id),
+            "loss_mask": scatter(flat_mask),
+            "logprobs": scatter(flat_logprobs),
+            "position_ids": scatter(flat_positions),
+            "rewards": scatter(flat_rewards),
+            "attention_mask": valid.astype(MASK_DTYPE),
+        }
+    return RolloutBatch(
+        **fields,
+        cu_seqlens=cu_seqlens,
+        prompt_lengths=prompt_lengths,
+        sequence_rewards=sequence_rewards,
+        packed=packed,
+    )
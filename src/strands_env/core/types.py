@@ -16,17 +16,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 from strands.types.content import Message, Messages
-from strands.types.exceptions import ContextWindowOverflowException, EventLoopException, MaxTokensReachedException
+from strands.types.exceptions import (
+    ContextWindowOverflowException,
+    EventLoopException,
+    MaxTokensReachedException,
+    ModelThrottledException,
+)
 from strands_sglang import MaxToolCallsReachedError, MaxToolIterationsReachedError, TokenManager
 
+if TYPE_CHECKING:
+    from .tokens import TokenArrays
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -87,6 +97,12 @@ class TokenObservation(BaseModel):
     def initial_prompt_token_ids(self) -> list[int]:
         return self.token_ids[: self.prompt_length]
 
+    def to_arrays(self) -> TokenArrays:
+        """Compact NumPy copy with zero-copy rollout views; see `TokenArrays`."""
+        from .tokens import TokenArrays
+
+        return TokenArrays.from_token_observation(self)
+
     @classmethod
     def from_token_manager(cls, token_manager: TokenManager) -> TokenObservation | None:
         """Create from strands-sglang's `TokenManager`; returns None if empty."""
@@ -136,11 +152,23 @@ class RewardResult(BaseModel):
 class RewardFunction(ABC):
     """Abstract reward function. Subclass and implement `compute`."""
 
+    batched: ClassVar[bool] = False
+    """Whether `compute_batch` shares work across samples. `Environment.step_many` and the
+    `Evaluator` then pass samples to it in batches instead of calling `compute` per sample."""
+
     @abstractmethod
     async def compute(self, action: Action, step_result: StepResult) -> RewardResult:
         """Return a `RewardResult` given the action and the environment's step result."""
         ...
 
+    async def compute_batch(self, pairs: Sequence[tuple[Action, StepResult]]) -> list[RewardResult]:
+        """Return one `RewardResult` per `(action, step_result)` pair, in order.
+
+        By default, runs `compute` for all pairs concurrently. Override (and set `batched`)
+        to deduplicate, batch or parallelize across the pairs.
+        """
+        return list(await asyncio.gather(*(self.compute(action, step_result) for action, step_result in pairs)))
+
 
 # ---------------------------------------------------------------------------
 # Step result
@@ -157,6 +185,7 @@ class TerminationReason(str, Enum):
     MAX_TOOL_ITERATIONS_REACHED = "max_tool_iterations_reached"
     MAX_TOOL_CALLS_REACHED = "max_tool_calls_reached"
     TIMEOUT = "timeout"
+    THROTTLED = "throttled"
     UNCLASSIFIED_ERROR = "unclassified_error"
 
     @classmethod
@@ -189,6 +218,8 @@ class TerminationReason(str, Enum):
                 reason = cls.MAX_TOOL_ITERATIONS_REACHED
             case MaxToolCallsReachedError():
                 reason = cls.MAX_TOOL_CALLS_REACHED
+            case ModelThrottledException():
+                reason = cls.THROTTLED
             case e if cls._is_timeout(e):
                 reason = cls.TIMEOUT
             case _:
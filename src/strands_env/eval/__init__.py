@@ -12,17 +12,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .evaluator import AsyncEnvFactory, EvalSample, Evaluator
-from .metrics import MetricFn
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .registry import get_benchmark, list_benchmarks, list_unavailable_benchmarks, register_eval
 
+if TYPE_CHECKING:
+    from .concurrency import AdaptiveConcurrencyLimiter
+    from .early_stopping import EarlyStopping
+    from .evaluator import AsyncEnvFactory, EvalSample, Evaluator
+    from .metrics import MetricAccumulator, MetricFn
+    from .pool import EnvironmentPool
+    from .reward_batching import RewardBatcher
+    from .storage import PackedTokenStore, ResultStore
+
+# Loaded on first access (PEP 562) so that e.g. listing benchmarks does not import
+# the evaluator, the Strands agent runtime or NumPy.
+_LAZY = {
+    "AdaptiveConcurrencyLimiter": ".concurrency",
+    "AsyncEnvFactory": ".evaluator",
+    "EarlyStopping": ".early_stopping",
+    "EnvironmentPool": ".pool",
+    "EvalSample": ".evaluator",
+    "Evaluator": ".evaluator",
+    "MetricAccumulator": ".metrics",
+    "MetricFn": ".metrics",
+    "PackedTokenStore": ".storage",
+    "ResultStore": ".storage",
+    "RewardBatcher": ".reward_batching",
+}
+
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "AsyncEnvFactory",
+    "EarlyStopping",
+    "EnvironmentPool",
     "EvalSample",
     "Evaluator",
+    "MetricAccumulator",
     "MetricFn",
+    "PackedTokenStore",
+    "ResultStore",
+    "RewardBatcher",
     "get_benchmark",
     "list_benchmarks",
     "list_unavailable_benchmarks",
     "register_eval",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
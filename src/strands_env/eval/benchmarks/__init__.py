@@ -14,6 +14,7 @@
 
 """Benchmark evaluator modules.
 
-Each module in this package defines benchmark evaluators using @register_eval.
-Modules with missing dependencies are skipped during discovery.
+Each module in this package defines benchmark evaluators using @register_eval and
+is listed in the generated ``_manifest.py``; regenerate it with
+``python -m strands_env.eval.benchmarks`` after adding or renaming a benchmark.
 """
@@ -0,0 +1,21 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Regenerate the benchmark manifest: ``python -m strands_env.eval.benchmarks``."""
+
+from strands_env.eval.registry import MANIFEST_PATH, render_manifest
+
+if __name__ == "__main__":
+    MANIFEST_PATH.write_text(render_manifest(), encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}")
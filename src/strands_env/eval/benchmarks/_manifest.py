@@ -0,0 +1,28 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generated by `python -m strands_env.eval.benchmarks`. Do not edit."""
+
+BENCHMARKS = {
+    "aime-2024": "strands_env.eval.benchmarks.aime",
+    "aime-2025": "strands_env.eval.benchmarks.aime",
+    "aime-2026": "strands_env.eval.benchmarks.aime",
+    "terminal-bench-1": "strands_env.eval.benchmarks.terminal_bench",
+    "terminal-bench-2": "strands_env.eval.benchmarks.terminal_bench",
+}
+
+REQUIREMENTS = {
+    "strands_env.eval.benchmarks.aime": ["datasets", "typing_extensions"],
+    "strands_env.eval.benchmarks.terminal_bench": ["harbor"],
+}
@@ -0,0 +1,185 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive (AIMD) limit on the number of in-flight evaluation samples."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import NamedTuple
+
+from strands_env.core import TerminationReason
+
+logger = logging.getLogger(__name__)
+
+#: Termination reasons that indicate the model backend is overloaded.
+CONGESTION_REASONS = frozenset({TerminationReason.TIMEOUT, TerminationReason.THROTTLED})
+
+
+class LimitDecision(NamedTuple):
+    """One change of the concurrency limit."""
+
+    time: float
+    limit: int
+    reason: str
+
+
+class AdaptiveConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease limit on in-flight samples.
+
+    The limit grows by one after `limit` consecutive samples finish without a
+    congestion signal, and is multiplied by `backoff` when a sample times out, is
+    throttled, or takes longer than `latency_threshold`. Only samples started after
+    the last decrease can trigger another one, so a burst of failures from the same
+    window backs off once rather than collapsing the limit to `min_limit`.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(max_limit=64, min_limit=4, latency_threshold=300)
+        >>> evaluator = MyEvaluator(env_factory, max_concurrency=64, concurrency_limiter=limiter)
+
+    Args:
+        max_limit: Upper bound on in-flight samples.
+        min_limit: Lower bound on in-flight samples.
+        initial_limit: Starting limit. Defaults to half of `max_limit` (at least `min_limit`).
+        latency_threshold: Per-sample latency in seconds above which a sample counts as congestion.
+            `None` disables the latency signal.
+        backoff: Multiplicative decrease factor in (0, 1).
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        initial_limit: int | None = None,
+        latency_threshold: float | None = None,
+        backoff: float = 0.5,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Expected 1 <= min_limit <= max_limit, got min_limit={min_limit}, max_limit={max_limit}")
+        if not 0 < backoff < 1:
+            raise ValueError(f"backoff must be in (0, 1), got {backoff}")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.latency_threshold = latency_threshold
+        self.backoff = backoff
+        initial = initial_limit if initial_limit is not None else max_limit // 2
+        self.limit = min(max_limit, max(min_limit, initial))
+
+        self.in_flight = 0
+        self.history: list[LimitDecision] = [LimitDecision(time.monotonic(), self.limit, "initial")]
+        self.signals: dict[str, int] = {"timeout": 0, "throttled": 0, "slow": 0, "error": 0}
+        self._condition = asyncio.Condition()
+        self._epoch = 0  # Incremented on every decrease
+        self._successes = 0  # Consecutive un-congested completions since the last change
+
+    async def acquire(self) -> int:
+        """Wait for a free slot. Returns a token to pass to `release`."""
+        token, _ = await self.acquire_many(1)
+        return token
+
+    async def acquire_many(self, count: int) -> tuple[int, int]:
+        """Wait until up to `count` slots are free at once and take them together.
+
+        At most `limit` slots are granted, so a large request cannot wait forever.
+
+        Returns:
+            `(token, granted)`; call `release` once per granted slot with the token.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight + min(count, self.limit) <= self.limit)
+            granted = min(count, self.limit)
+            self.in_flight += granted
+            return self._epoch, granted
+
+    async def release(
+        self,
+        token: int,
+        *,
+        latency: float | None = None,
+        termination_reason: TerminationReason | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Free a slot and update the limit from the sample's outcome.
+
+        Args:
+            token: Value returned by the matching `acquire`.
+            latency: Wall-clock seconds the sample took. `None` if the slot was not used,
+                in which case the limit is left unchanged.
+            termination_reason: Termination reason of the finished sample, if any.
+            error: Exception raised by the sample, if any. Timeouts and throttling
+                errors count as congestion; other errors are ignored.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if latency is not None:
+                self._update(token, self._classify(latency, termination_reason, error))
+            self._condition.notify_all()
+
+    def _update(self, token: int, signal: str | None) -> None:
+        if signal is None:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self._set_limit(self.limit + 1, "increase")
+            return
+        self.signals[signal] += 1
+        if signal != "error" and token == self._epoch:
+            self._set_limit(max(self.min_limit, int(self.limit * self.backoff)), signal)
+            self._epoch += 1
+
+    def _classify(
+        self, latency: float, termination_reason: TerminationReason | None, error: BaseException | None
+    ) -> str | None:
+        if error is not None:
+            reason = TerminationReason.from_error(error)
+            if reason not in CONGESTION_REASONS:
+                return "error"
+            termination_reason = reason
+        if termination_reason == TerminationReason.THROTTLED:
+            return "throttled"
+        if termination_reason == TerminationReason.TIMEOUT:
+            return "timeout"
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            return "slow"
+        return None
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        self._successes = 0
+        if limit == self.limit:
+            return
+        logger.info(f"Concurrency limit {self.limit} -> {limit} ({reason})")
+        self.limit = limit
+        self.history.append(LimitDecision(time.monotonic(), limit, reason))
+
+    def metrics(self) -> dict[str, float]:
+        """Summary of the limiter's decisions: final/min/max/time-weighted mean limit and signal counts."""
+        now = time.monotonic()
+        limits = [d.limit for d in self.history]
+        elapsed = now - self.history[0].time
+        if elapsed > 0:
+            ends = [d.time for d in self.history[1:]] + [now]
+            mean = sum(d.limit * (end - d.time) for d, end in zip(self.history, ends)) / elapsed
+        else:
+            mean = float(self.limit)
+        return {
+            "concurrency_limit": float(self.limit),
+            "concurrency_limit_min": float(min(limits)),
+            "concurrency_limit_max": float(max(limits)),
+            "concurrency_limit_mean": mean,
+            "concurrency_increases": float(sum(d.reason == "increase" for d in self.history)),
+            "concurrency_decreases": float(sum(d.reason in self.signals for d in self.history)),
+            **{f"congestion_{name}": float(count) for name, count in self.signals.items()},
+        }
@@ -0,0 +1,409 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Distributed evaluation via a shared work queue.
+
+A work unit is one `(prompt_id, sample_idx)` pair. Any number of processes, on one or
+more machines, can run the same `Evaluator` subclass against a shared `WorkQueue`:
+
+1. `enqueue` adds the units for a dataset (idempotent, so every worker may call it).
+2. `run_worker` leases units, evaluates them, heartbeats while they are in flight,
+   and pushes each finished sample back to the queue. Leases of crashed workers
+   expire and the units are handed to other workers.
+3. Once the queue is finished, the one worker that wins `WorkQueue.claim_collection`
+   runs `collect`, which writes all finished samples into its evaluator's result store.
+
+`SQLiteWorkQueue` is the reference implementation (a single SQLite file, e.g. on a
+shared volume). Other backends implement the `WorkQueue` interface.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from strands_env.core import Action
+
+if TYPE_CHECKING:
+    from .evaluator import EvalSample, Evaluator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """One sample to evaluate: the `sample_idx`-th rollout of prompt `prompt_id`."""
+
+    prompt_id: str
+    sample_idx: int
+
+    @property
+    def sample_id(self) -> str:
+        return f"{self.prompt_id}_{self.sample_idx}"
+
+
+class WorkQueue(ABC):
+    """Abstract lease-based work queue of `WorkUnit`s and their results."""
+
+    @abstractmethod
+    def enqueue(self, units: Iterable[WorkUnit]) -> int:
+        """Add units that are not already queued. Returns the number of new units."""
+        ...
+
+    @abstractmethod
+    def lease(self, worker_id: str, max_units: int, lease_seconds: float) -> list[WorkUnit]:
+        """Lease up to `max_units` pending (or expired) units to `worker_id`."""
+        ...
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, sample_ids: Iterable[str], lease_seconds: float) -> None:
+        """Extend the leases `worker_id` holds on the given units."""
+        ...
+
+    @abstractmethod
+    def complete(self, worker_id: str, unit: WorkUnit, sample: EvalSample) -> bool:
+        """Push a finished sample. Returns False if the unit was already completed."""
+        ...
+
+    @abstractmethod
+    def fail(self, worker_id: str, unit: WorkUnit, error: str) -> None:
+        """Give a unit back after an error so it can be retried."""
+        ...
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """Number of units per status (``pending``, ``leased``, ``done``, ``failed``)."""
+        ...
+
+    @abstractmethod
+    def iter_results(self) -> Iterator[tuple[str, EvalSample]]:
+        """Stream `(prompt_id, sample)` for finished units, ordered by prompt and sample index."""
+        ...
+
+    @abstractmethod
+    def claim_collection(self, worker_id: str) -> bool:
+        """Claim the job of collecting the results finished so far.
+
+        True for the first worker to claim after units finished since the last claim
+        (and only for it), so a reused queue is collected again once new units finished.
+        A worker that holds the current claim may claim again.
+        """
+        ...
+
+    def is_finished(self) -> bool:
+        """True when no unit is pending or leased."""
+        counts = self.counts()
+        return counts.get("pending", 0) == 0 and counts.get("leased", 0) == 0
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue backed by a single SQLite file.
+
+    Every operation runs in its own short transaction, so any number of processes
+    may share the file. Leasing uses ``BEGIN IMMEDIATE`` so two workers never
+    lease the same unit. A unit whose lease expires is re-leased; after
+    `max_attempts` leases it is marked ``failed`` instead.
+
+    Args:
+        path: Path to the SQLite database file (created if missing).
+        max_attempts: Maximum number of times a unit is leased before it is given up.
+    """
+
+    def __init__(self, path: Path | str, *, max_attempts: int = 3):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS units (
+                    sample_id TEXT PRIMARY KEY,
+                    prompt_id TEXT NOT NULL,
+                    sample_idx INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    result TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS units_status ON units (status)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def _connect(self) -> _Transaction:
+        return _Transaction(sqlite3.connect(self.path, timeout=60.0, isolation_level=None))
+
+    def enqueue(self, units: Iterable[WorkUnit]) -> int:
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO units (sample_id, prompt_id, sample_idx) VALUES (?, ?, ?)",
+                ((u.sample_id, u.prompt_id, u.sample_idx) for u in units),
+            )
+            return conn.total_changes - before
+
+    def lease(self, worker_id: str, max_units: int, lease_seconds: float) -> list[WorkUnit]:
+        if max_units <= 0:
+            return []
+        now = time.time()
+        with self._connect() as conn:
+            # Units whose lease expired too many times are given up
+            conn.execute(
+                "UPDATE units SET status = 'failed', error = 'lease expired' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            rows = conn.execute(
+                "SELECT sample_id, prompt_id, sample_idx FROM units "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY rowid LIMIT ?",
+                (now, max_units),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE units SET status = 'leased', worker_id = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE sample_id = ?",
+                ((worker_id, now + lease_seconds, sample_id) for sample_id, _, _ in rows),
+            )
+        return [WorkUnit(prompt_id=prompt_id, sample_idx=sample_idx) for _, prompt_id, sample_idx in rows]
+
+    def heartbeat(self, worker_id: str, sample_ids: Iterable[str], lease_seconds: float) -> None:
+        expires = time.time() + lease_seconds
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE units SET lease_expires = ? WHERE sample_id = ? AND worker_id = ? AND status = 'leased'",
+                ((expires, sample_id, worker_id) for sample_id in sample_ids),
+            )
+
+    def complete(self, worker_id: str, unit: WorkUnit, sample: EvalSample) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE units SET status = 'done', worker_id = ?, result = ?, error = NULL "
+                "WHERE sample_id = ? AND status != 'done'",
+                (worker_id, sample.model_dump_json(), unit.sample_id),
+            )
+            return cursor.rowcount > 0
+
+    def fail(self, worker_id: str, unit: WorkUnit, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE units SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_expires = NULL WHERE sample_id = ? AND worker_id = ? AND status = 'leased'",
+                (self.max_attempts, error, unit.sample_id, worker_id),
+            )
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status").fetchall()
+        return dict(rows)
+
+    def claim_collection(self, worker_id: str) -> bool:
+        with self._connect() as conn:
+            (finished,) = conn.execute("SELECT COUNT(*) FROM units WHERE status IN ('done', 'failed')").fetchone()
+            claim = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('collector', 'collected_units')"))
+            if claim.get("collector") != worker_id and int(claim.get("collected_units", -1)) >= finished:
+                return False
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("collector", worker_id), ("collected_units", str(finished))],
+            )
+        return True
+
+    def iter_results(self) -> Iterator[tuple[str, EvalSample]]:
+        from .evaluator import EvalSample
+
+        conn = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            cursor = conn.execute(
+                "SELECT prompt_id, result FROM units WHERE status = 'done' ORDER BY prompt_id, sample_idx"
+            )
+            for prompt_id, result in cursor:
+                yield prompt_id, EvalSample.model_validate_json(result)
+        finally:
+            conn.close()
+
+
+class _Transaction:
+    """Context manager running one immediate transaction on an autocommit connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Coordinator / worker
+# ---------------------------------------------------------------------------
+
+
+def default_worker_id() -> str:
+    """Unique worker id of the form ``{hostname}-{pid}-{random}``."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def enqueue(evaluator: Evaluator, queue: WorkQueue, actions: Iterable[Action]) -> int:
+    """Enqueue `n_samples_per_prompt` units per action. Safe to call from every worker."""
+    units = (
+        WorkUnit(prompt_id=action.task_context.id, sample_idx=i)
+        for action in actions
+        for i in range(evaluator.n_samples_per_prompt)
+    )
+    added = queue.enqueue(units)
+    logger.info(f"Enqueued {added} new work units")
+    return added
+
+
+async def run_worker(
+    evaluator: Evaluator,
+    queue: WorkQueue,
+    actions: Iterable[Action],
+    *,
+    worker_id: str | None = None,
+    lease_seconds: float = 900.0,
+    heartbeat_interval: float | None = None,
+    poll_interval: float = 5.0,
+) -> int:
+    """Lease and evaluate units until the queue is finished.
+
+    Keeps up to `evaluator.max_concurrency` units in flight and extends their
+    leases every `heartbeat_interval` seconds (default: a third of `lease_seconds`).
+    Exceptions from `evaluate_sample` are reported with `WorkQueue.fail` so the unit
+    can be retried by any worker.
+
+    Args:
+        evaluator: Evaluator whose `evaluate_sample` is run for each unit.
+        queue: Shared work queue.
+        actions: Dataset actions, used to look up the action for a leased prompt id.
+        worker_id: Unique worker id. Defaults to `default_worker_id()`.
+        lease_seconds: Lease duration; units of a worker that stops heartbeating are re-leased after this.
+        heartbeat_interval: Seconds between lease extensions.
+        poll_interval: Seconds to wait before polling again when no unit is available.
+
+    Returns:
+        Number of units completed by this worker.
+    """
+    worker_id = worker_id or default_worker_id()
+    heartbeat_interval = heartbeat_interval or lease_seconds / 3
+    actions_by_prompt = {action.task_context.id: action for action in actions}
+    in_flight: dict[str, WorkUnit] = {}
+    completed = 0
+
+    async def heartbeat() -> None:
+        while True:
+            await asyncio.sleep(heartbeat_interval)
+            if in_flight:
+                await asyncio.to_thread(queue.heartbeat, worker_id, list(in_flight), lease_seconds)
+
+    async def process(unit: WorkUnit) -> None:
+        nonlocal completed
+        try:
+            base = actions_by_prompt.get(unit.prompt_id)
+            if base is None:
+                raise KeyError(f"Prompt '{unit.prompt_id}' is not in this worker's dataset")
+            action = base.model_copy(deep=True)
+            action.task_context.id = unit.sample_id
+            sample = await evaluator.evaluate_sample(action)
+        except Exception as e:
+            logger.error(f"[{unit.sample_id}] failed on worker {worker_id}: {e}")
+            await asyncio.to_thread(queue.fail, worker_id, unit, str(e))
+        else:
+            if await asyncio.to_thread(queue.complete, worker_id, unit, sample):
+                completed += 1
+        finally:
+            in_flight.pop(unit.sample_id, None)
+
+    tasks: set[asyncio.Task] = set()
+    heartbeat_task = asyncio.create_task(heartbeat())
+    try:
+        while True:
+            free = evaluator.max_concurrency - len(tasks)
+            units = await asyncio.to_thread(queue.lease, worker_id, free, lease_seconds) if free > 0 else []
+            for unit in units:
+                in_flight[unit.sample_id] = unit
+                tasks.add(asyncio.create_task(process(unit)))
+
+            if not tasks:
+                if await asyncio.to_thread(queue.is_finished):
+                    break
+                # Remaining units are leased by other workers; wait in case their leases expire
+                await asyncio.sleep(poll_interval)
+                continue
+            _, tasks = await asyncio.wait(tasks, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        heartbeat_task.cancel()
+        for task in tasks:
+            task.cancel()
+
+    logger.info(f"Worker {worker_id} completed {completed} units")
+    return completed
+
+
+def collect(evaluator: Evaluator, queue: WorkQueue, batch_size: int = 1000) -> int:
+    """Replace the evaluator's result store contents with all finished samples from the queue.
+
+    Workers sharing an output directory must not collect concurrently: call this only
+    from the worker for which `WorkQueue.claim_collection` returned True.
+
+    Returns:
+        Number of collected samples.
+    """
+    token_store = evaluator.token_store
+    evaluator.store.clear()
+    if token_store is not None:
+        token_store.clear()
+
+    def flush(batch: list[tuple[str, EvalSample]]) -> None:
+        evaluator.store.append(token_store.extract(batch) if token_store is not None else batch)
+
+    total = 0
+    batch: list[tuple[str, EvalSample]] = []
+    for record in queue.iter_results():
+        batch.append(record)
+        if len(batch) >= batch_size:
+            flush(batch)
+            total += len(batch)
+            batch = []
+    flush(batch)
+    total += len(batch)
+
+    counts = queue.counts()
+    if counts.get("failed", 0):
+        logger.warning(f"{counts['failed']} work units failed and are missing from the results")
+    logger.info(f"Collected {total} samples into {evaluator.store.path}")
+    return total
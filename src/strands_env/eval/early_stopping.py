@@ -0,0 +1,70 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sequential sampling: stop sampling a prompt once its pass rate is decided."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+
+
+def wilson_interval(successes: int, n: int, confidence: float) -> tuple[float, float]:
+    """Two-sided Wilson score interval for a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+@dataclass(frozen=True)
+class EarlyStopping:
+    """Stop issuing samples for a prompt once its pass rate is confidently near 0 or 1.
+
+    After at least `min_samples` samples, a prompt is decided when the Wilson
+    interval of its pass rate at `confidence` lies entirely above ``1 - tolerance``
+    or entirely below `tolerance`. With the defaults, 7 passes out of 7 (or 7
+    failures) decide a prompt.
+
+    Attributes:
+        min_samples: Minimum samples per prompt before stopping is considered.
+        confidence: Confidence level of the Wilson interval.
+        tolerance: Distance from 0 or 1 within which the pass rate counts as decided.
+        reward_threshold: Reward at or above which a sample passes (should match pass@k).
+    """
+
+    min_samples: int = 4
+    confidence: float = 0.9
+    tolerance: float = 0.3
+    reward_threshold: float = 1.0
+
+    def __post_init__(self):
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1, got {self.min_samples}")
+        if not 0 < self.confidence < 1:
+            raise ValueError(f"confidence must be in (0, 1), got {self.confidence}")
+        if not 0 < self.tolerance < 0.5:
+            raise ValueError(f"tolerance must be in (0, 0.5), got {self.tolerance}")
+
+    def is_decided(self, n: int, passed: int) -> bool:
+        """Whether a prompt with `passed` passing samples out of `n` needs no more samples."""
+        if n < self.min_samples:
+            return False
+        low, high = wilson_interval(passed, n, self.confidence)
+        return low >= 1 - self.tolerance or high <= self.tolerance
@@ -17,20 +17,38 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import itertools
 import logging
+import time
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from functools import partial
+from operator import itemgetter
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from strands_env.core import Action, Environment, StepResult
-
-from .metrics import MetricFn, compute_pass_at_k
+from strands_env.core import Action, Environment, Observation, RewardFunction, StepResult, TerminationReason
+
+from .concurrency import AdaptiveConcurrencyLimiter
+from .early_stopping import EarlyStopping
+from .metrics import (
+    MetricAccumulator,
+    MetricFn,
+    PassAtKAccumulator,
+    RewardAccumulator,
+    TerminationAccumulator,
+    UsageAccumulator,
+    compute_pass_at_k,
+)
+from .pool import EnvironmentPool
+from .reward_batching import RewardBatcher
+from .sharding import shard_for
+from .storage import PackedTokenStore, ResultStore, create_result_store, token_sidecar_path
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +72,15 @@ class Evaluator:
     benchmark_name: str = ""
     """Benchmark identifier. Override in subclasses."""
 
+    timeout_grace: float = 30.0
+    """Seconds past `sample_timeout` allowed for reward computation before the step is cancelled outright."""
+
+    reward_batch_size: int = 64
+    """Maximum samples per `compute_batch` call for `batched` reward functions (see `RewardBatcher`)."""
+
+    reward_batch_wait: float = 0.05
+    """Maximum seconds a finished sample waits for others to share its `compute_batch` call."""
+
     def __init__(
         self,
         env_factory: AsyncEnvFactory,
@@ -63,6 +90,18 @@ class Evaluator:
         output_path: Path | str = Path.cwd() / "results.jsonl",
         save_interval: int = 10,
         keep_tokens: bool = False,
+        pack_tokens: bool = False,
+        compact_on_finish: bool = False,
+        streaming: bool = False,
+        shard_index: int = 0,
+        num_shards: int = 1,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        schedule: Literal["sample", "prompt"] = "sample",
+        prefix_warmup: bool = False,
+        early_stopping: EarlyStopping | None = None,
+        sample_timeout: float | None = None,
+        env_pool: EnvironmentPool | None = None,
+        metrics_interval: int | None = None,
     ):
         """Initialize the evaluator.
 
@@ -70,9 +109,39 @@ class Evaluator:
             env_factory: Async factory function that creates a fresh Environment per sample.
             max_concurrency: Maximum concurrent evaluate_sample() calls.
             n_samples_per_prompt: Number of samples per prompt (for pass@k, set to max(k_values)).
-            output_path: Path to JSONL file for saving results. Enables resume.
-            save_interval: Flush results to disk every N completed samples.
+            output_path: Path for saving results. Enables resume. A ``.parquet`` suffix selects the
+                columnar `ParquetResultStore`; anything else uses JSONL.
+            save_interval: Append newly completed samples to disk every N completed samples.
             keep_tokens: Keep token-level observation in results (only valid for `SGLangModel` backends).
+            pack_tokens: With `keep_tokens`, save tokens to a binary `PackedTokenStore` next to the
+                results (``<output_path>.tokens``) instead of as JSON lists. Saved samples then have
+                no tokens; read them with `token_store.get(sample_id)` or `token_store.iter_arrays()`.
+            compact_on_finish: Rewrite the checkpoint grouped by prompt at the end of `run()`.
+            streaming: Pull actions lazily and keep finished samples only on disk, so memory stays
+                O(max_concurrency) instead of O(dataset x n_samples_per_prompt). Metrics are then
+                computed from the checkpoint file.
+            shard_index: Index of the prompt shard evaluated by this instance (see `strands_env.eval.sharding`).
+            num_shards: Total number of prompt shards. Prompts outside `shard_index` are skipped.
+            concurrency_limiter: Adapts the number of in-flight samples to observed latency, timeouts
+                and throttling, within its own bounds. If `None`, `max_concurrency` is a fixed limit.
+            schedule: ``"sample"`` dispatches samples one by one as slots free up. ``"prompt"`` waits until
+                all pending samples of a prompt fit and dispatches them together, so they share the
+                server's prefix cache (e.g. SGLang's radix cache) instead of being spread out in time.
+            prefix_warmup: With ``schedule="prompt"``, prefill each prompt once (see `warmup_prompt`)
+                before dispatching its samples.
+            early_stopping: Stop issuing samples for a prompt once its pass rate is decided
+                (see `EarlyStopping`). Samples are then dispatched round by round (every prompt's
+                first sample, then every prompt's second, ...) so that outcomes arrive before a
+                prompt's later samples are issued; in streaming mode, round by round within windows
+                of `2 x max_concurrency` prompts. pass@k uses each prompt's actual sample count.
+            sample_timeout: Wall-clock deadline in seconds for `reset()` + `step()` of one sample. The
+                agent loop is cancelled at the deadline and the sample is recorded with
+                `TerminationReason.TIMEOUT` (keeping partial messages and metrics for `Environment`
+                subclasses); `cleanup()` still runs.
+            env_pool: Reuse warm environments from this pool instead of creating and cleaning up
+                one per sample. The pool is owned by the caller (see `EnvironmentPool.close`).
+            metrics_interval: Log `live_metrics()` every N completed samples. `None` disables logging;
+                live metrics are tracked either way.
         """
         self.env_factory: AsyncEnvFactory = env_factory
         self.max_concurrency = max_concurrency
@@ -80,10 +149,43 @@ class Evaluator:
         self.output_path = Path(output_path)
         self.save_interval = save_interval
         self.keep_tokens = keep_tokens
+        if pack_tokens and not keep_tokens:
+            raise ValueError("pack_tokens requires keep_tokens")
+        self.compact_on_finish = compact_on_finish
+        self.streaming = streaming
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(f"shard_index must be in [0, {num_shards}), got {shard_index}")
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self.concurrency_limiter = concurrency_limiter
+        if schedule not in ("sample", "prompt"):
+            raise ValueError(f"schedule must be 'sample' or 'prompt', got {schedule!r}")
+        self.schedule = schedule
+        self.prefix_warmup = prefix_warmup
+        if early_stopping is not None and schedule == "prompt":
+            raise ValueError("early_stopping requires schedule='sample'")
+        self.early_stopping = early_stopping
+        self.sample_timeout = sample_timeout
+        self.env_pool = env_pool
+        self.metrics_interval = metrics_interval
+        self.store: ResultStore = create_result_store(self.output_path)
+        self.token_store = PackedTokenStore(token_sidecar_path(self.output_path)) if pack_tokens else None
 
         # Runtime state
         self.results: dict[str, list[EvalSample]] = defaultdict(list)
         self.completed_ids: set[str] = set()
+        # Completed samples not yet appended to the checkpoint file
+        self._unsaved: list[tuple[str, EvalSample]] = []
+        # Per-prompt [n_samples, n_passed], tracked for early stopping
+        self._outcomes: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        self._accumulators: list[MetricAccumulator] = []
+        # Resumed sample ids not yet fed to the accumulators (replayed on the first `live_metrics` call)
+        self._unreplayed_ids: set[str] = set()
+        # Live `[RewardBatcher, n_samples_using_it]` per `batched` reward function, keyed by id; an
+        # entry is dropped (and its counts folded into `_reward_batch_totals`) when its last sample ends
+        self._reward_batchers: dict[int, list] = {}
+        # Per reward function class: [n_batches, n_samples] of this run
+        self._reward_batch_totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
 
     def load_dataset(self) -> Iterable[Action]:
         """Load dataset. Override in subclasses."""
@@ -102,114 +204,463 @@ class Evaluator:
                 compute_pass_at_k,
                 k_values=list(range(1, self.n_samples_per_prompt + 1)),
                 reward_threshold=1.0,
+                extrapolate=self.early_stopping is not None,
             )
         ]
 
+    def get_metric_accumulators(self) -> list[MetricAccumulator]:
+        """Return incrementally updated metrics for `live_metrics`. Override to customize.
+
+        By default: pass@k (as in `get_metric_fns`), reward, termination reasons and usage.
+        """
+        return [
+            PassAtKAccumulator(
+                k_values=list(range(1, self.n_samples_per_prompt + 1)),
+                reward_threshold=1.0,
+                extrapolate=self.early_stopping is not None,
+            ),
+            RewardAccumulator(),
+            TerminationAccumulator(),
+            UsageAccumulator(),
+        ]
+
+    def live_metrics(self) -> dict[str, float]:
+        """Metrics over all samples of the current `run()` so far, including resumed ones.
+
+        Cheap to call at any time; after `run()` returns these are the final metrics,
+        computed without reloading results. Resumed samples are read from the checkpoint
+        (without messages) on the first call, so resuming itself stays index-only.
+        """
+        if self._unreplayed_ids:
+            self._replay_metrics()
+        metrics: dict[str, float] = {}
+        for accumulator in self._accumulators:
+            metrics.update(accumulator.snapshot())
+        return metrics
+
+    def iter_results(self, include_messages: bool = True) -> Iterator[tuple[str, EvalSample]]:
+        """Stream `(prompt_id, sample)` pairs from the checkpoint, skipping duplicate sample ids."""
+        return self.store.iter_results(include_messages=include_messages)
+
+    def read_results(self, include_messages: bool = True) -> dict[str, list[EvalSample]]:
+        """Read all saved samples from the checkpoint, grouped by prompt_id.
+
+        Args:
+            include_messages: If False, message transcripts are not loaded (cheaper for
+                reward-only metrics such as pass@k, especially with the Parquet store).
+        """
+        return self.store.read_results(include_messages=include_messages)
+
     def load_results(self) -> None:
-        """Load completed samples from checkpoint file."""
-        if not self.output_path.exists():
-            return
+        """Rebuild `completed_ids` from the checkpoint.
 
+        Only the store's index is read; saved samples are hydrated on demand
+        (see `read_results` and `ResultStore.load_samples`).
+        """
         self.results = defaultdict(list)
-        self.completed_ids = set()
+        self._unsaved = []
 
-        with open(self.output_path, encoding="utf-8") as f:
-            for line in f:
-                data = json.loads(line)
-                prompt_id = data.pop("prompt_id")
-                sample = EvalSample.model_validate(data)
-                self.results[prompt_id].append(sample)
-                self.completed_ids.add(sample.action.task_context.id)
+        # Recover from an interrupted write before anything is appended
+        self.store.repair()
+        self.completed_ids = self.store.completed_ids()
 
-        total = sum(len(s) for s in self.results.values())
-        logger.info(f"Resumed {total} samples from {self.output_path}")
+        if self.completed_ids:
+            logger.info(f"Resumed {len(self.completed_ids)} samples from {self.output_path}")
 
     def save_results(self) -> None:
-        """Save all samples to checkpoint file."""
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            for prompt_id, samples in self.results.items():
-                for sample in samples:
-                    data = sample.model_dump()
-                    data["prompt_id"] = prompt_id
-                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+        """Append samples completed since the last save to the checkpoint.
+
+        Each call writes only the new samples, so the cost per checkpoint is
+        proportional to `save_interval`, not to the run size.
+        """
+        if not self._unsaved:
+            return
+        # Tokens are committed first, so every saved sample has its tokens
+        records = self.token_store.extract(self._unsaved) if self.token_store is not None else self._unsaved
+        self.store.append(records)
+        self._unsaved = []
+
+    def compact_results(self) -> None:
+        """Rewrite the checkpoint with samples grouped by prompt and duplicates removed."""
+        self.save_results()
+        self.store.compact()
 
     async def evaluate_sample(self, action: Action) -> EvalSample:
         """Evaluate a single sample."""
-        env = await self.env_factory(action)
+        if self.env_pool is not None:
+            step_result = await self._run_pooled_episode(action)
+        else:
+            env = await self.env_factory(action)
+            try:
+                with self._batched_rewards(env):
+                    step_result = await self._run_episode(env, action)
+            finally:
+                await env.cleanup()
+
+        if not self.keep_tokens:
+            step_result.observation.tokens = None
+        # Runtime logging for debugging
+        reward_str = f"{step_result.reward.reward:.2f}" if step_result.reward else "N/A"
+        reward_info = step_result.reward.info if step_result.reward else {}
+        logger.info(
+            f"[{action.task_context.id}]: "
+            f"reward={reward_str} | "
+            f"label={action.task_context.ground_truth} | "
+            f"reward_info={reward_info} | "
+            f"metrics={step_result.observation.metrics}"
+        )
+        return EvalSample(action=action, step_result=step_result)
+
+    @contextlib.contextmanager
+    def _batched_rewards(self, env: Environment) -> Iterator[None]:
+        """Route a `batched` reward function of `env` through a shared `RewardBatcher` for one sample.
+
+        Samples finishing close together then share one `compute_batch` call, even though
+        each `step()` computes its own reward. `env.reward_fn` is restored on exit.
+        """
+        reward_fn = getattr(env, "reward_fn", None)
+        if not isinstance(reward_fn, RewardFunction) or not reward_fn.batched:
+            yield
+            return
+        # The batcher references `reward_fn`, so its id cannot be reused while the entry exists
+        entry = self._reward_batchers.get(id(reward_fn))
+        if entry is None:
+            batcher = RewardBatcher(reward_fn, max_batch_size=self.reward_batch_size, max_wait=self.reward_batch_wait)
+            entry = self._reward_batchers[id(reward_fn)] = [batcher, 0]
+        batcher = entry[0]
+        entry[1] += 1
+        env.reward_fn = batcher
         try:
-            await env.reset()
-            step_result = await env.step(action)
-            if not self.keep_tokens:
-                step_result.observation.tokens = None
-            # Runtime logging for debugging
-            reward_str = f"{step_result.reward.reward:.2f}" if step_result.reward else "N/A"
-            reward_info = step_result.reward.info if step_result.reward else {}
-            logger.info(
-                f"[{action.task_context.id}]: "
-                f"reward={reward_str} | "
-                f"label={action.task_context.ground_truth} | "
-                f"reward_info={reward_info} | "
-                f"metrics={step_result.observation.metrics}"
-            )
-            return EvalSample(action=action, step_result=step_result)
+            yield
         finally:
-            await env.cleanup()
+            env.reward_fn = reward_fn
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._reward_batchers[id(reward_fn)]
+                totals = self._reward_batch_totals[type(reward_fn).__name__]
+                totals[0] += batcher.num_batches
+                totals[1] += batcher.num_samples
+
+    async def _run_pooled_episode(self, action: Action) -> StepResult:
+        """Check out a reset environment from `env_pool` and `step()` it, all within `sample_timeout` if set."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                # The pool resets the environment on checkout; a reset cancelled here evicts it
+                env = await asyncio.wait_for(
+                    stack.enter_async_context(self.env_pool.acquire(action)), timeout=self.sample_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[{action.task_context.id}]: environment checkout exceeded sample_timeout={self.sample_timeout}s"
+                )
+                return StepResult(observation=Observation(), termination_reason=TerminationReason.TIMEOUT)
+            with self._batched_rewards(env):
+                if self.sample_timeout is None:
+                    step_result = await env.step(action)
+                else:
+                    remaining = max(0.0, self.sample_timeout - (loop.time() - start))
+                    step_result = await self._step_with_deadline(env, action, remaining, reset=False)
+            if step_result.termination_reason == TerminationReason.TIMEOUT:
+                # A cancelled episode may leave tools in an unknown state
+                self.env_pool.mark_unhealthy(env)
+            return step_result
+
+    async def _run_episode(self, env: Environment, action: Action) -> StepResult:
+        """`reset()`, then `step()`, within `sample_timeout` if set."""
+        if self.sample_timeout is None:
+            await env.reset()
+            return await env.step(action)
+        return await self._step_with_deadline(env, action, self.sample_timeout)
 
-    async def run(self, actions: Iterable[Action]) -> dict[str, list[EvalSample]]:
-        """Run evaluation on actions with n_samples_per_prompt each.
+    async def _step_with_deadline(
+        self, env: Environment, action: Action, timeout: float, *, reset: bool = True
+    ) -> StepResult:
+        """Run `reset()` + `step()` within `timeout` seconds, returning a TIMEOUT result on expiry.
 
-        Args:
-            actions: Actions to evaluate.
+        For `Environment` instances the remaining time is passed on as `step_timeout`, so the
+        agent loop is cancelled inside `step()` and partial messages and metrics are kept.
+        `step()` itself is cancelled only if it overruns by more than `timeout_grace`.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        step_timeout = getattr(env, "step_timeout", None)
+        try:
+            if reset:
+                await asyncio.wait_for(env.reset(), timeout=timeout)
+            remaining = max(0.0, deadline - loop.time())
+            if isinstance(env, Environment):
+                env.step_timeout = remaining if step_timeout is None else min(step_timeout, remaining)
+            return await asyncio.wait_for(env.step(action), timeout=remaining + self.timeout_grace)
+        except asyncio.TimeoutError:
+            logger.warning(f"[{action.task_context.id}]: cancelled after exceeding sample_timeout={timeout}s")
+            return StepResult(observation=Observation(), termination_reason=TerminationReason.TIMEOUT)
+        finally:
+            # Pooled environments are reused, so the per-sample deadline must not stick
+            if isinstance(env, Environment):
+                env.step_timeout = step_timeout
 
-        Returns:
-            Dict mapping prompt_id to list of EvalSample results.
+    async def warmup_prompt(self, action: Action) -> None:
+        """Prefill a prompt once before its samples are dispatched. Override to customize.
+
+        By default, creates an environment and calls `Environment.prefill`. Failures are
+        logged and ignored, since warm-up only affects throughput.
         """
-        self.load_results()
+        env = None
+        try:
+            env = await self.env_factory(action)
+            await env.prefill(action)
+        except Exception as e:
+            logger.warning(f"[{action.task_context.id}] prefix warm-up failed: {e}")
+        finally:
+            if env is not None:
+                await env.cleanup()
 
-        # Expand actions to (prompt_id, sample_id, action) tuples
-        to_process: list[tuple[str, str, Action]] = []
+    def _expand_actions(self, actions: Iterable[Action]) -> Iterator[tuple[str, str, Action]]:
+        """Lazily expand actions to `(prompt_id, sample_id, action)` tuples, skipping completed samples."""
         for action in actions:
             prompt_id = action.task_context.id
+            if self.num_shards > 1 and shard_for(prompt_id, self.num_shards) != self.shard_index:
+                continue
             for i in range(self.n_samples_per_prompt):
                 sample_id = f"{prompt_id}_{i}"
                 if sample_id not in self.completed_ids:
                     expanded = action.model_copy(deep=True)
                     expanded.task_context.id = sample_id
-                    to_process.append((prompt_id, sample_id, expanded))
+                    yield prompt_id, sample_id, expanded
+
+    @staticmethod
+    def _round_major(
+        items: Iterable[tuple[str, str, Action]], window: int | None = None
+    ) -> Iterator[tuple[str, str, Action]]:
+        """Reorder expanded samples so every prompt's i-th sample comes before any (i+1)-th sample.
+
+        With `window`, consecutive groups of `window` prompts are reordered one at a time,
+        so the dataset is still pulled lazily. `None` reorders all prompts at once.
+        """
+        groups = (list(group) for _, group in itertools.groupby(items, key=itemgetter(0)))
+        while chunk := list(itertools.islice(groups, window)):
+            # Stable sort: within a round, prompts keep dataset order
+            yield from sorted(itertools.chain.from_iterable(chunk), key=lambda item: int(item[1].rpartition("_")[2]))
+
+    async def _evaluate_limited(self, action: Action, limiter: AdaptiveConcurrencyLimiter, token: int) -> EvalSample:
+        """Evaluate a sample and report its latency and outcome to the limiter."""
+        start = time.monotonic()
+        try:
+            sample = await self.evaluate_sample(action)
+        except Exception as e:
+            await limiter.release(token, latency=time.monotonic() - start, error=e)
+            raise
+        await limiter.release(
+            token, latency=time.monotonic() - start, termination_reason=sample.step_result.termination_reason
+        )
+        return sample
+
+    async def run(self, actions: Iterable[Action]) -> dict[str, list[EvalSample]]:
+        """Run evaluation on actions with n_samples_per_prompt each.
+
+        With ``schedule="sample"``, a fixed pool of `max_concurrency` workers pulls expanded
+        samples from a shared iterator, so at most `max_concurrency` samples are in flight at
+        any time. With a `concurrency_limiter`, the pool has `max_limit` workers and each one
+        waits for a limiter slot before pulling the next sample. With ``schedule="prompt"``,
+        the pending samples of each prompt are dispatched together once enough slots are free.
 
-        semaphore = asyncio.Semaphore(self.max_concurrency)
+        Args:
+            actions: Actions to evaluate.
+
+        Returns:
+            Dict mapping prompt_id to list of EvalSample results. Empty in streaming mode;
+            use `read_results()` or `compute_metrics()` to read results back from disk.
+        """
+        self.load_results()
+        resumed_ids = set(self.completed_ids)
+
+        self._reward_batch_totals.clear()
+        # Early stopping counts only this checkpoint's samples, never those of a previous `run()`
+        self._outcomes.clear()
+        self._accumulators = self.get_metric_accumulators()
+        self._unreplayed_ids = set(resumed_ids) if self._accumulators else set()
+        if resumed_ids and self.early_stopping:
+            self._replay_outcomes()
+
+        limiter = self.concurrency_limiter
+        num_workers = limiter.max_limit if limiter else max(1, self.max_concurrency)
+        to_process: Iterable[tuple[str, str, Action]] = self._expand_actions(actions)
+        if self.early_stopping:
+            # A window of twice the in-flight samples leaves time for a prompt's previous outcome to arrive
+            to_process = self._round_major(to_process, window=2 * num_workers if self.streaming else None)
+        total = None
+        if not self.streaming:
+            to_process = list(to_process)
+            total = len(to_process)
+        pending = iter(to_process)
+        skipped = 0
         save_counter = 0
-        total = len(to_process)
 
-        async def process(prompt_id: str, sample_id: str, action: Action, pbar: tqdm) -> None:
+        async def process(pbar: tqdm, item: tuple[str, str, Action], token: int) -> None:
             nonlocal save_counter
-            async with semaphore:
+            prompt_id, sample_id, action = item
+            if limiter:
+                sample = await self._evaluate_limited(action, limiter, token)
+                pbar.set_postfix(limit=limiter.limit, refresh=False)
+            else:
                 sample = await self.evaluate_sample(action)
+            if not self.streaming:
                 self.results[prompt_id].append(sample)
-                self.completed_ids.add(sample_id)
-                pbar.update(1)
-                save_counter += 1
-                if save_counter >= self.save_interval:
-                    self.save_results()
-                    save_counter = 0
-
+            if self.early_stopping:
+                self._record_outcome(prompt_id, sample)
+            for accumulator in self._accumulators:
+                accumulator.update(prompt_id, sample)
+            self.completed_ids.add(sample_id)
+            self._unsaved.append((prompt_id, sample))
+            pbar.update(1)
+            save_counter += 1
+            if save_counter >= self.save_interval:
+                self.save_results()
+                save_counter = 0
+            if self.metrics_interval and pbar.n % self.metrics_interval == 0:
+                logger.info(f"Live metrics after {pbar.n} samples: {self.live_metrics()}")
+
+        async def worker(pbar: tqdm) -> None:
+            nonlocal skipped
+            while True:
+                token = await limiter.acquire() if limiter else 0
+                item = next(pending, None)
+                if item is None or self._is_decided(item[0]):
+                    if limiter:
+                        await limiter.release(token)
+                    if item is None:
+                        return
+                    skipped += 1
+                    if pbar.total is not None:
+                        pbar.total -= 1
+                    continue
+                await process(pbar, item, token)
+
+        desc = f"Evaluating {self.benchmark_name}"
+        if self.num_shards > 1:
+            desc += f" [shard {self.shard_index + 1}/{self.num_shards}]"
         with logging_redirect_tqdm():
-            with tqdm(total=total, desc=f"Evaluating {self.benchmark_name}", unit="sample", dynamic_ncols=True) as pbar:
-                await asyncio.gather(*[process(pid, sid, a, pbar) for pid, sid, a in to_process])
+            with tqdm(total=total, desc=desc, unit="sample", dynamic_ncols=True) as pbar:
+                if self.schedule == "prompt":
+                    await self._dispatch_by_prompt(pending, partial(process, pbar))
+                else:
+                    await asyncio.gather(*[worker(pbar) for _ in range(num_workers)])
         self.save_results()
+        if skipped:
+            logger.info(f"Early stopping skipped {skipped} samples of decided prompts")
+        if limiter:
+            logger.info(f"Adaptive concurrency: {limiter.metrics()}")
+        if self.env_pool is not None:
+            logger.info(f"Environment pool: {self.env_pool.metrics()}")
+        for name, (num_batches, num_samples) in self._reward_batch_totals.items():
+            logger.info(
+                f"Reward batching ({name}): {num_batches} batches, {num_samples / max(num_batches, 1):.1f} samples/batch"
+            )
+        if self.compact_on_finish:
+            self.compact_results()
+
+        if not self.streaming and resumed_ids:
+            # Hydrate samples from previous runs, ahead of this run's samples
+            for prompt_id, samples in self.store.load_samples(resumed_ids).items():
+                self.results[prompt_id][:0] = samples
         return dict(self.results)
 
-    def compute_metrics(self, results: dict[str, list[EvalSample]], log: bool = True) -> dict[str, float]:
+    def _replay_outcomes(self) -> None:
+        """Count resumed samples towards early stopping, from the store's rewards (index-only for JSONL)."""
+        for prompt_id, _, reward in self.store.iter_rewards():
+            self._count_outcome(prompt_id, reward)
+
+    def _replay_metrics(self) -> None:
+        """Feed resumed samples to the metric accumulators."""
+        replay_ids, self._unreplayed_ids = self._unreplayed_ids, set()
+        for prompt_id, sample in self.store.iter_results(include_messages=False):
+            if sample.action.task_context.id in replay_ids:
+                for accumulator in self._accumulators:
+                    accumulator.update(prompt_id, sample)
+
+    def _record_outcome(self, prompt_id: str, sample: EvalSample) -> None:
+        reward = sample.step_result.reward
+        self._count_outcome(prompt_id, reward.reward if reward is not None else None)
+
+    def _count_outcome(self, prompt_id: str, reward: float | None) -> None:
+        outcome = self._outcomes[prompt_id]
+        outcome[0] += 1
+        outcome[1] += int(reward is not None and reward >= self.early_stopping.reward_threshold)
+
+    def _is_decided(self, prompt_id: str) -> bool:
+        """Whether early stopping has decided `prompt_id`, so its remaining samples are skipped."""
+        if self.early_stopping is None or prompt_id not in self._outcomes:
+            return False
+        return self.early_stopping.is_decided(*self._outcomes[prompt_id])
+
+    async def _dispatch_by_prompt(
+        self,
+        pending: Iterator[tuple[str, str, Action]],
+        process: Callable[[tuple[str, str, Action], int], Awaitable[None]],
+    ) -> None:
+        """Dispatch each prompt's pending samples together once enough slots are free.
+
+        Groups larger than the concurrency limit are dispatched in limit-sized chunks.
+        The first exception raised by a sample cancels the remaining ones and is re-raised.
+        """
+        limiter = self.concurrency_limiter
+        slots = asyncio.Semaphore(max(1, self.max_concurrency))
+        tasks: set[asyncio.Task] = set()
+        errors: list[BaseException] = []
+
+        async def run_one(item: tuple[str, str, Action], token: int) -> None:
+            try:
+                await process(item, token)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                if not limiter:
+                    slots.release()
+
+        try:
+            for _, group_iter in itertools.groupby(pending, key=itemgetter(0)):
+                group = list(group_iter)
+                warm = not self.prefix_warmup
+                while group:
+                    if limiter:
+                        token, granted = await limiter.acquire_many(len(group))
+                    else:
+                        token, granted = 0, min(len(group), max(1, self.max_concurrency))
+                        for _ in range(granted):
+                            await slots.acquire()
+                    if errors:
+                        raise errors[0]
+                    chunk, group = group[:granted], group[granted:]
+                    if not warm:
+                        await self.warmup_prompt(chunk[0][2])
+                        warm = True
+                    for item in chunk:
+                        task = asyncio.create_task(run_one(item, token))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+            if errors:
+                raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def compute_metrics(self, results: dict[str, list[EvalSample]] | None = None, log: bool = True) -> dict[str, float]:
         """Compute all metrics on results.
 
         Args:
-            results: Dict mapping prompt_id to sample results.
+            results: Dict mapping prompt_id to sample results. Read from the checkpoint file if `None`,
+                without message transcripts (pass results explicitly to metrics that need them).
             log: Whether to log the metrics summary.
 
         Returns:
             Dict mapping metric names to values.
         """
+        if results is None:
+            results = self.read_results(include_messages=False)
+
         metrics = {}
         for fn in self.get_metric_fns():
             metrics.update(fn(results))
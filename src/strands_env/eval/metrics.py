@@ -16,10 +16,13 @@
 
 from __future__ import annotations
 
-import math
-from collections.abc import Callable
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .evaluator import EvalSample
 
@@ -27,44 +30,281 @@ if TYPE_CHECKING:
 MetricFn = Callable[[dict[str, list["EvalSample"]]], dict[str, float]]
 
 
+def pass_at_k_scores(
+    n: Sequence[int] | np.ndarray,
+    c: Sequence[int] | np.ndarray,
+    k_values: Sequence[int],
+    extrapolate: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-prompt pass@k scores for all k at once.
+
+    Uses the unbiased estimator ``1 - C(n-c, k) / C(n, k)``, written as the product
+    ``prod_{i<k} (n-c-i) / (n-i)``. The cumulative sum of its log terms over `i`
+    gives every k in one pass, and it is computed once per distinct `(n, c)` pair.
+
+    Args:
+        n: Number of samples per prompt.
+        c: Number of passing samples per prompt.
+        k_values: k values to evaluate.
+        extrapolate: Score prompts with ``n < k`` with ``1 - (1 - c/n)^k`` instead of marking them invalid.
+
+    Returns:
+        `(scores, valid)`, both of shape `(num_prompts, len(k_values))`. Invalid entries
+        (prompts with too few samples) have score 0.
+    """
+    ks = np.asarray(k_values, dtype=np.int64)
+    pairs = np.stack([np.asarray(n, dtype=np.int64), np.asarray(c, dtype=np.int64)], axis=1).reshape(-1, 2)
+    unique, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    un, uc = unique[:, 0:1], unique[:, 1:2]
+
+    max_k = int(min(ks.max(initial=0), un.max(initial=0)))
+    i = np.arange(max_k)
+    # Clipping only touches terms whose k is overridden below (n - c < k, or k > n)
+    log_terms = np.log(np.maximum(un - uc - i, 1)) - np.log(np.maximum(un - i, 1))
+    cum_log = np.concatenate([np.zeros((len(unique), 1)), np.cumsum(log_terms, axis=1)], axis=1)
+
+    scores = 1.0 - np.exp(cum_log[:, np.minimum(ks, max_k)])
+    scores = np.where(uc == 0, 0.0, scores)
+    scores = np.where(un - uc < ks, 1.0, scores)
+    valid = (ks <= un) & (un > 0)
+    if extrapolate:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plug_in = 1.0 - (1.0 - uc / un) ** ks
+        scores = np.where(ks > un, plug_in, scores)
+        valid = np.broadcast_to(un > 0, scores.shape)
+    scores = np.where(valid, scores, 0.0)
+    inverse = inverse.reshape(-1)
+    return scores[inverse], valid[inverse]
+
+
 def compute_pass_at_k(
     results: dict[str, list["EvalSample"]],
     k_values: list[int],
     reward_threshold: float = 1.0,
+    extrapolate: bool = False,
+    bootstrap: int = 0,
+    confidence: float = 0.95,
+    seed: int = 0,
 ) -> dict[str, float]:
     """Compute pass@k metrics using unbiased estimator.
 
+    The estimator uses the actual number of samples `n` of each prompt, so prompts
+    may have different sample counts (e.g. with early stopping). All k values are
+    computed together by `pass_at_k_scores`.
+
     Args:
         results: Dict mapping prompt_id to list of samples.
         k_values: List of k values for pass@k.
         reward_threshold: Reward threshold for "pass" (default: 1.0).
+        extrapolate: If True, prompts with fewer than k samples are scored with the
+            plug-in estimate ``1 - (1 - c/n)^k`` instead of being skipped. This is exact
+            for prompts whose samples all pass or all fail.
+        bootstrap: Number of bootstrap resamples of the prompts. If positive, also report
+            ``pass@k_ci_low`` and ``pass@k_ci_high`` percentile confidence bounds.
+        confidence: Confidence level of the bootstrap interval.
+        seed: Random seed for the bootstrap resamples.
 
     Returns:
-        Dict mapping "pass@k" to average score.
+        Dict mapping "pass@k" to average score (plus confidence bounds with `bootstrap`).
     """
     if not results:
-        return {f"pass@{k}": 0.0 for k in k_values}
+        metrics = {f"pass@{k}": 0.0 for k in k_values}
+        if bootstrap > 0:
+            metrics.update({f"pass@{k}_ci_{side}": 0.0 for k in k_values for side in ("low", "high")})
+        return metrics
 
     def is_correct(s: EvalSample) -> bool:
         r = s.step_result.reward
         return r is not None and r.reward >= reward_threshold
 
-    def pass_at_k_single(n: int, c: int, k: int) -> float:
-        """Unbiased estimator: 1 - C(n-c, k) / C(n, k)."""
-        if n - c < k:
-            return 1.0
-        if c == 0:
-            return 0.0
-        log_ratio = sum(math.log(n - c - i) - math.log(n - i) for i in range(k))
-        return 1.0 - math.exp(log_ratio)
-
-    metrics = {}
-    for k in k_values:
-        scores = []
-        for samples in results.values():
-            n, c = len(samples), sum(1 for s in samples if is_correct(s))
-            if k <= n:
-                scores.append(pass_at_k_single(n, c, k))
-        metrics[f"pass@{k}"] = sum(scores) / len(scores) if scores else 0.0
+    n = [len(samples) for samples in results.values()]
+    c = [sum(1 for s in samples if is_correct(s)) for samples in results.values()]
+    scores, valid = pass_at_k_scores(n, c, k_values, extrapolate=extrapolate)
+    counts = valid.sum(axis=0)
+    means = np.divide(scores.sum(axis=0), counts, out=np.zeros(len(k_values)), where=counts > 0)
+    metrics = {f"pass@{k}": float(mean) for k, mean in zip(k_values, means)}
 
+    if bootstrap > 0:
+        low, high = _bootstrap_interval(scores, valid, bootstrap, confidence, seed)
+        for j, k in enumerate(k_values):
+            metrics[f"pass@{k}_ci_low"] = float(low[j])
+            metrics[f"pass@{k}_ci_high"] = float(high[j])
     return metrics
+
+
+def _bootstrap_interval(
+    scores: np.ndarray, valid: np.ndarray, num_resamples: int, confidence: float, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Percentile interval of the mean score per column over prompt resamples.
+
+    Each resample is a vector of per-prompt multiplicities, so its means are one matrix
+    product with the score matrix. Resamples are processed in chunks to bound memory.
+    """
+    rng = np.random.default_rng(seed)
+    num_prompts = len(scores)
+    valid_f = valid.astype(np.float64)
+    chunk = max(1, (1 << 22) // num_prompts)
+    resampled = []
+    for start in range(0, num_resamples, chunk):
+        size = min(chunk, num_resamples - start)
+        weights = rng.multinomial(num_prompts, np.full(num_prompts, 1.0 / num_prompts), size=size).astype(np.float64)
+        totals = weights @ valid_f
+        resampled.append(np.divide(weights @ scores, totals, out=np.zeros_like(totals), where=totals > 0))
+    means = np.concatenate(resampled)
+    alpha = (1.0 - confidence) / 2
+    return np.quantile(means, alpha, axis=0), np.quantile(means, 1.0 - alpha, axis=0)
+
+
+# ---------------------------------------------------------------------------
+# Incremental accumulators
+# ---------------------------------------------------------------------------
+
+
+class MetricAccumulator(ABC):
+    """Metric computed incrementally, one sample at a time.
+
+    `update` is O(1) per sample and `snapshot` returns the metrics of all samples
+    seen so far, so an `Evaluator` can report live metrics during a run and the
+    final metrics without reloading results. Accumulators are also `MetricFn`s:
+    calling one on a results dict resets it and feeds all samples.
+    """
+
+    @abstractmethod
+    def update(self, prompt_id: str, sample: EvalSample) -> None:
+        """Add one finished sample."""
+        ...
+
+    @abstractmethod
+    def snapshot(self) -> dict[str, float]:
+        """Metrics over all samples added since the last `reset`."""
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget all samples."""
+        ...
+
+    def __call__(self, results: dict[str, list[EvalSample]]) -> dict[str, float]:
+        self.reset()
+        for prompt_id, samples in results.items():
+            for sample in samples:
+                self.update(prompt_id, sample)
+        return self.snapshot()
+
+
+class PassAtKAccumulator(MetricAccumulator):
+    """Incremental `compute_pass_at_k`.
+
+    Keeps `(n, c)` per prompt and the number of prompts per distinct `(n, c)` pair,
+    so a snapshot costs O(distinct pairs x k values) regardless of the sample count.
+    """
+
+    def __init__(self, k_values: list[int], reward_threshold: float = 1.0, extrapolate: bool = False):
+        self.k_values = k_values
+        self.reward_threshold = reward_threshold
+        self.extrapolate = extrapolate
+        self.reset()
+
+    def reset(self) -> None:
+        self._prompts: dict[str, tuple[int, int]] = {}
+        self._pairs: Counter[tuple[int, int]] = Counter()
+
+    def update(self, prompt_id: str, sample: EvalSample) -> None:
+        reward = sample.step_result.reward
+        passed = int(reward is not None and reward.reward >= self.reward_threshold)
+        old = self._prompts.get(prompt_id)
+        if old is not None:
+            self._pairs[old] -= 1
+            if not self._pairs[old]:
+                del self._pairs[old]
+        n, c = old or (0, 0)
+        self._prompts[prompt_id] = new = (n + 1, c + passed)
+        self._pairs[new] += 1
+
+    def snapshot(self) -> dict[str, float]:
+        if not self._pairs:
+            return {f"pass@{k}": 0.0 for k in self.k_values}
+        pairs = np.array(list(self._pairs), dtype=np.int64)
+        weights = np.fromiter(self._pairs.values(), dtype=np.float64, count=len(self._pairs))
+        scores, valid = pass_at_k_scores(pairs[:, 0], pairs[:, 1], self.k_values, extrapolate=self.extrapolate)
+        counts = weights @ valid
+        means = np.divide(weights @ scores, counts, out=np.zeros(len(self.k_values)), where=counts > 0)
+        return {f"pass@{k}": float(mean) for k, mean in zip(self.k_values, means)}
+
+
+class RewardAccumulator(MetricAccumulator):
+    """Mean reward over samples with a reward, and the fraction of samples without one."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._total = 0.0
+        self._rewarded = 0
+        self._count = 0
+
+    def update(self, prompt_id: str, sample: EvalSample) -> None:
+        self._count += 1
+        if sample.step_result.reward is not None:
+            self._total += sample.step_result.reward.reward
+            self._rewarded += 1
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "reward_mean": self._total / self._rewarded if self._rewarded else 0.0,
+            "reward_missing": (self._count - self._rewarded) / self._count if self._count else 0.0,
+        }
+
+
+class TerminationAccumulator(MetricAccumulator):
+    """Fraction of samples per `TerminationReason` (``termination/<reason>``)."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._counts: Counter[str] = Counter()
+
+    def update(self, prompt_id: str, sample: EvalSample) -> None:
+        self._counts[sample.step_result.termination_reason.value] += 1
+
+    def snapshot(self) -> dict[str, float]:
+        total = sum(self._counts.values())
+        return {f"termination/{reason}": count / total for reason, count in sorted(self._counts.items())}
+
+
+class UsageAccumulator(MetricAccumulator):
+    """Per-sample means of model calls, tool calls, token counts and model latency.
+
+    Reads the step metrics recorded by `Environment.step`; samples missing a metric
+    (e.g. from custom environments) are left out of that metric's mean.
+    """
+
+    #: Output name -> path into `Observation.metrics`.
+    FIELDS: dict[str, tuple[str, ...]] = {
+        "model_calls_mean": ("model_calls",),
+        "tool_calls_mean": ("tool_calls",),
+        "input_tokens_mean": ("input_tokens", "total"),
+        "output_tokens_mean": ("output_tokens", "total"),
+        "model_latency_s_mean": ("model_latency_s", "total"),
+    }
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._sums: dict[str, float] = dict.fromkeys(self.FIELDS, 0.0)
+        self._counts: dict[str, int] = dict.fromkeys(self.FIELDS, 0)
+
+    def update(self, prompt_id: str, sample: EvalSample) -> None:
+        metrics = sample.step_result.observation.metrics
+        for name, path in self.FIELDS.items():
+            value = metrics
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, (int, float)):
+                self._sums[name] += value
+                self._counts[name] += 1
+
+    def snapshot(self) -> dict[str, float]:
+        return {name: self._sums[name] / count for name, count in self._counts.items() if count}
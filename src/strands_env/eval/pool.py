@@ -0,0 +1,160 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of warm environments reused across samples."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from strands_env.core import Action, Environment
+
+if TYPE_CHECKING:
+    from .evaluator import AsyncEnvFactory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledEnv:
+    env: Environment
+    uses: int = 0
+
+
+class EnvironmentPool:
+    """Keeps idle environments per configuration key and hands them out per sample.
+
+    An environment is created with `env_factory` on a miss, reset before every use,
+    and returned to the pool afterwards. It is evicted (and cleaned up) instead if
+    its use raised, it was marked unhealthy, it fails `health_check`, or it reached
+    `max_uses`. Reuse is only safe for environments whose `reset()` restores a clean
+    episode state; environments that depend on the action (e.g. a container per task)
+    need a `key_fn` that separates those configurations.
+
+    Example:
+        >>> async with EnvironmentPool(env_factory, key_fn=lambda a: a.task_context.id) as pool:
+        ...     evaluator = MyEvaluator(env_factory, env_pool=pool)
+        ...     await evaluator.run(actions)
+
+    Args:
+        env_factory: Async factory creating an environment for an action.
+        key_fn: Maps an action to its configuration key. `None` shares one key across all actions.
+        max_idle_per_key: Maximum idle environments kept per key; extra ones are cleaned up.
+        max_uses: Retire an environment after this many uses. `None` means unlimited.
+        health_check: Async predicate run before reusing an idle environment.
+    """
+
+    def __init__(
+        self,
+        env_factory: AsyncEnvFactory,
+        *,
+        key_fn: Callable[[Action], Hashable] | None = None,
+        max_idle_per_key: int = 64,
+        max_uses: int | None = None,
+        health_check: Callable[[Environment], Awaitable[bool]] | None = None,
+    ):
+        self.env_factory = env_factory
+        self.key_fn = key_fn
+        self.max_idle_per_key = max_idle_per_key
+        self.max_uses = max_uses
+        self.health_check = health_check
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._idle: dict[Hashable, list[_PooledEnv]] = defaultdict(list)
+        self._unhealthy: set[int] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> EnvironmentPool:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def acquire(self, action: Action) -> AsyncIterator[Environment]:
+        """Check out a reset environment for `action` and return it to the pool afterwards."""
+        key = self.key_fn(action) if self.key_fn else None
+        entry = await self._checkout(key, action)
+        healthy = False
+        try:
+            await entry.env.reset()
+            yield entry.env
+            healthy = True
+        finally:
+            entry.uses += 1
+            await self._checkin(key, entry, healthy)
+
+    def mark_unhealthy(self, env: Environment) -> None:
+        """Evict `env` instead of returning it to the pool when its current use ends."""
+        self._unhealthy.add(id(env))
+
+    async def _checkout(self, key: Hashable, action: Action) -> _PooledEnv:
+        idle = self._idle[key]
+        while idle:
+            entry = idle.pop()
+            if self.health_check is None or await self._passes_health_check(entry.env):
+                self.hits += 1
+                return entry
+            await self._evict(entry)
+        self.misses += 1
+        return _PooledEnv(env=await self.env_factory(action))
+
+    async def _passes_health_check(self, env: Environment) -> bool:
+        try:
+            return await self.health_check(env)
+        except Exception as e:
+            logger.warning(f"Environment health check failed: {e}")
+            return False
+
+    async def _checkin(self, key: Hashable, entry: _PooledEnv, healthy: bool) -> None:
+        healthy = healthy and id(entry.env) not in self._unhealthy
+        self._unhealthy.discard(id(entry.env))
+        retired = self.max_uses is not None and entry.uses >= self.max_uses
+        if not healthy or retired or self._closed or len(self._idle[key]) >= self.max_idle_per_key:
+            await self._evict(entry)
+        else:
+            self._idle[key].append(entry)
+
+    async def _evict(self, entry: _PooledEnv) -> None:
+        self.evictions += 1
+        try:
+            await entry.env.cleanup()
+        except Exception as e:
+            logger.warning(f"Environment cleanup failed during eviction: {e}")
+
+    async def close(self) -> None:
+        """Clean up all idle environments. Environments in use are cleaned up when released."""
+        self._closed = True
+        idle = [entry for entries in self._idle.values() for entry in entries]
+        self._idle.clear()
+        for entry in idle:
+            await self._evict(entry)
+
+    def metrics(self) -> dict[str, float]:
+        """Pool hit/miss counts, hit rate, evictions and idle environments."""
+        total = self.hits + self.misses
+        return {
+            "pool_hits": float(self.hits),
+            "pool_misses": float(self.misses),
+            "pool_hit_rate": self.hits / total if total else 0.0,
+            "pool_evictions": float(self.evictions),
+            "pool_idle": float(sum(len(entries) for entries in self._idle.values())),
+        }
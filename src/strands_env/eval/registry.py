@@ -12,16 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Benchmark registry with auto-discovery.
+"""Benchmark registry with lazy loading.
 
-Evaluator modules are discovered and imported on first registry access.
-Benchmarks with missing optional dependencies are skipped with a warning.
+Built-in benchmark names are resolved through a generated manifest
+(``benchmarks/_manifest.py``: benchmark name -> module, module -> third-party
+requirements), so listing benchmarks imports no benchmark module and
+`get_benchmark` imports only the module it needs. Third-party packages add
+benchmarks through the ``strands_env.benchmarks`` entry point group, e.g. in
+``pyproject.toml``::
+
+    [project.entry-points."strands_env.benchmarks"]
+    my-benchmark = "my_package.evaluators:MyEvaluator"
+
+Regenerate the manifest after adding or renaming a built-in benchmark with
+``python -m strands_env.eval.benchmarks``.
 """
 
 from __future__ import annotations
 
+import ast
 import importlib
+import importlib.util
 import logging
+import sys
+from importlib.metadata import EntryPoint, entry_points
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,16 +44,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Registry: benchmark name -> Evaluator subclass
+ENTRY_POINT_GROUP = "strands_env.benchmarks"
+BENCHMARKS_PACKAGE = "strands_env.eval.benchmarks"
+BENCHMARKS_DIR = Path(__file__).parent / "benchmarks"
+MANIFEST_PATH = BENCHMARKS_DIR / "_manifest.py"
+
+# Registry: benchmark name -> Evaluator subclass (filled as modules are imported)
 _BENCHMARKS: dict[str, type[Evaluator]] = {}
-# Unavailable modules: module_name -> error message
-_UNAVAILABLE: dict[str, str] = {}
-_DISCOVERED = False
+_ENTRY_POINTS: dict[str, EntryPoint] | None = None
 
 
 def register_eval(name: str):
     """Decorator to register a benchmark evaluator.
 
+    Built-in benchmarks must also be listed in the manifest (see module docstring).
+
     Example:
         @register_eval("aime-2024")
         class AIME2024Evaluator(Evaluator):
@@ -55,33 +74,30 @@ def register_eval(name: str):
     return decorator
 
 
-def _discover_benchmarks() -> None:
-    """Discover and import all benchmark modules from the benchmarks/ subdirectory.
+def _entry_points() -> dict[str, EntryPoint]:
+    global _ENTRY_POINTS
+    if _ENTRY_POINTS is None:
+        _ENTRY_POINTS = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    return _ENTRY_POINTS
 
-    Modules with missing dependencies are tracked as unavailable.
-    """
-    global _DISCOVERED
-    if _DISCOVERED:
-        return
 
-    benchmarks_dir = Path(__file__).parent / "benchmarks"
+def _missing_requirements(module: str) -> list[str]:
+    """Top-level packages required by a built-in benchmark module that are not installed (no import)."""
+    from .benchmarks._manifest import REQUIREMENTS
 
-    for py_file in benchmarks_dir.glob("*.py"):
-        module_name = py_file.stem
-        if module_name.startswith("_"):
-            continue
+    return [req for req in REQUIREMENTS.get(module, []) if importlib.util.find_spec(req) is None]
 
-        try:
-            importlib.import_module(f"strands_env.eval.benchmarks.{module_name}")
-        except ImportError as e:
-            _UNAVAILABLE[module_name] = str(e)
-            logger.debug(f"Skipping benchmark module '{module_name}': {e}")
 
-    _DISCOVERED = True
+def _load_entry_point(name: str, ep: EntryPoint) -> None:
+    from .evaluator import Evaluator
+
+    obj = ep.load()
+    if name not in _BENCHMARKS and isinstance(obj, type) and issubclass(obj, Evaluator):
+        _BENCHMARKS[name] = obj
 
 
 def get_benchmark(name: str) -> type[Evaluator]:
-    """Get a registered benchmark evaluator by name.
+    """Get a benchmark evaluator by name, importing only the module that defines it.
 
     Args:
         name: Benchmark name (e.g., "aime-2024").
@@ -91,30 +107,120 @@ def get_benchmark(name: str) -> type[Evaluator]:
 
     Raises:
         KeyError: If benchmark is not registered.
+        ImportError: If the benchmark's module cannot be imported (e.g. missing optional dependencies).
     """
-    _discover_benchmarks()
+    from .benchmarks._manifest import BENCHMARKS
 
     if name not in _BENCHMARKS:
-        available = ", ".join(sorted(_BENCHMARKS.keys())) or "(none)"
+        if name in BENCHMARKS:
+            try:
+                importlib.import_module(BENCHMARKS[name])
+            except ImportError as e:
+                raise ImportError(f"Benchmark '{name}' is unavailable: {e}") from e
+        elif name in _entry_points():
+            _load_entry_point(name, _entry_points()[name])
+
+    if name not in _BENCHMARKS:
+        available = ", ".join(list_benchmarks()) or "(none)"
         raise KeyError(f"Unknown benchmark '{name}'. Available: {available}")
     return _BENCHMARKS[name]
 
 
 def list_benchmarks() -> list[str]:
-    """List all registered benchmark names.
+    """List all benchmark names without importing any benchmark module.
 
-    Note: Benchmarks with missing dependencies will not appear in this list.
-    Use list_unavailable_benchmarks() to see them.
+    Note: Built-in benchmarks whose third-party requirements are not installed
+    will not appear in this list. Use list_unavailable_benchmarks() to see them.
     """
-    _discover_benchmarks()
-    return sorted(_BENCHMARKS.keys())
+    from .benchmarks._manifest import BENCHMARKS
+
+    available = {name for name, module in BENCHMARKS.items() if not _missing_requirements(module)}
+    return sorted(available | set(_entry_points()) | set(_BENCHMARKS))
 
 
 def list_unavailable_benchmarks() -> dict[str, str]:
-    """List benchmark modules that failed to load due to missing dependencies.
+    """List built-in benchmark modules whose third-party requirements are not installed.
 
     Returns:
         Dict mapping module name to error message.
     """
-    _discover_benchmarks()
-    return dict(_UNAVAILABLE)
+    from .benchmarks._manifest import BENCHMARKS
+
+    unavailable = {}
+    for module in sorted(set(BENCHMARKS.values())):
+        missing = _missing_requirements(module)
+        if missing:
+            unavailable[module.rpartition(".")[2]] = f"No module named {', '.join(repr(m) for m in missing)}"
+    return unavailable
+
+
+# ---------------------------------------------------------------------------
+# Manifest generation
+# ---------------------------------------------------------------------------
+
+
+def _registered_names(tree: ast.Module) -> list[str]:
+    """String arguments of ``@register_eval("...")`` decorators in a module."""
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for decorator in node.decorator_list:
+                if (
+                    isinstance(decorator, ast.Call)
+                    and getattr(decorator.func, "id", getattr(decorator.func, "attr", None)) == "register_eval"
+                    and decorator.args
+                    and isinstance(decorator.args[0], ast.Constant)
+                ):
+                    names.append(decorator.args[0].value)
+    return names
+
+
+def _third_party_imports(tree: ast.Module) -> list[str]:
+    """Top-level third-party packages imported at module level."""
+    packages = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            packages.update(alias.name.partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            packages.add(node.module.partition(".")[0])
+    return sorted(p for p in packages if p not in sys.stdlib_module_names and p not in ("__future__", "strands_env"))
+
+
+def build_manifest() -> tuple[dict[str, str], dict[str, list[str]]]:
+    """Scan the built-in benchmark modules' source (without importing them).
+
+    Returns:
+        `(benchmarks, requirements)`: benchmark name -> module, and module -> third-party packages.
+    """
+    benchmarks: dict[str, str] = {}
+    requirements: dict[str, list[str]] = {}
+    for py_file in sorted(BENCHMARKS_DIR.glob("*.py")):
+        if py_file.stem.startswith("_"):
+            continue
+        module = f"{BENCHMARKS_PACKAGE}.{py_file.stem}"
+        tree = ast.parse(py_file.read_text(encoding="utf-8"))
+        for name in _registered_names(tree):
+            benchmarks[name] = module
+        requirements[module] = _third_party_imports(tree)
+    return dict(sorted(benchmarks.items())), requirements
+
+
+def render_manifest() -> str:
+    """Source of ``benchmarks/_manifest.py`` for the current built-in benchmark modules."""
+    benchmarks, requirements = build_manifest()
+    header = Path(__file__).read_text(encoding="utf-8").split('\n\n"""', 1)[0]
+    lines = [
+        header,
+        "",
+        '"""Generated by `python -m strands_env.eval.benchmarks`. Do not edit."""',
+        "",
+        "BENCHMARKS = {",
+        *(f'    "{name}": "{module}",' for name, module in benchmarks.items()),
+        "}",
+        "",
+        "REQUIREMENTS = {",
+        *(f'    "{module}": {reqs!r},'.replace("'", '"') for module, reqs in requirements.items()),
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
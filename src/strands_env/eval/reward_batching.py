@@ -0,0 +1,106 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-batching of reward computation across concurrently finishing samples."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from typing_extensions import override
+
+from strands_env.core.types import Action, RewardFunction, RewardResult, StepResult
+
+logger = logging.getLogger(__name__)
+
+
+class RewardBatcher(RewardFunction):
+    """Coalesce concurrent `compute` calls into `compute_batch` calls of a wrapped reward function.
+
+    A call waits until `max_batch_size` calls are pending or `max_wait` seconds have
+    passed since the first pending one, then the pending calls are computed together.
+    The `Evaluator` wraps `batched` reward functions in a `RewardBatcher` automatically.
+
+    Args:
+        reward_fn: Reward function whose `compute_batch` receives the batches.
+        max_batch_size: Flush as soon as this many calls are pending.
+        max_wait: Maximum seconds a call waits for others to join its batch.
+    """
+
+    def __init__(self, reward_fn: RewardFunction, *, max_batch_size: int = 64, max_wait: float = 0.05):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        self.reward_fn = reward_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[Action, StepResult, asyncio.Future[RewardResult]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.num_batches = 0
+        self.num_samples = 0
+
+    @override
+    async def compute(self, action: Action, step_result: StepResult) -> RewardResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[RewardResult] = loop.create_future()
+        self._pending.append((action, step_result, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    @override
+    async def compute_batch(self, pairs: Sequence[tuple[Action, StepResult]]) -> list[RewardResult]:
+        return await self.reward_fn.compute_batch(pairs)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # Callers cancelled while waiting are dropped from the batch
+        batch = [item for item in self._pending if not item[2].done()]
+        self._pending = []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Action, StepResult, asyncio.Future[RewardResult]]]) -> None:
+        self.num_batches += 1
+        self.num_samples += len(batch)
+        try:
+            results = await self.reward_fn.compute_batch([(action, step_result) for action, step_result, _ in batch])
+            if len(results) != len(batch):
+                # Otherwise the callers left without a result would wait forever
+                raise ValueError(f"compute_batch returned {len(results)} results for {len(batch)} samples")
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel() if isinstance(e, asyncio.CancelledError) else future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def metrics(self) -> dict[str, float]:
+        """Number of batches and mean batch size so far."""
+        return {
+            "reward_batches": self.num_batches,
+            "reward_batch_size_mean": self.num_samples / self.num_batches if self.num_batches else 0.0,
+        }
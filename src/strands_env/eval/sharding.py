@@ -0,0 +1,116 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Prompt-level sharding for multi-process evaluation.
+
+Each worker process runs an `Evaluator` with `shard_index`/`num_shards` set, so it
+only evaluates prompts whose id hashes to its shard and checkpoints to its own file
+(see `shard_output_path`). Once all workers finish, `merge_shards` streams the
+shard checkpoints into the final results file.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+from .storage import PackedTokenStore, ResultStore, token_sidecar_path
+
+logger = logging.getLogger(__name__)
+
+
+def shard_for(prompt_id: str, num_shards: int) -> int:
+    """Return the shard a prompt belongs to (stable across processes and runs)."""
+    return zlib.crc32(prompt_id.encode("utf-8")) % num_shards
+
+
+def shard_output_path(output_path: Path | str, shard_index: int, num_shards: int) -> Path:
+    """Return the checkpoint path for one shard, e.g. ``shards/results.001-of-004.jsonl``."""
+    output_path = Path(output_path)
+    name = f"{output_path.stem}.{shard_index:03d}-of-{num_shards:03d}{output_path.suffix}"
+    return output_path.parent / "shards" / name
+
+
+def check_merge_target(shard_stores: Sequence[ResultStore], output_store: ResultStore) -> None:
+    """Raise if `output_store` holds samples that are not in any shard (e.g. results of a non-sharded run).
+
+    A target that only holds samples of these shards (a previous merge) may be replaced.
+
+    Raises:
+        FileExistsError: If merging would discard samples found only in `output_store`.
+    """
+    existing = output_store.completed_ids()
+    if not existing:
+        return
+    for store in shard_stores:
+        existing -= store.completed_ids()
+        if not existing:
+            return
+    raise FileExistsError(
+        f"{output_store.path} holds {len(existing)} samples that are not in any shard; "
+        "move it away or merge with overwrite=True to replace it"
+    )
+
+
+def merge_shards(
+    shard_stores: Sequence[ResultStore],
+    output_store: ResultStore,
+    *,
+    overwrite: bool = False,
+    batch_size: int = 1000,
+) -> int:
+    """Merge shard checkpoints into `output_store`, replacing its contents.
+
+    Shards are streamed one after another in batches of `batch_size` samples, so memory
+    does not grow with the shard size. The merged store lists the shards in order, each
+    in its checkpoint order. Packed token sidecars (see `PackedTokenStore`) of the shards
+    are merged too.
+
+    Args:
+        shard_stores: Shard checkpoints, in shard order.
+        output_store: Store receiving the merged samples.
+        overwrite: Replace `output_store` even if it holds samples that are not in any shard.
+        batch_size: Samples appended to `output_store` per write.
+
+    Returns:
+        Number of merged samples.
+
+    Raises:
+        FileExistsError: If `output_store` holds samples that are not in any shard and `overwrite` is False.
+    """
+    if not overwrite:
+        check_merge_target(shard_stores, output_store)
+    output_store.clear()
+    total = 0
+    for store in shard_stores:
+        batch = []
+        for record in store.iter_results():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                output_store.append(batch)
+                total += len(batch)
+                batch = []
+        output_store.append(batch)
+        total += len(batch)
+    logger.info(f"Merged {total} samples from {len(shard_stores)} shards into {output_store.path}")
+
+    token_paths = [token_sidecar_path(store.path) for store in shard_stores]
+    output_tokens = PackedTokenStore(token_sidecar_path(output_store.path))
+    if any(path.exists() for path in token_paths):
+        output_tokens.merge([PackedTokenStore(path) for path in token_paths])
+    else:
+        output_tokens.clear()
+    return total
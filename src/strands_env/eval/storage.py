@@ -0,0 +1,764 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checkpoint stores for evaluation results.
+
+Two backends are provided and selected from the output path suffix by `create_result_store`:
+
+- `JsonlResultStore` (default): one JSON line per sample, append-only, with a sidecar
+  index so resume does not need to parse and validate every sample.
+- `ParquetResultStore` (``*.parquet``): a directory of Parquet part files with scalar
+  columns (reward, termination reason, metrics) stored separately from the message
+  transcript, so resume and analysis can read only the columns they need.
+  Requires ``pyarrow`` (``pip install strands-env[parquet]``).
+
+`PackedTokenStore` is an optional binary sidecar for token observations next to either backend.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Collection, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from strands_env.core import TokenArrays, TokenObservation
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .evaluator import EvalSample
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore(ABC):
+    """Abstract append-only store of `(prompt_id, EvalSample)` records."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    @abstractmethod
+    def append(self, records: Sequence[tuple[str, EvalSample]]) -> None:
+        """Durably append records to the store."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all stored records."""
+        ...
+
+    @abstractmethod
+    def iter_results(self, include_messages: bool = True) -> Iterator[tuple[str, EvalSample]]:
+        """Stream `(prompt_id, sample)` pairs, skipping duplicate sample ids.
+
+        Args:
+            include_messages: If False, samples are hydrated with empty message transcripts.
+        """
+        ...
+
+    def completed_ids(self) -> set[str]:
+        """Return the ids of all stored samples."""
+        return {sample.action.task_context.id for _, sample in self.iter_results(include_messages=False)}
+
+    def iter_rewards(self) -> Iterator[tuple[str, str, float | None]]:
+        """Stream `(prompt_id, sample_id, reward)` per stored sample, skipping duplicate sample ids."""
+        for prompt_id, sample in self.iter_results(include_messages=False):
+            reward = sample.step_result.reward
+            yield prompt_id, sample.action.task_context.id, reward.reward if reward is not None else None
+
+    def read_results(self, include_messages: bool = True) -> dict[str, list[EvalSample]]:
+        """Read all stored samples grouped by prompt_id."""
+        results: dict[str, list[EvalSample]] = defaultdict(list)
+        for prompt_id, sample in self.iter_results(include_messages=include_messages):
+            results[prompt_id].append(sample)
+        return dict(results)
+
+    def load_samples(self, sample_ids: Collection[str]) -> dict[str, list[EvalSample]]:
+        """Hydrate only the given samples, grouped by prompt_id."""
+        results: dict[str, list[EvalSample]] = defaultdict(list)
+        for prompt_id, sample in self.iter_results():
+            if sample.action.task_context.id in sample_ids:
+                results[prompt_id].append(sample)
+        return dict(results)
+
+    def repair(self) -> None:
+        """Recover from an interrupted write before appending. No-op by default."""
+        pass
+
+    def compact(self) -> None:
+        """Rewrite the store grouped by prompt with duplicates removed. No-op by default."""
+        pass
+
+
+def _sample_to_dict(prompt_id: str, sample: EvalSample) -> dict[str, Any]:
+    data = sample.model_dump()
+    data["prompt_id"] = prompt_id
+    return data
+
+
+def _sample_from_dict(data: dict[str, Any], include_messages: bool = True) -> tuple[str, EvalSample]:
+    from .evaluator import EvalSample
+
+    prompt_id = data.pop("prompt_id")
+    if not include_messages:
+        data["step_result"]["observation"]["messages"] = []
+    return prompt_id, EvalSample.model_validate(data)
+
+
+# ---------------------------------------------------------------------------
+# JSONL
+# ---------------------------------------------------------------------------
+
+
+class IndexEntry(NamedTuple):
+    """Sidecar index entry locating one sample in a JSONL checkpoint."""
+
+    sample_id: str
+    prompt_id: str
+    reward: float | None
+    offset: int
+    length: int
+
+
+class JsonlResultStore(ResultStore):
+    """Append-only JSONL store, one sample per line, with a sidecar index.
+
+    Each `append` writes only the new records and issues a single fsync. A torn
+    last line left by a crash is skipped on read and truncated by `repair`.
+
+    Next to ``results.jsonl`` a ``results.jsonl.idx`` file records
+    `(sample_id, prompt_id, reward, offset, length)` per line, so resuming only
+    reads the index and samples are hydrated on demand via `load_samples`. The
+    index is written after the data is fsynced and is always rebuildable: a
+    missing, stale or partial index is completed by scanning the data file.
+    """
+
+    def __init__(self, path: Path | str):
+        super().__init__(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self._index: list[IndexEntry] | None = None
+
+    def _iter_lines(self, start: int = 0) -> Iterator[tuple[int, int, dict]]:
+        """Yield `(byte_offset, byte_length, record)` for every complete line from `start`.
+
+        Raises:
+            ValueError: If a line other than the last one is corrupt.
+        """
+        if not self.path.exists():
+            return
+
+        offset = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("missing trailing newline")
+                    data = json.loads(line)
+                except ValueError as e:
+                    if f.read(1):
+                        raise ValueError(f"Corrupt checkpoint line at byte {offset} in {self.path}") from e
+                    logger.warning(f"Discarding torn last line at byte {offset} in {self.path}")
+                    break
+                yield offset, len(line), data
+                offset += len(line)
+
+    # -- Index ---------------------------------------------------------------
+
+    @staticmethod
+    def _make_entry(offset: int, length: int, data: dict) -> IndexEntry:
+        reward = data["step_result"].get("reward")
+        return IndexEntry(
+            sample_id=data["action"]["task_context"]["id"],
+            prompt_id=data["prompt_id"],
+            reward=reward["reward"] if reward is not None else None,
+            offset=offset,
+            length=length,
+        )
+
+    def _read_index_file(self) -> tuple[list[IndexEntry], bool]:
+        """Read index entries; the flag is False if the file had a torn or corrupt line."""
+        entries: list[IndexEntry] = []
+        if not self.index_path.exists():
+            return entries, False
+        with open(self.index_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return entries, False
+                try:
+                    entries.append(IndexEntry(*json.loads(line)))
+                except (ValueError, TypeError):
+                    return [], False
+        return entries, True
+
+    def _is_valid_entry(self, entry: IndexEntry) -> bool:
+        """Check that an entry points at the matching line of the data file."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(entry.offset)
+                line = f.read(entry.length)
+            return line.endswith(b"\n") and json.loads(line)["action"]["task_context"]["id"] == entry.sample_id
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def _write_index(self, entries: list[IndexEntry]) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(list(entry), ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.index_path)
+
+    def _sync_index(self) -> list[IndexEntry]:
+        """Load the index and bring it up to date with the data file."""
+        if not self.path.exists():
+            self.index_path.unlink(missing_ok=True)
+            return []
+
+        entries, clean = self._read_index_file()
+        if entries and not self._is_valid_entry(entries[-1]):
+            logger.warning(f"Index {self.index_path} does not match {self.path}, rebuilding")
+            entries, clean = [], False
+
+        start = entries[-1].offset + entries[-1].length if entries else 0
+        missing = [self._make_entry(offset, length, data) for offset, length, data in self._iter_lines(start)]
+        if missing or not clean:
+            entries.extend(missing)
+            self._write_index(entries)
+        return entries
+
+    @property
+    def index(self) -> list[IndexEntry]:
+        """Index entries in file order (synced with the data file on first access)."""
+        if self._index is None:
+            self._index = self._sync_index()
+        return self._index
+
+    # -- ResultStore ---------------------------------------------------------
+
+    def append(self, records: Sequence[tuple[str, EvalSample]]) -> None:
+        if not records:
+            return
+        index = self.index
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        offset = self.path.stat().st_size if self.path.exists() else 0
+
+        new_entries = []
+        with open(self.path, "ab") as f:
+            for prompt_id, sample in records:
+                line = (json.dumps(_sample_to_dict(prompt_id, sample), ensure_ascii=False) + "\n").encode("utf-8")
+                f.write(line)
+                reward = sample.step_result.reward
+                new_entries.append(
+                    IndexEntry(
+                        sample_id=sample.action.task_context.id,
+                        prompt_id=prompt_id,
+                        reward=reward.reward if reward is not None else None,
+                        offset=offset,
+                        length=len(line),
+                    )
+                )
+                offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # The index is rebuildable from the data file, so it is not fsynced
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for entry in new_entries:
+                f.write(json.dumps(list(entry), ensure_ascii=False) + "\n")
+        index.extend(new_entries)
+
+    def clear(self) -> None:
+        self.index_path.unlink(missing_ok=True)
+        self.path.unlink(missing_ok=True)
+        self._index = None
+
+    def iter_results(self, include_messages: bool = True) -> Iterator[tuple[str, EvalSample]]:
+        seen: set[str] = set()
+        for _, _, data in self._iter_lines():
+            sample_id = data["action"]["task_context"]["id"]
+            if sample_id in seen:
+                continue
+            seen.add(sample_id)
+            yield _sample_from_dict(data, include_messages=include_messages)
+
+    def completed_ids(self) -> set[str]:
+        return {entry.sample_id for entry in self.index}
+
+    def iter_rewards(self) -> Iterator[tuple[str, str, float | None]]:
+        """Read rewards from the index, without parsing samples."""
+        seen: set[str] = set()
+        for entry in self.index:
+            if entry.sample_id not in seen:
+                seen.add(entry.sample_id)
+                yield entry.prompt_id, entry.sample_id, entry.reward
+
+    def load_samples(self, sample_ids: Collection[str]) -> dict[str, list[EvalSample]]:
+        """Hydrate only the requested samples by seeking to their indexed offsets."""
+        results: dict[str, list[EvalSample]] = defaultdict(list)
+        seen: set[str] = set()
+        with open(self.path, "rb") as f:
+            for entry in self.index:
+                if entry.sample_id not in sample_ids or entry.sample_id in seen:
+                    continue
+                seen.add(entry.sample_id)
+                f.seek(entry.offset)
+                prompt_id, sample = _sample_from_dict(json.loads(f.read(entry.length)))
+                results[prompt_id].append(sample)
+        return dict(results)
+
+    def repair(self) -> None:
+        """Truncate a torn last line by scanning backwards for the last newline."""
+        if not self.path.exists():
+            return
+        size = self.path.stat().st_size
+        end = 0
+        with open(self.path, "rb") as f:
+            pos = size
+            while pos > 0:
+                chunk_start = max(0, pos - 65536)
+                f.seek(chunk_start)
+                newline = f.read(pos - chunk_start).rfind(b"\n")
+                if newline != -1:
+                    end = chunk_start + newline + 1
+                    break
+                pos = chunk_start
+        if end < size:
+            logger.warning(f"Discarding torn last line at byte {end} in {self.path}")
+            os.truncate(self.path, end)
+            self._index = None
+
+    def compact(self) -> None:
+        """Copy lines grouped by prompt into a temporary file that atomically replaces the store.
+
+        Only index entries are held in memory. The index is removed before the data
+        file is replaced and rebuilt afterwards, so it can never point at stale offsets.
+        """
+        if not self.path.exists():
+            return
+        self.repair()
+
+        by_prompt: dict[str, list[IndexEntry]] = defaultdict(list)
+        seen: set[str] = set()
+        for entry in self.index:
+            if entry.sample_id not in seen:
+                seen.add(entry.sample_id)
+                by_prompt[entry.prompt_id].append(entry)
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        new_index = []
+        offset = 0
+        with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+            for entries in by_prompt.values():
+                for entry in entries:
+                    src.seek(entry.offset)
+                    dst.write(src.read(entry.length))
+                    new_index.append(entry._replace(offset=offset))
+                    offset += entry.length
+            dst.flush()
+            os.fsync(dst.fileno())
+        self.index_path.unlink(missing_ok=True)
+        os.replace(tmp_path, self.path)
+        self._write_index(new_index)
+        self._index = new_index
+
+
+# ---------------------------------------------------------------------------
+# Parquet
+# ---------------------------------------------------------------------------
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet results require `pyarrow`. Install with `pip install strands-env[parquet]`.") from e
+    return pa, pq
+
+
+class ParquetResultStore(ResultStore):
+    """Columnar store: a directory of Parquet part files, written one per `append` and merged as they accumulate.
+
+    Columns:
+        prompt_id, sample_id: Identifiers (strings).
+        reward: Scalar reward, null if no reward function was set.
+        termination_reason: `TerminationReason` value.
+        metrics: JSON-encoded observation metrics.
+        action: JSON-encoded `Action`.
+        step_result: JSON-encoded `StepResult` without messages.
+        messages: JSON-encoded message transcript (blob column).
+
+    Part files are written to a hidden temporary file and renamed into place, so a
+    crash never leaves a partially written part behind. Each part has a merge level
+    (in its file name): once the newest `merge_factor` parts share a level, they are
+    concatenated into one part of the next level. A run with N appends thus keeps
+    O(merge_factor * log(N)) parts instead of N, and every row is rewritten only
+    about log(N) times. Merging keeps row order, so duplicate handling is unchanged.
+
+    Args:
+        path: Directory holding the part files.
+        merge_factor: Number of same-level parts merged at once. Must be >= 2.
+    """
+
+    #: Columns needed to hydrate an `EvalSample` (messages optional).
+    SAMPLE_COLUMNS = ["prompt_id", "action", "step_result"]
+
+    def __init__(self, path: Path | str, *, merge_factor: int = 10):
+        if merge_factor < 2:
+            raise ValueError(f"merge_factor must be >= 2, got {merge_factor}")
+        super().__init__(path)
+        self.merge_factor = merge_factor
+        self._pa, self._pq = _import_pyarrow()
+
+    @property
+    def schema(self) -> pa.Schema:
+        pa = self._pa
+        return pa.schema(
+            [
+                ("prompt_id", pa.string()),
+                ("sample_id", pa.string()),
+                ("reward", pa.float64()),
+                ("termination_reason", pa.string()),
+                ("metrics", pa.string()),
+                ("action", pa.string()),
+                ("step_result", pa.string()),
+                ("messages", pa.string()),
+            ]
+        )
+
+    def _part_files(self) -> list[Path]:
+        return sorted(self.path.glob("part-*.parquet")) if self.path.is_dir() else []
+
+    @staticmethod
+    def _part_level(part: Path) -> int:
+        # `part-<index>-<level>.parquet`; parts written before levels existed are level 0
+        fields = part.stem.split("-")
+        return int(fields[2]) if len(fields) > 2 else 0
+
+    def _write_part(self, table: pa.Table, level: int = 0) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        parts = self._part_files()
+        next_idx = int(parts[-1].stem.split("-")[1]) + 1 if parts else 0
+        final_path = self.path / f"part-{next_idx:05d}-{level}.parquet"
+        tmp_path = self.path / f".{final_path.name}.tmp"
+        with open(tmp_path, "wb") as f:
+            self._pq.write_table(table, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, final_path)
+
+    def append(self, records: Sequence[tuple[str, EvalSample]]) -> None:
+        if not records:
+            return
+        rows = []
+        for prompt_id, sample in records:
+            data = sample.model_dump()
+            step_result = data["step_result"]
+            messages = step_result["observation"].pop("messages")
+            reward = step_result["reward"]
+            rows.append(
+                {
+                    "prompt_id": prompt_id,
+                    "sample_id": sample.action.task_context.id,
+                    "reward": reward["reward"] if reward is not None else None,
+                    "termination_reason": sample.step_result.termination_reason.value,
+                    "metrics": json.dumps(step_result["observation"]["metrics"], ensure_ascii=False),
+                    "action": json.dumps(data["action"], ensure_ascii=False),
+                    "step_result": json.dumps(step_result, ensure_ascii=False),
+                    "messages": json.dumps(messages, ensure_ascii=False),
+                }
+            )
+        self._write_part(self._pa.Table.from_pylist(rows, schema=self.schema))
+        self._merge_parts()
+
+    def _merge_parts(self) -> None:
+        """Merge the newest parts while `merge_factor` of them share a level.
+
+        Only the newest parts are merged and the merged part is written after them,
+        so storage order is preserved. It is renamed into place before the merged
+        parts are deleted, so an interruption leaves at worst duplicate rows.
+        """
+        parts = self._part_files()
+        while len(parts) >= self.merge_factor:
+            tail = parts[-self.merge_factor :]
+            level = self._part_level(tail[0])
+            if any(self._part_level(part) != level for part in tail):
+                return
+            self._write_part(self._pa.concat_tables([self._pq.read_table(part) for part in tail]), level + 1)
+            for part in tail:
+                part.unlink()
+            parts = self._part_files()
+
+    def clear(self) -> None:
+        for part in self._part_files():
+            part.unlink()
+
+    def read_table(self, columns: list[str] | None = None) -> pa.Table:
+        """Read the given columns across all part files (for analysis)."""
+        parts = self._part_files()
+        if not parts:
+            return self.schema.empty_table().select(columns) if columns else self.schema.empty_table()
+        return self._pa.concat_tables([self._pq.read_table(p, columns=columns) for p in parts])
+
+    def completed_ids(self) -> set[str]:
+        return set(self.read_table(columns=["sample_id"]).column("sample_id").to_pylist())
+
+    def iter_rewards(self) -> Iterator[tuple[str, str, float | None]]:
+        """Read only the id and reward columns."""
+        table = self.read_table(columns=["prompt_id", "sample_id", "reward"])
+        seen: set[str] = set()
+        for row in table.to_pylist():
+            if row["sample_id"] not in seen:
+                seen.add(row["sample_id"])
+                yield row["prompt_id"], row["sample_id"], row["reward"]
+
+    def iter_results(self, include_messages: bool = True) -> Iterator[tuple[str, EvalSample]]:
+        from .evaluator import EvalSample
+
+        columns = ["sample_id", *self.SAMPLE_COLUMNS] + (["messages"] if include_messages else [])
+        seen: set[str] = set()
+        for part in self._part_files():
+            for row in self._pq.read_table(part, columns=columns).to_pylist():
+                if row["sample_id"] in seen:
+                    continue
+                seen.add(row["sample_id"])
+                step_result = json.loads(row["step_result"])
+                step_result["observation"]["messages"] = json.loads(row["messages"]) if include_messages else []
+                sample = EvalSample.model_validate({"action": json.loads(row["action"]), "step_result": step_result})
+                yield row["prompt_id"], sample
+
+    def compact(self) -> None:
+        """Merge all parts into one, grouped by prompt with duplicates removed.
+
+        The merged part is renamed into place before old parts are deleted, so an
+        interruption leaves at worst duplicate rows (which readers skip).
+        """
+        parts = self._part_files()
+        if len(parts) == 0:
+            return
+        table = self.read_table()
+        seen: set[str] = set()
+        indices_by_prompt: dict[str, list[int]] = defaultdict(list)
+        for i, (prompt_id, sample_id) in enumerate(
+            zip(table.column("prompt_id").to_pylist(), table.column("sample_id").to_pylist())
+        ):
+            if sample_id not in seen:
+                seen.add(sample_id)
+                indices_by_prompt[prompt_id].append(i)
+        order = [i for indices in indices_by_prompt.values() for i in indices]
+        self._write_part(table.take(order), max(self._part_level(part) for part in parts))
+        for part in parts:
+            part.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Packed tokens
+# ---------------------------------------------------------------------------
+
+
+class TokenIndexEntry(NamedTuple):
+    """Location of one sample's tokens in the packed arrays (in tokens, not bytes)."""
+
+    sample_id: str
+    offset: int
+    length: int
+    prompt_length: int
+
+
+def token_sidecar_path(results_path: Path | str) -> Path:
+    """Return the packed token directory next to a results store, e.g. ``results.jsonl.tokens``."""
+    results_path = Path(results_path)
+    return results_path.with_name(results_path.name + ".tokens")
+
+
+class PackedTokenStore:
+    """Append-only binary sidecar holding `TokenObservation` data, keyed by sample id.
+
+    Token ids, loss masks and logprobs of all samples are concatenated into three
+    flat files of `int32`, `int8` and `float32` values (NaN for missing logprobs),
+    read back as memory maps, so a trainer can stream rollouts without parsing JSON.
+    ``index.jsonl`` records `(sample_id, offset, length, prompt_length)` per sample.
+
+    The arrays are fsynced before the index, and an index line is the commit
+    record for a sample: array data past the last indexed sample (from an
+    interrupted write) is truncated by `repair`. If a sample id is stored more
+    than once (re-run after a crash), the last entry wins.
+    """
+
+    ARRAYS = {"token_ids": np.int32, "loss_mask": np.int8, "logprobs": np.float32}
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.index_path = self.path / "index.jsonl"
+        self._index: dict[str, TokenIndexEntry] | None = None
+        self._end = 0
+        self._maps: dict[str, np.ndarray] | None = None
+        self._repaired = False
+
+    def _array_path(self, name: str) -> Path:
+        return self.path / f"{name}.bin"
+
+    def _read_index(self) -> None:
+        self._index, self._end = {}, 0
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Discarding torn last line in {self.index_path}")
+                    break
+                entry = TokenIndexEntry(*json.loads(line))
+                self._index[entry.sample_id] = entry
+                self._end = max(self._end, entry.offset + entry.length)
+
+    @property
+    def index(self) -> dict[str, TokenIndexEntry]:
+        """Latest index entry per sample id."""
+        if self._index is None:
+            self._read_index()
+        return self._index
+
+    def repair(self) -> None:
+        """Truncate a torn index line and array data past the last indexed sample."""
+        if self.index_path.exists():
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            if data and not data.endswith(b"\n"):
+                os.truncate(self.index_path, data.rfind(b"\n") + 1)
+        self._read_index()
+        for name, dtype in self.ARRAYS.items():
+            path = self._array_path(name)
+            size = self._end * np.dtype(dtype).itemsize
+            if path.exists() and path.stat().st_size > size:
+                os.truncate(path, size)
+        self._maps = None
+        self._repaired = True
+
+    def append(self, items: Sequence[tuple[str, TokenObservation]]) -> None:
+        """Durably append the tokens of `(sample_id, tokens)` pairs."""
+        self._append_arrays([(sample_id, TokenArrays.from_token_observation(tokens)) for sample_id, tokens in items])
+
+    def _append_arrays(self, items: Sequence[tuple[str, TokenArrays]]) -> None:
+        if not items:
+            return
+        if not self._repaired:
+            # First write from this process: drop leftovers of an interrupted write, which a
+            # plain index read (e.g. by `get` on resume) leaves in place
+            self.repair()
+        self.path.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            with open(self._array_path(name), "ab") as f:
+                for _, arrays in items:
+                    f.write(np.ascontiguousarray(getattr(arrays, name)).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        entries = []
+        for sample_id, arrays in items:
+            entries.append(TokenIndexEntry(sample_id, self._end, len(arrays), arrays.prompt_length))
+            self._end += len(arrays)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(list(entry), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.index.update((entry.sample_id, entry) for entry in entries)
+        self._maps = None  # Memory maps have a fixed size; reopen to see the new data
+
+    def extract(self, records: Sequence[tuple[str, EvalSample]]) -> list[tuple[str, EvalSample]]:
+        """Append the tokens of `records` and return copies of the records without tokens."""
+        self.append(
+            [
+                (sample.action.task_context.id, sample.step_result.observation.tokens)
+                for _, sample in records
+                if sample.step_result.observation.tokens is not None
+            ]
+        )
+        stripped = []
+        for prompt_id, sample in records:
+            observation = sample.step_result.observation.model_copy(update={"tokens": None})
+            step_result = sample.step_result.model_copy(update={"observation": observation})
+            stripped.append((prompt_id, sample.model_copy(update={"step_result": step_result})))
+        return stripped
+
+    def _memory_maps(self) -> dict[str, np.ndarray]:
+        if self._maps is None:
+            self._maps = {
+                name: np.memmap(self._array_path(name), dtype=dtype, mode="r", shape=(self._end,))
+                if self._end
+                else np.empty(0, dtype=dtype)
+                for name, dtype in self.ARRAYS.items()
+            }
+        return self._maps
+
+    def _load(self, entry: TokenIndexEntry) -> TokenArrays:
+        maps = self._memory_maps()
+        window = slice(entry.offset, entry.offset + entry.length)
+        return TokenArrays(
+            token_ids=maps["token_ids"][window],
+            prompt_length=entry.prompt_length,
+            loss_mask=maps["loss_mask"][window],
+            logprobs=maps["logprobs"][window],
+        )
+
+    def get(self, sample_id: str) -> TokenArrays | None:
+        """Memory-mapped tokens of one sample, or None if it has none stored."""
+        entry = self.index.get(sample_id)
+        return self._load(entry) if entry is not None else None
+
+    def iter_arrays(self) -> Iterator[tuple[str, TokenArrays]]:
+        """Stream `(sample_id, TokenArrays)` in storage order; arrays are memory-mapped views."""
+        for entry in sorted(self.index.values(), key=lambda e: e.offset):
+            yield entry.sample_id, self._load(entry)
+
+    def clear(self) -> None:
+        self.index_path.unlink(missing_ok=True)
+        for name in self.ARRAYS:
+            self._array_path(name).unlink(missing_ok=True)
+        self._index, self._end, self._maps = None, 0, None
+
+    def merge(self, sources: Sequence[PackedTokenStore], batch_size: int = 1000) -> int:
+        """Replace this store's contents with the samples of `sources`, in order.
+
+        Returns:
+            Number of merged samples.
+        """
+        self.clear()
+        total = 0
+        for source in sources:
+            batch: list[tuple[str, TokenArrays]] = []
+            for item in source.iter_arrays():
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self._append_arrays(batch)
+                    total += len(batch)
+                    batch = []
+            self._append_arrays(batch)
+            total += len(batch)
+        return total
+
+
+def create_result_store(path: Path | str) -> ResultStore:
+    """Create the result store matching the path suffix (``.parquet`` or JSONL)."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return ParquetResultStore(path)
+    return JsonlResultStore(path)
@@ -16,15 +16,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import json
 import logging
+import random
+import time
 from abc import abstractmethod
+from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 from strands import Agent
 from strands.models import Model
+from strands.types.exceptions import ModelThrottledException
 from typing_extensions import override
 
 from strands_env.core.types import Action, RewardFunction, RewardResult, StepResult
+from strands_env.utils.cache import MISSING, LRUCache, SQLiteCache
+from strands_env.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +50,36 @@ class LLMJudgeReward(RewardFunction):
     the parsed Pydantic model to `get_reward`. When `None`, passes
     the raw text response instead.
 
+    With ``cache_size > 0`` or a ``cache_path``, judgments are cached by content: a
+    judge prompt that is byte-identical to an earlier one (same judge model id,
+    system prompt and `judgment_format` schema) reuses its judgment instead of
+    sampling the judge again, and concurrent identical prompts share a single
+    judge call. Caching is off by default, since a stochastic judge then gives
+    repeated samples one verdict. Failed judge calls are not cached.
+    `info["judge_cache"]` records ``"hit"``, ``"disk_hit"``, ``"coalesced"`` or
+    ``"miss"``; `cache_stats` reports totals.
+
+    Judge calls share one `judge_model`, so they can be limited: at most
+    `max_concurrency` calls in flight, `requests_per_minute` calls and
+    `tokens_per_minute` prompt tokens (see `estimate_tokens`) per minute. A call
+    that raises one of `retryable_exceptions` (throttling by default) is retried
+    after a jittered exponential backoff. Results of samples that called the judge,
+    or shared a coalesced call, report ``info["judge_queue_time"]`` (seconds spent
+    waiting for the limits) and ``info["judge_retries"]``; `limit_stats` reports totals.
+
     Args:
         judge_model: The model to use for judging.
         system_prompt: Optional system prompt for the judge.
         default_reward: Reward to return if the judge fails.
+        cache_size: Maximum judgments kept in memory. With ``cache_size=0`` (default) and
+            no ``cache_path``, every sample invokes the judge.
+        cache_path: Optional SQLite file that persists judgments across runs and processes.
+        max_concurrency: Maximum concurrent judge calls. `None` means unlimited.
+        requests_per_minute: Maximum judge calls started per minute. `None` means unlimited.
+        tokens_per_minute: Maximum estimated prompt tokens sent per minute. `None` means unlimited.
+        max_retries: Retries of a throttled judge call before it fails into `default_reward`.
+        retry_base_delay: Backoff before the first retry; doubles per retry, with full jitter.
+        retry_max_delay: Upper bound on the backoff between retries.
 
     Example (structured output)::
 
@@ -71,16 +108,42 @@ class LLMJudgeReward(RewardFunction):
     #: Pydantic model for structured output. Subclasses override to enable structured output.
     judgment_format: type[BaseModel] | None = None
 
+    #: Exceptions from `invoke_judge` that are retried with backoff.
+    retryable_exceptions: tuple[type[Exception], ...] = (ModelThrottledException,)
+
     def __init__(
         self,
         judge_model: Model,
         *,
         system_prompt: str | None = None,
         default_reward: float = 0.0,
+        cache_size: int = 0,
+        cache_path: Path | str | None = None,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
     ) -> None:
         self.judge_model = judge_model
         self.system_prompt = system_prompt
         self.default_reward = default_reward
+        self.cache: LRUCache[str, Any] = LRUCache(cache_size)
+        self.disk_cache = SQLiteCache(cache_path) if cache_path is not None else None
+        self.coalesced = 0
+        # In-flight judge calls (and their call stats) by cache key, awaited by concurrent identical requests
+        self._inflight: dict[str, tuple[asyncio.Task, dict[str, Any]]] = {}
+
+        self._slots = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        self.request_bucket = TokenBucket.per_minute(requests_per_minute) if requests_per_minute is not None else None
+        self.token_bucket = TokenBucket.per_minute(tokens_per_minute) if tokens_per_minute is not None else None
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.attempts = 0
+        self.retries = 0
+        self.queue_time = 0.0
 
     @abstractmethod
     async def get_judge_prompt(self, action: Action, step_result: StepResult) -> str:
@@ -100,19 +163,14 @@ class LLMJudgeReward(RewardFunction):
             logger.error(f"Judge prompt rendering failed: {e}")
             return RewardResult(reward=self.default_reward, info={"reason": "prompt_error", "error": str(e)})
 
-        agent = Agent(model=self.judge_model, system_prompt=self.system_prompt, tools=[])
-
+        # Queueing and retry metrics, filled in if this sample calls the judge
+        call_stats: dict[str, Any] = {}
         try:
-            if self.judgment_format is not None:
-                judgment: BaseModel | str = await agent.structured_output_async(
-                    output_model=self.judgment_format, prompt=prompt
-                )
-            else:
-                result = await agent.invoke_async(prompt)
-                judgment = result.message.get("content", [{}])[0].get("text", "")
+            judgment, cache_status = await self._get_judgment(prompt, call_stats)
         except Exception as e:
             logger.error(f"Judge model invocation failed: {e}")
-            return RewardResult(reward=self.default_reward, info={"reason": "judge_error", "error": str(e)})
+            info = {"reason": "judge_error", "error": str(e), **call_stats}
+            return RewardResult(reward=self.default_reward, info=info)
 
         try:
             reward = await self.get_reward(judgment)
@@ -120,6 +178,148 @@ class LLMJudgeReward(RewardFunction):
             logger.error(f"Reward computation for judgment failed: {e}")
             return RewardResult(reward=self.default_reward, info={"reason": "reward_error", "error": str(e)})
 
-        if isinstance(judgment, BaseModel):
-            return RewardResult(reward=reward, info={"judgment": judgment.model_dump()})
-        return RewardResult(reward=reward, info={"judgment": judgment})
+        info: dict[str, Any] = {"judgment": judgment.model_dump() if isinstance(judgment, BaseModel) else judgment}
+        if cache_status is not None:
+            info["judge_cache"] = cache_status
+        info.update(call_stats)
+        return RewardResult(reward=reward, info=info)
+
+    async def invoke_judge(self, prompt: str) -> BaseModel | str:
+        """Invoke the judge model on `prompt` and return its (structured or text) judgment."""
+        agent = Agent(model=self.judge_model, system_prompt=self.system_prompt, tools=[])
+        if self.judgment_format is not None:
+            return await agent.structured_output_async(output_model=self.judgment_format, prompt=prompt)
+        result = await agent.invoke_async(prompt)
+        return result.message.get("content", [{}])[0].get("text", "")
+
+    def estimate_tokens(self, prompt: str) -> int:
+        """Tokens charged against `tokens_per_minute` for a judge call on `prompt`.
+
+        Roughly 4 characters per token of system prompt and prompt. Override to use
+        the judge's tokenizer or to account for output tokens.
+        """
+        return (len(self.system_prompt or "") + len(prompt)) // 4 + 1
+
+    # -----------------------------------------------------------------------
+    # Concurrency, rate limits and retries
+    # -----------------------------------------------------------------------
+
+    async def _call_judge(self, prompt: str, stats: dict[str, Any]) -> BaseModel | str:
+        """Invoke the judge within the concurrency and rate limits, retrying throttled calls."""
+        stats.update(judge_queue_time=0.0, judge_retries=0)
+        tokens = self.estimate_tokens(prompt) if self.token_bucket is not None else 0
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            async with self._slots or contextlib.nullcontext():
+                if self.request_bucket is not None:
+                    await self.request_bucket.acquire()
+                if self.token_bucket is not None:
+                    await self.token_bucket.acquire(tokens)
+                waited = time.monotonic() - start
+                stats["judge_queue_time"] += waited
+                self.queue_time += waited
+                self.attempts += 1
+                try:
+                    return await self.invoke_judge(prompt)
+                except self.retryable_exceptions as e:
+                    if attempt == self.max_retries:
+                        raise
+                    error = e
+            # Back off outside the concurrency slot (full jitter)
+            delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt))
+            logger.warning(f"Judge call throttled ({error}); retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+            stats["judge_retries"] += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def limit_stats(self) -> dict[str, int | float]:
+        """Judge call attempts, retries and mean seconds an attempt waited for the limits."""
+        return {
+            "judge_attempts": self.attempts,
+            "judge_retries": self.retries,
+            "judge_queue_time_mean": self.queue_time / self.attempts if self.attempts else 0.0,
+        }
+
+    # -----------------------------------------------------------------------
+    # Judgment cache
+    # -----------------------------------------------------------------------
+
+    @property
+    def caching(self) -> bool:
+        """Whether judgments are cached and identical concurrent requests coalesced."""
+        return self.cache.maxsize > 0 or self.disk_cache is not None
+
+    def cache_key(self, prompt: str) -> str:
+        """Content address of a judge request: judge model id, system prompt, prompt and judgment schema."""
+        config = self.judge_model.get_config() if hasattr(self.judge_model, "get_config") else None
+        model_id = config.get("model_id") if isinstance(config, dict) else None
+        schema = self.judgment_format.model_json_schema() if self.judgment_format is not None else None
+        payload = json.dumps(
+            [model_id or type(self.judge_model).__name__, self.system_prompt, prompt, schema], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _get_judgment(self, prompt: str, stats: dict[str, Any]) -> tuple[BaseModel | str, str | None]:
+        """Return the judgment for `prompt` and its cache status (`None` if caching is disabled).
+
+        Queueing and retry metrics are written to `stats` if this request calls the judge.
+        """
+        if not self.caching:
+            return await self._call_judge(prompt, stats), None
+
+        key = self.cache_key(prompt)
+        value = self.cache.get(key)
+        if value is not MISSING:
+            return self._load_judgment(value), "hit"
+        if self.disk_cache is not None:
+            value = self.disk_cache.get(key)
+            if value is not MISSING:
+                self.cache.put(key, value)
+                return self._load_judgment(value), "disk_hit"
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.ensure_future(self._judge_and_store(key, prompt, stats))
+            self._inflight[key] = (task, stats)
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            status = "miss"
+        else:
+            task, call_stats = inflight
+            self.coalesced += 1
+            status = "coalesced"
+        try:
+            # Shielded so that a cancelled caller does not cancel the call others are waiting on
+            return self._load_judgment(await asyncio.shield(task)), status
+        finally:
+            if status == "coalesced":
+                # Report the queueing and retries of the shared call
+                stats.update(call_stats)
+
+    async def _judge_and_store(self, key: str, prompt: str, stats: dict[str, Any]) -> Any:
+        judgment = await self._call_judge(prompt, stats)
+        value = judgment.model_dump(mode="json") if isinstance(judgment, BaseModel) else judgment
+        self.cache.put(key, value)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, value)
+        return value
+
+    def _load_judgment(self, value: Any) -> BaseModel | str:
+        if self.judgment_format is not None and isinstance(value, dict):
+            return self.judgment_format.model_validate(value)
+        return value
+
+    def cache_stats(self) -> dict[str, int | float]:
+        """Judge cache hits (memory and disk), coalesced requests and judge calls."""
+        disk_hits = self.disk_cache.hits if self.disk_cache is not None else 0
+        # Every lookup that missed memory and disk either coalesced or called the judge
+        misses = (self.disk_cache.misses if self.disk_cache is not None else self.cache.misses) - self.coalesced
+        requests = self.cache.hits + disk_hits + self.coalesced + misses
+        return {
+            "judge_cache_hits": self.cache.hits,
+            "judge_cache_disk_hits": disk_hits,
+            "judge_coalesced": self.coalesced,
+            "judge_calls": misses,
+            "judge_cache_hit_rate": (requests - misses) / requests if requests else 0.0,
+        }
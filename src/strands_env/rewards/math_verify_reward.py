@@ -21,13 +21,17 @@ via SymPy (handling fractions, sets, nested expressions, etc.).
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Sequence
 
 from math_verify import ExprExtractionConfig, LatexExtractionConfig, parse, verify
 from math_verify.errors import TimeoutException as MathVerifyTimeout
 from typing_extensions import override
 
 from strands_env.core.types import Action, RewardFunction, RewardResult, StepResult
+from strands_env.utils.cache import MISSING, LRUCache
+from strands_env.utils.process_pool import WorkerCrashedError, WorkerPool, WorkerPoolFullError
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,85 @@ _EXTRACTION_CONFIG = (LatexExtractionConfig(), ExprExtractionConfig())
 # so we need to catch both to handle all math_verify errors.
 _MATH_VERIFY_ERRORS = (Exception, MathVerifyTimeout)
 
+# Parsed ground truths of this process (the event loop's, or a pool worker's), keyed by
+# `(ground_truth, parse_timeout)`. `None` marks a ground truth that failed to parse.
+GOLD_CACHE_SIZE = 4096
+_GOLD_CACHE: LRUCache[tuple[str, int], list | None] = LRUCache(GOLD_CACHE_SIZE)
+
+
+def _parse(text: str, parse_timeout: int) -> list:
+    """Parse text into math expressions. Raises on error or timeout."""
+    return parse(
+        text,
+        extraction_config=_EXTRACTION_CONFIG,
+        parsing_timeout=parse_timeout,
+        raise_on_error=True,
+    )
+
+
+def _score(
+    ground_truth: str,
+    content: str,
+    *,
+    float_rounding: int,
+    parse_timeout: int,
+    verify_timeout: int,
+    answer_tail_chars: int,
+    cache_gold: bool,
+) -> tuple[RewardResult, bool]:
+    """Parse and verify `content` against `ground_truth` (runs inline or in a worker process).
+
+    Returns the result and whether the parsed ground truth came from the cache.
+    """
+    # Parse ground truth (once per process if `cache_gold`)
+    gold = _GOLD_CACHE.get((ground_truth, parse_timeout)) if cache_gold else MISSING
+    gold_cached = gold is not MISSING
+    if not gold_cached:
+        try:
+            gold = _parse(ground_truth, parse_timeout)
+        except _MATH_VERIFY_ERRORS as e:
+            logger.error(f"Failed to parse ground truth: {type(e).__name__}: {ground_truth[:100]}")
+            gold = None
+        if cache_gold:
+            _GOLD_CACHE.put((ground_truth, parse_timeout), gold)
+    if not gold:
+        return RewardResult(reward=0.0, info={"reason": "gold_parse_failed", "ground_truth": ground_truth}), gold_cached
+
+    # Parse model answer (only tail to avoid parsing long chain-of-thought)
+    answer_text = content[-answer_tail_chars:] if answer_tail_chars else content
+    try:
+        answer = _parse(answer_text, parse_timeout)
+    except _MATH_VERIFY_ERRORS as e:
+        logger.error(f"Failed to parse answer: {type(e).__name__}: {answer_text[:100]}...")
+        return RewardResult(reward=0.0, info={"reason": "answer_parse_failed", "response": content}), gold_cached
+    if not answer:
+        return RewardResult(reward=0.0, info={"reason": "answer_parse_failed", "response": content}), gold_cached
+
+    # Verify equivalence
+    try:
+        matched = verify(gold, answer, float_rounding=float_rounding, timeout_seconds=verify_timeout)
+    except _MATH_VERIFY_ERRORS as e:
+        logger.error(f"Failed to verify: {type(e).__name__}")
+        matched = False
+
+    return RewardResult(
+        reward=1.0 if matched else 0.0,
+        info={
+            "matched": matched,
+            "gold_parsed": [str(g) for g in gold],
+            "answer_parsed": [str(a) for a in answer],
+            "ground_truth": ground_truth,
+        },
+    ), gold_cached
+
+
+def _with_response(result: RewardResult, content: str) -> RewardResult:
+    """Copy a (possibly cached) result, setting this sample's full response where reported."""
+    result = result.model_copy(deep=True)
+    if "response" in result.info:
+        result.info["response"] = content
+    return result
+
 
 class MathVerifyReward(RewardFunction):
     """Reward 1.0 if the model's ``\\boxed{}`` answer is mathematically equivalent to ground truth.
@@ -59,6 +142,18 @@ class MathVerifyReward(RewardFunction):
     ``\\boxed{}`` in the response), ``verify`` returns True if **any**
     gold-target pair matches (Cartesian product).
 
+    By default parsing and verification run inline, blocking the event loop for
+    up to ``parse_timeout`` + ``verify_timeout`` seconds per sample. With
+    ``num_workers > 0`` they run in a `WorkerPool` of separate processes: the
+    event loop stays free, a sample exceeding ``task_timeout`` gets its worker
+    killed (reward 0, reason ``"timeout"``), and workers are replaced after
+    ``max_tasks_per_worker`` samples. Share one instance across environments so
+    they share the pool, and call `aclose` (or `close` outside the event loop) when done.
+
+    Parsed ground truths are cached per process (inline, or in each worker), and
+    outcomes are cached per ``(ground_truth, answer tail)`` pair, so the cost scales
+    with distinct answers rather than samples. `cache_stats` reports hit rates.
+
     Args:
         float_rounding: Decimal places for float comparison (default 6).
         parse_timeout: Max seconds for parsing expressions from text (default 5).
@@ -66,28 +161,50 @@ class MathVerifyReward(RewardFunction):
         answer_tail_chars: Only parse the last N chars of model response (default 500).
             Set to 0 to parse full response. The final ``\\boxed{}`` answer is typically
             at the end, so this avoids parsing long chain-of-thought reasoning.
+        num_workers: Worker processes for parsing and verification; 0 (default) runs inline.
+        task_timeout: Hard limit in seconds per sample in a worker. Defaults to
+            ``2 * parse_timeout + verify_timeout + 5``.
+        max_tasks_per_worker: Replace a worker after this many samples (default 1000).
+        max_pending: Maximum samples waiting for a worker; beyond it samples get reward 0
+            with reason ``"verifier_busy"``. `None` (default) queues without bound.
+        cache_gold: Cache parsed ground truths (default True).
+        verify_cache_size: Maximum cached outcomes (default 10000); 0 disables the outcome cache.
     """
 
+    batched = True
+
     def __init__(
         self,
         float_rounding: int = 6,
         parse_timeout: int = 5,
         verify_timeout: int = 5,
         answer_tail_chars: int = 500,
+        num_workers: int = 0,
+        task_timeout: float | None = None,
+        max_tasks_per_worker: int | None = 1000,
+        max_pending: int | None = None,
+        cache_gold: bool = True,
+        verify_cache_size: int = 10_000,
     ) -> None:
         self.float_rounding = float_rounding
         self.parse_timeout = parse_timeout
         self.verify_timeout = verify_timeout
         self.answer_tail_chars = answer_tail_chars
+        self.num_workers = num_workers
+        self.task_timeout = task_timeout if task_timeout is not None else 2 * parse_timeout + verify_timeout + 5
+        self.pool = (
+            WorkerPool(num_workers, max_tasks_per_worker=max_tasks_per_worker, max_pending=max_pending)
+            if num_workers > 0
+            else None
+        )
+        self.cache_gold = cache_gold
+        self.verify_cache: LRUCache[tuple[str, str], RewardResult] = LRUCache(verify_cache_size)
+        self.gold_cache_hits = 0
+        self.gold_cache_misses = 0
 
     def _parse(self, text: str) -> list:
         """Parse text into math expressions. Raises on error or timeout."""
-        return parse(
-            text,
-            extraction_config=_EXTRACTION_CONFIG,
-            parsing_timeout=self.parse_timeout,
-            raise_on_error=True,
-        )
+        return _parse(text, self.parse_timeout)
 
     @override
     async def compute(self, action: Action, step_result: StepResult) -> RewardResult:
@@ -99,38 +216,83 @@ class MathVerifyReward(RewardFunction):
         if content is None:
             return RewardResult(reward=0.0, info={"reason": "no_final_response"})
 
-        # Parse ground truth
-        try:
-            gold = self._parse(ground_truth)
-        except _MATH_VERIFY_ERRORS as e:
-            logger.error(f"Failed to parse ground truth: {type(e).__name__}: {ground_truth[:100]}")
-            return RewardResult(reward=0.0, info={"reason": "gold_parse_failed", "ground_truth": ground_truth})
-        if not gold:
-            return RewardResult(reward=0.0, info={"reason": "gold_parse_failed", "ground_truth": ground_truth})
+        # Samples with the same answer tail get the same outcome
+        key = (ground_truth, content[-self.answer_tail_chars :] if self.answer_tail_chars else content)
+        cached = self.verify_cache.get(key)
+        if cached is not MISSING:
+            return _with_response(cached, content)
 
-        # Parse model answer (only tail to avoid parsing long chain-of-thought)
-        answer_text = content[-self.answer_tail_chars :] if self.answer_tail_chars else content
-        try:
-            answer = self._parse(answer_text)
-        except _MATH_VERIFY_ERRORS as e:
-            logger.error(f"Failed to parse answer: {type(e).__name__}: {answer_text[:100]}...")
-            return RewardResult(reward=0.0, info={"reason": "answer_parse_failed", "response": content})
-        if not answer:
-            return RewardResult(reward=0.0, info={"reason": "answer_parse_failed", "response": content})
-
-        # Verify equivalence
-        try:
-            matched = verify(gold, answer, float_rounding=self.float_rounding, timeout_seconds=self.verify_timeout)
-        except _MATH_VERIFY_ERRORS as e:
-            logger.error(f"Failed to verify: {type(e).__name__}")
-            matched = False
-
-        return RewardResult(
-            reward=1.0 if matched else 0.0,
-            info={
-                "matched": matched,
-                "gold_parsed": [str(g) for g in gold],
-                "answer_parsed": [str(a) for a in answer],
-                "ground_truth": ground_truth,
-            },
+        score_kwargs = dict(
+            float_rounding=self.float_rounding,
+            parse_timeout=self.parse_timeout,
+            verify_timeout=self.verify_timeout,
+            answer_tail_chars=self.answer_tail_chars,
+            cache_gold=self.cache_gold,
         )
+        if self.pool is None:
+            result, gold_cached = _score(ground_truth, content, **score_kwargs)
+        else:
+            try:
+                result, gold_cached = await self.pool.run(
+                    _score, ground_truth, content, timeout=self.task_timeout, **score_kwargs
+                )
+            except TimeoutError:
+                logger.error(f"Verification exceeded {self.task_timeout}s: {ground_truth[:100]}")
+                return RewardResult(reward=0.0, info={"reason": "timeout", "ground_truth": ground_truth})
+            except WorkerPoolFullError:
+                return RewardResult(reward=0.0, info={"reason": "verifier_busy", "ground_truth": ground_truth})
+            except WorkerCrashedError as e:
+                logger.error(f"Verification worker crashed: {e}")
+                info = {"reason": "worker_crashed", "error": str(e), "ground_truth": ground_truth}
+                return RewardResult(reward=0.0, info=info)
+
+        if gold_cached:
+            self.gold_cache_hits += 1
+        else:
+            self.gold_cache_misses += 1
+        self.verify_cache.put(key, result)
+        return _with_response(result, content)
+
+    @override
+    async def compute_batch(self, pairs: Sequence[tuple[Action, StepResult]]) -> list[RewardResult]:
+        """Score one sample per distinct ``(ground_truth, answer tail)`` first; the rest then hit the outcome cache."""
+        seen: set[tuple[str, str]] = set()
+        first, rest = [], []
+        for i, (action, step_result) in enumerate(pairs):
+            ground_truth = action.task_context.ground_truth
+            content = step_result.observation.final_response
+            if not isinstance(ground_truth, str) or content is None:
+                first.append(i)
+                continue
+            key = (ground_truth, content[-self.answer_tail_chars :] if self.answer_tail_chars else content)
+            (rest if key in seen else first).append(i)
+            seen.add(key)
+
+        results: list[RewardResult | None] = [None] * len(pairs)
+        for indices in (first, rest):
+            outcomes = await asyncio.gather(*(self.compute(*pairs[i]) for i in indices))
+            for i, outcome in zip(indices, outcomes):
+                results[i] = outcome
+        return results
+
+    def cache_stats(self) -> dict[str, int | float]:
+        """Hit counts and rates of the ground-truth parse cache and the outcome cache."""
+        gold_lookups = self.gold_cache_hits + self.gold_cache_misses
+        return {
+            "gold_cache_hits": self.gold_cache_hits,
+            "gold_cache_misses": self.gold_cache_misses,
+            "gold_cache_hit_rate": self.gold_cache_hits / gold_lookups if gold_lookups else 0.0,
+            "verify_cache_hits": self.verify_cache.hits,
+            "verify_cache_misses": self.verify_cache.misses,
+            "verify_cache_hit_rate": self.verify_cache.hit_rate,
+        }
+
+    async def aclose(self) -> None:
+        """Stop the worker processes, if any, without blocking the event loop."""
+        if self.pool is not None:
+            await self.pool.aclose()
+
+    def close(self) -> None:
+        """Stop the worker processes, if any. Use `aclose` from async code."""
+        if self.pool is not None:
+            self.pool.close()
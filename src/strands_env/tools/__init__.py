@@ -14,12 +14,36 @@
 
 """Tools for `strands_env`."""
 
-from .code_interpreter import CodeInterpreterToolkit
-from .web_scraper import WebScraperToolkit
-from .web_search import WebSearchToolkit
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .code_interpreter import CodeInterpreterToolkit
+    from .web_scraper import WebScraperToolkit
+    from .web_search import WebSearchToolkit
+
+# Toolkits are loaded on first access (PEP 562), so using one does not import the
+# dependencies of the others (e.g. trafilatura and tiktoken for `WebScraperToolkit`).
+_LAZY = {
+    "CodeInterpreterToolkit": ".code_interpreter",
+    "WebScraperToolkit": ".web_scraper",
+    "WebSearchToolkit": ".web_search",
+}
 
 __all__ = [
     "CodeInterpreterToolkit",
     "WebScraperToolkit",
     "WebSearchToolkit",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,247 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio-facing process pool with hard per-task timeouts for CPU-bound work.
+
+Unlike `concurrent.futures.ProcessPoolExecutor`, a task that exceeds its timeout
+kills the worker running it (and a replacement is started), so a runaway
+computation cannot keep a worker busy or hold on to its memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any
+
+
+class WorkerPoolFullError(RuntimeError):
+    """Raised when a task is submitted while `max_pending` tasks are already waiting for a worker."""
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when the worker running a task died (e.g. segfault or OOM kill) before returning a result."""
+
+
+def _worker_main(conn: Connection) -> None:
+    """Worker loop: run `(fn, args, kwargs)` requests until a `None` sentinel or EOF."""
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if request is None:
+            return
+        fn, args, kwargs = request
+        try:
+            response = (True, fn(*args, **kwargs))
+        except BaseException as e:  # Includes timeouts that derive from BaseException
+            response = (False, e)
+        try:
+            conn.send(response)
+        except Exception as e:  # Unpicklable result or exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def _signal_stop(self, kill: bool) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                self.process.kill()
+
+    def stop(self, *, kill: bool = False) -> None:
+        """Stop the process, blocking up to a second before killing it. For use outside the event loop."""
+        self._signal_stop(kill)
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    async def stop_async(self, *, kill: bool = False, grace: float = 1.0) -> None:
+        """Like `stop`, but polls `is_alive()` so the event loop is never blocked on a join."""
+        self._signal_stop(kill)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + grace
+        while self.process.is_alive():
+            if loop.time() >= deadline:
+                self.process.kill()
+            await asyncio.sleep(0.01)
+        self.process.join()  # Already exited: only reaps it
+        self.conn.close()
+
+
+class WorkerPool:
+    """Pre-started worker processes that run picklable functions off the event loop.
+
+    Tasks wait (asynchronously) for an idle worker; results are read with
+    `loop.add_reader`, so no thread is held while a task runs. A task that
+    exceeds `timeout`, or whose caller is cancelled, kills its worker, which is
+    replaced immediately.
+
+    Example:
+        >>> pool = WorkerPool(num_workers=4, max_tasks_per_worker=1000)
+        >>> result = await pool.run(expensive_fn, arg, timeout=10.0)
+        >>> await pool.aclose()
+
+    Args:
+        num_workers: Number of worker processes.
+        max_tasks_per_worker: Replace a worker after it completed this many tasks, releasing
+            memory accumulated by long-lived caches. `None` never recycles.
+        max_pending: Maximum tasks waiting for a worker; further submissions raise
+            `WorkerPoolFullError`. `None` queues without bound.
+        mp_context: `multiprocessing` start method. `"spawn"` (default) is safe to use from a
+            process that already runs threads.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        *,
+        max_tasks_per_worker: int | None = None,
+        max_pending: int | None = None,
+        mp_context: str = "spawn",
+    ):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be >= 1, got {num_workers}")
+        self.num_workers = num_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_pending = max_pending
+        self._context = multiprocessing.get_context(mp_context)
+        self._workers: list[_Worker] = []
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._pending = 0
+        self._retiring: dict[asyncio.Task[None], _Worker] = {}
+        self.timeouts = 0
+        self.recycled = 0
+
+    def start(self) -> None:
+        """Start the worker processes. Called on first `run` if not called explicitly."""
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        for _ in range(self.num_workers):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        worker = _Worker(self._context)
+        self._workers.append(worker)
+        self._idle.put_nowait(worker)
+
+    def _replace(self, worker: _Worker, *, kill: bool) -> None:
+        # Start the replacement first; the old process is reaped in the background
+        self._workers.remove(worker)
+        self._spawn()
+        task = asyncio.get_running_loop().create_task(worker.stop_async(kill=kill))
+        self._retiring[task] = worker
+        task.add_done_callback(lambda t: self._retiring.pop(t, None))
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks waiting for an idle worker."""
+        return self._pending
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: float | None = None, **kwargs: Any) -> Any:
+        """Run `fn(*args, **kwargs)` in a worker process and return its result.
+
+        Args:
+            fn: Module-level (picklable) function.
+            *args: Positional arguments for `fn`.
+            timeout: Seconds the task may run once it reached a worker. `None` waits indefinitely.
+            **kwargs: Keyword arguments for `fn`.
+
+        Raises:
+            WorkerPoolFullError: If `max_pending` tasks are already waiting.
+            TimeoutError: If the task exceeded `timeout` (its worker was killed).
+            WorkerCrashedError: If the worker died while running the task (it was replaced).
+            Exception: Any exception raised by `fn`, re-raised in the caller.
+        """
+        self.start()
+        if self.max_pending is not None and self._idle.empty() and self._pending >= self.max_pending:
+            raise WorkerPoolFullError(f"{self._pending} tasks already waiting for a worker")
+
+        self._pending += 1
+        try:
+            worker = await self._idle.get()
+        finally:
+            self._pending -= 1
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        fd = worker.conn.fileno()
+        loop.add_reader(fd, lambda: done.done() or done.set_result(None))
+        try:
+            worker.conn.send((fn, args, kwargs))
+            await asyncio.wait_for(done, timeout)
+            ok, value = worker.conn.recv()
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            loop.remove_reader(fd)
+            self._replace(worker, kill=True)
+            raise TimeoutError(f"Task exceeded {timeout}s; worker killed") from None
+        except (EOFError, OSError) as e:
+            # The pipe closed: the worker process died
+            loop.remove_reader(fd)
+            self._replace(worker, kill=True)
+            raise WorkerCrashedError("Worker died while running the task; worker replaced") from e
+        except BaseException:
+            # Cancelled, or the worker died: its state is unknown, so replace it
+            loop.remove_reader(fd)
+            self._replace(worker, kill=True)
+            raise
+        loop.remove_reader(fd)
+
+        worker.tasks += 1
+        if self.max_tasks_per_worker is not None and worker.tasks >= self.max_tasks_per_worker:
+            self.recycled += 1
+            self._replace(worker, kill=False)
+        else:
+            self._idle.put_nowait(worker)
+
+        if not ok:
+            raise value
+        return value
+
+    async def aclose(self) -> None:
+        """Stop all workers without blocking the event loop. The pool restarts on the next `run`."""
+        retiring = list(self._retiring)
+        workers, self._workers, self._idle = self._workers, [], None
+        await asyncio.gather(*retiring, *(worker.stop_async() for worker in workers))
+
+    def close(self) -> None:
+        """Stop all workers, blocking until they exited. Use `aclose` from async code."""
+        for task, worker in list(self._retiring.items()):
+            if not task.get_loop().is_closed():
+                task.cancel()
+            worker.stop(kill=True)
+        self._retiring.clear()
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+        self._idle = None
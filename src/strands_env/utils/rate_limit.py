@@ -0,0 +1,73 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket that refills at `rate` per second up to `capacity`.
+
+    `acquire` waits until enough tokens are available and takes them. Waiters are
+    served in FIFO order, so a large request is not starved by smaller ones.
+
+    Example:
+        >>> requests = TokenBucket.per_minute(600)  # 600 requests/min, bursts of up to 600
+        >>> waited = await requests.acquire()
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held, i.e. the largest burst. Defaults to `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        if self.capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {self.capacity}")
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> TokenBucket:
+        """Bucket allowing `limit` tokens per minute, starting full (one minute's worth)."""
+        return cls(limit / 60.0, capacity=limit)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens (at most `capacity`), waiting for them if needed.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        amount = min(amount, self.capacity)
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+        return time.monotonic() - start
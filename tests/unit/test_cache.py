@@ -0,0 +1,90 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for cache utilities."""
+
+import pytest
+
+from strands_env.utils.cache import MISSING, LRUCache, SQLiteCache
+
+# ---------------------------------------------------------------------------
+# LRUCache
+# ---------------------------------------------------------------------------
+
+
+class TestLRUCache:
+    def test_get_put(self):
+        cache = LRUCache(2)
+        assert cache.get("a") is MISSING
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_caches_none(self):
+        cache = LRUCache(2)
+        cache.put("a", None)
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_zero_size_disables(self):
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        assert cache.get("a", None) is None
+        assert len(cache) == 0
+
+    def test_clear_resets_stats(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hit_rate == 0.0
+
+    def test_negative_size_raises(self):
+        with pytest.raises(ValueError):
+            LRUCache(-1)
+
+
+# ---------------------------------------------------------------------------
+# SQLiteCache
+# ---------------------------------------------------------------------------
+
+
+class TestSQLiteCache:
+    def test_get_put(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+        assert cache.get("a") is MISSING
+        cache.put("a", {"grade": "correct"})
+        cache.put("b", None)
+        assert cache.get("a") == {"grade": "correct"}
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert len(cache) == 2
+
+    def test_persists_across_connections(self, tmp_path):
+        path = tmp_path / "nested" / "cache.sqlite"
+        first = SQLiteCache(path)
+        first.put("a", "text")
+        first.close()
+        assert SQLiteCache(path).get("a") == "text"
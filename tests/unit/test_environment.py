@@ -14,6 +14,8 @@
 
 """Unit tests for Environment."""
 
+import asyncio
+from contextlib import aclosing
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -22,7 +24,10 @@ from strands_sglang import TokenManager
 from strands_env.core.environment import Environment
 from strands_env.core.types import (
     Action,
+    Observation,
+    RewardFunction,
     RewardResult,
+    StepResult,
     TaskContext,
     TerminationReason,
 )
@@ -132,6 +137,51 @@ class TestStep:
 
         assert result.termination_reason == TerminationReason.UNCLASSIFIED_ERROR
 
+    @patch("strands_env.core.environment.Agent")
+    async def test_step_timeout_keeps_partial_messages(self, mock_agent_cls, model_factory):
+        """An agent loop exceeding step_timeout is cancelled and ends with TIMEOUT."""
+        agent_instance = MagicMock()
+        agent_instance.messages = []
+
+        async def invoke(message):
+            agent_instance.messages.append({"role": "assistant", "content": [{"text": "partial"}]})
+            await asyncio.sleep(10)
+
+        agent_instance.invoke_async = invoke
+        agent_instance.model.token_manager = TokenManager()
+        agent_instance.event_loop_metrics = self._mock_event_loop_metrics()
+        mock_agent_cls.return_value = agent_instance
+
+        env = Environment(model_factory=model_factory, step_timeout=0.01)
+        result = await env.step(Action(message="Do something"))
+
+        assert result.termination_reason == TerminationReason.TIMEOUT
+        assert result.observation.messages == [{"role": "assistant", "content": [{"text": "partial"}]}]
+
+    @patch("strands_env.core.environment.Agent")
+    async def test_tools_built_once_per_instance(self, mock_agent_cls, model_factory):
+        """get_tools() is called once and the cached list is passed to every Agent."""
+        agent_instance = MagicMock()
+        agent_instance.invoke_async = AsyncMock()
+        agent_instance.messages = []
+        agent_instance.model.token_manager = TokenManager()
+        agent_instance.event_loop_metrics = self._mock_event_loop_metrics()
+        mock_agent_cls.return_value = agent_instance
+
+        tool = MagicMock(tool_spec={"name": "calc"})
+        env = Environment(model_factory=model_factory)
+        env.get_tools = MagicMock(return_value=[tool])
+
+        await env.step(Action(message="a"))
+        await env.step(Action(message="b"))
+        assert env.get_tools.call_count == 1
+        assert [call.kwargs["tools"] for call in mock_agent_cls.call_args_list] == [[tool], [tool]]
+        assert env.tool_specs == [{"name": "calc"}]
+
+        env.cache_tools = False
+        await env.step(Action(message="c"))
+        assert env.get_tools.call_count == 2
+
     @patch("strands_env.core.environment.Agent")
     async def test_step_with_reward_fn(self, mock_agent_cls, model_factory):
         """Reward function is called when provided."""
@@ -191,6 +241,157 @@ class TestStep:
         return metrics
 
 
+# ---------------------------------------------------------------------------
+# step_many()
+# ---------------------------------------------------------------------------
+
+
+class TestStepMany:
+    @staticmethod
+    def _make_env(model_factory, delays: dict[str, float]):
+        env = Environment(model_factory=model_factory)
+        env.in_flight = env.peak = 0
+
+        async def step(action):
+            env.in_flight += 1
+            env.peak = max(env.peak, env.in_flight)
+            try:
+                await asyncio.sleep(delays.get(action.message, 0))
+                if action.message == "bad":
+                    raise RuntimeError("reward failed")
+                return StepResult(
+                    observation=Observation(metrics={"message": action.message}),
+                    termination_reason=TerminationReason.TASK_COMPLETE,
+                )
+            finally:
+                env.in_flight -= 1
+
+        env.step = step
+        return env
+
+    async def test_results_in_input_order_with_errors_isolated(self, model_factory):
+        """Results follow input order; a raising step yields an error result without failing the batch."""
+        env = self._make_env(model_factory, {"a": 0.03, "b": 0.01})
+        results = await env.step_many([Action(message=m) for m in ["a", "bad", "b", "c"]], max_concurrency=2)
+
+        assert [r.observation.metrics.get("message") for r in results] == ["a", None, "b", "c"]
+        assert results[1].termination_reason == TerminationReason.UNCLASSIFIED_ERROR
+        assert env.peak == 2
+
+    async def test_iter_yields_in_completion_order(self, model_factory):
+        env = self._make_env(model_factory, {"slow": 0.05})
+        actions = [Action(message="slow"), Action(message="fast")]
+        order = [index async for index, _ in env.iter_step_many(actions)]
+        assert order == [1, 0]
+
+    async def test_breaking_out_cancels_pending_steps(self, model_factory):
+        env = self._make_env(model_factory, {"slow": 10})
+        actions = [Action(message="fast"), Action(message="slow")]
+        async with aclosing(env.iter_step_many(actions)) as results:
+            async for index, _ in results:
+                assert index == 0
+                break
+        assert env.in_flight == 0
+
+    async def test_batched_reward_single_call(self, model_factory):
+        """A `batched` reward function gets one `compute_batch` call over the successful rollouts."""
+        env = self._make_env(model_factory, {"a": 0.02})
+        env.rollout = env.step
+        del env.step  # Default `step`, so `rollout` is the whole episode
+        env.reward_fn = self.BatchReward()
+        results = await env.step_many([Action(message=m) for m in ["a", "bad", "bb"]])
+
+        assert env.reward_fn.batches == [["a", "bb"]]
+        assert [r.reward.reward if r.reward else None for r in results] == [1.0, None, 2.0]
+        assert results[1].termination_reason == TerminationReason.UNCLASSIFIED_ERROR
+
+    async def test_batched_reward_respects_step_override(self, model_factory):
+        """An overridden `step` runs as-is; its own reward logic is not bypassed for `compute_batch`."""
+        env = self._make_env(model_factory, {})
+        env.reward_fn = self.BatchReward()
+        results = await env.step_many([Action(message=m) for m in ["a", "bb"]])
+
+        assert env.reward_fn.batches == []
+        assert [r.observation.metrics["message"] for r in results] == ["a", "bb"]
+
+    async def test_batched_reward_error_keeps_termination_reason(self, model_factory):
+        env = self._make_env(model_factory, {})
+        env.rollout = env.step
+        del env.step
+        env.reward_fn = self.BatchReward()
+        env.reward_fn.compute_batch = AsyncMock(side_effect=TimeoutError("judge timed out"))
+        results = await env.step_many([Action(message=m) for m in ["a", "bb"]])
+
+        assert all(r.termination_reason == TerminationReason.TASK_COMPLETE for r in results)
+        assert all(r.reward is None for r in results)
+        assert [r.observation.metrics["reward_error"] for r in results] == ["judge timed out"] * 2
+
+    class BatchReward(RewardFunction):
+        batched = True
+
+        def __init__(self):
+            self.batches = []
+
+        async def compute(self, action, step_result):
+            raise AssertionError("compute_batch expected")
+
+        async def compute_batch(self, pairs):
+            self.batches.append([action.message for action, _ in pairs])
+            return [RewardResult(reward=float(len(action.message))) for action, _ in pairs]
+
+
+# ---------------------------------------------------------------------------
+# prefill()
+# ---------------------------------------------------------------------------
+
+
+class TestPrefill:
+    async def test_stops_after_first_response_event(self, mock_model):
+        events = []
+
+        async def stream(messages, tool_specs=None, system_prompt=None):
+            for event in ["messageStart", "contentBlockStart", "contentBlockDelta", "contentBlockStop"]:
+                events.append(event)
+                yield {event: {}}
+
+        mock_model.stream = MagicMock(side_effect=stream)
+        env = Environment(model_factory=lambda: mock_model, system_prompt="Be brief.")
+        history = [{"role": "user", "content": [{"text": "hi"}]}]
+        await env.prefill(Action(message="2+2?", task_context=TaskContext(conversation_history=history)))
+
+        assert events == ["messageStart", "contentBlockStart", "contentBlockDelta"]
+        messages = mock_model.stream.call_args.args[0]
+        assert messages == [*history, {"role": "user", "content": [{"text": "2+2?"}]}]
+        assert mock_model.stream.call_args.kwargs == {"tool_specs": None, "system_prompt": "Be brief."}
+
+    async def test_sglang_request_is_sent_for_one_token(self):
+        """Like `SGLangModel`, the fake yields the start events before awaiting `client.generate`."""
+
+        class FakeSGLangModel:
+            def __init__(self):
+                self.config = {"sampling_params": {"temperature": 0.7}}
+                self.client = MagicMock()
+                self.client.generate = AsyncMock(return_value={"text": "4"})
+
+            def get_config(self):
+                return self.config
+
+            def update_config(self, **kwargs):
+                self.config.update(kwargs)
+
+            async def stream(self, messages, tool_specs=None, system_prompt=None):
+                yield {"messageStart": {"role": "assistant"}}
+                yield {"contentBlockStart": {"start": {}}}
+                response = await self.client.generate(sampling_params=self.config["sampling_params"])
+                yield {"contentBlockDelta": {"delta": {"text": response["text"]}}}
+                yield {"contentBlockStop": {}}
+
+        model = FakeSGLangModel()
+        await Environment(model_factory=lambda: model).prefill(Action(message="2+2?"))
+
+        model.client.generate.assert_awaited_once_with(sampling_params={"temperature": 0.7, "max_new_tokens": 1})
+
+
 # ---------------------------------------------------------------------------
 # compute_metrics()
 # ---------------------------------------------------------------------------
@@ -14,14 +14,39 @@
 
 """Unit tests for evaluation module."""
 
+import asyncio
+import json
+import random
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from strands_env.core import Action, Environment, Observation, RewardResult, StepResult, TaskContext
+from strands_env.core import (
+    Action,
+    Environment,
+    Observation,
+    RewardFunction,
+    RewardResult,
+    StepResult,
+    TaskContext,
+    TerminationReason,
+)
 from strands_env.eval import EvalSample, Evaluator
 from strands_env.eval.benchmarks.aime import AIME2024Evaluator
-from strands_env.eval.metrics import compute_pass_at_k
+from strands_env.eval.concurrency import AdaptiveConcurrencyLimiter
+from strands_env.eval.distributed import SQLiteWorkQueue, WorkUnit, collect, enqueue, run_worker
+from strands_env.eval.early_stopping import EarlyStopping, wilson_interval
+from strands_env.eval.metrics import (
+    PassAtKAccumulator,
+    RewardAccumulator,
+    TerminationAccumulator,
+    UsageAccumulator,
+    compute_pass_at_k,
+    pass_at_k_scores,
+)
+from strands_env.eval.pool import EnvironmentPool
+from strands_env.eval.reward_batching import RewardBatcher
+from strands_env.eval.sharding import merge_shards, shard_for, shard_output_path
 
 # ---------------------------------------------------------------------------
 # EvalSample
@@ -140,6 +165,115 @@ class TestEvaluator:
 
         assert max_concurrent <= 3
 
+    async def test_streaming_keeps_results_on_disk(self, mock_env, tmp_path):
+        """Streaming mode spills samples to disk and computes metrics from the checkpoint."""
+        mock_env.step.return_value = StepResult(observation=Observation(), reward=RewardResult(reward=1.0))
+        output_path = tmp_path / "results.jsonl"
+
+        async def factory(action):
+            return mock_env
+
+        actions = (Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(4))
+        evaluator = Evaluator(
+            env_factory=factory, n_samples_per_prompt=2, output_path=output_path, save_interval=3, streaming=True
+        )
+        results = await evaluator.run(actions)
+
+        assert results == {}
+        assert len(evaluator.completed_ids) == 8
+        saved = evaluator.read_results()
+        assert len(saved) == 4
+        assert all(len(samples) == 2 for samples in saved.values())
+        assert evaluator.compute_metrics(log=False)["pass@2"] == 1.0
+
+    async def test_streaming_metrics_never_load_messages(self, mock_env, tmp_path):
+        """Neither a streaming run nor its metrics read message transcripts back from disk."""
+        mock_env.step.return_value = StepResult(
+            observation=Observation(messages=[{"role": "assistant", "content": [{"text": "4"}]}]),
+            reward=RewardResult(reward=1.0),
+        )
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(
+            env_factory=factory, n_samples_per_prompt=2, output_path=tmp_path / "results.jsonl", streaming=True
+        )
+        reads = []
+        iter_results = evaluator.store.iter_results
+
+        def recording_iter_results(include_messages=True):
+            reads.append(include_messages)
+            return iter_results(include_messages=include_messages)
+
+        evaluator.store.iter_results = recording_iter_results
+        actions = (Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3))
+        await evaluator.run(actions)
+        assert evaluator.compute_metrics(log=False)["pass@2"] == 1.0
+        assert reads and not any(reads)
+
+    async def test_streaming_pulls_actions_lazily(self, tmp_path):
+        """Only max_concurrency samples are pulled from the dataset ahead of completion."""
+        import asyncio
+
+        pulled = 0
+        max_ahead = 0
+        completed = 0
+
+        def dataset():
+            nonlocal pulled, max_ahead
+            for i in range(20):
+                pulled += 1
+                max_ahead = max(max_ahead, pulled - completed)
+                yield Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}"))
+
+        async def mock_step(action):
+            nonlocal completed
+            await asyncio.sleep(0.001)
+            completed += 1
+            return StepResult(observation=Observation())
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.step = mock_step
+            env.cleanup = AsyncMock()
+            return env
+
+        evaluator = Evaluator(
+            env_factory=factory, max_concurrency=3, output_path=tmp_path / "results.jsonl", streaming=True
+        )
+        await evaluator.run(dataset())
+
+        assert completed == 20
+        assert max_ahead <= 3
+
+    async def test_sample_timeout_cancels_step(self, mock_env, tmp_path):
+        """A hung step is cancelled at the deadline, cleanup still runs, and TIMEOUT is recorded."""
+
+        step_timeouts = []
+
+        async def hang(action):
+            step_timeouts.append(mock_env.step_timeout)
+            await asyncio.sleep(10)
+
+        mock_env.step.side_effect = hang
+        mock_env.step_timeout = None
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(env_factory=factory, output_path=tmp_path / "results.jsonl", sample_timeout=0.01)
+        evaluator.timeout_grace = 0.01
+        results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p0"))])
+
+        sample = results["p0"][0]
+        assert sample.step_result.termination_reason == TerminationReason.TIMEOUT
+        assert mock_env.cleanup.await_count == 1
+        # Environment instances get the remaining time as their agent-loop deadline, restored afterwards
+        assert 0 < step_timeouts[0] <= 0.01
+        assert mock_env.step_timeout is None
+
     async def test_empty_actions(self, mock_env, tmp_path):
         """Empty actions produces empty results."""
 
@@ -209,6 +343,813 @@ class TestCheckpoint:
         assert len(results) == 2  # Both prompt_ids in results
         assert sum(len(samples) for samples in results.values()) == 2
 
+    async def test_appends_only_new_samples(self, mock_env, tmp_path):
+        """Each save appends only samples completed since the previous save."""
+        mock_env.step.return_value = StepResult(observation=Observation())
+        output_path = tmp_path / "results.jsonl"
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(env_factory=factory, output_path=output_path, save_interval=1)
+        await evaluator.run([Action(message="q1", task_context=TaskContext(id="s1"))])
+        first = output_path.read_text()
+
+        evaluator.save_results()  # Nothing pending, no-op
+        assert output_path.read_text() == first
+
+        await evaluator.run([Action(message="q2", task_context=TaskContext(id="s2"))])
+        content = output_path.read_text()
+        assert content.startswith(first)
+        assert len(content.strip().split("\n")) == 2
+
+    async def test_recovers_from_torn_last_line(self, mock_env, tmp_path):
+        """A partially written last line is discarded and truncated on load."""
+        mock_env.step.return_value = StepResult(observation=Observation())
+        output_path = tmp_path / "results.jsonl"
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(env_factory=factory, output_path=output_path, save_interval=1)
+        await evaluator.run([Action(message="q1", task_context=TaskContext(id="s1"))])
+        valid = output_path.read_text()
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write('{"action": {"message": "q2"')
+
+        evaluator2 = Evaluator(env_factory=factory, output_path=output_path)
+        evaluator2.load_results()
+        assert evaluator2.completed_ids == {"s1_0"}
+        assert output_path.read_text() == valid
+
+    async def test_corrupt_middle_line_raises(self, mock_env, tmp_path):
+        """Corruption before the last line is not silently dropped."""
+        output_path = tmp_path / "results.jsonl"
+        output_path.write_text("not json\n{}\n")
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(env_factory=factory, output_path=output_path)
+        with pytest.raises(ValueError, match="Corrupt checkpoint line"):
+            evaluator.load_results()
+
+    async def test_compact_on_finish(self, mock_env, tmp_path):
+        """Compaction rewrites the checkpoint grouped by prompt."""
+        mock_env.step.return_value = StepResult(observation=Observation())
+        output_path = tmp_path / "results.jsonl"
+
+        async def factory(action):
+            return mock_env
+
+        evaluator = Evaluator(
+            env_factory=factory,
+            n_samples_per_prompt=2,
+            output_path=output_path,
+            save_interval=1,
+            compact_on_finish=True,
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3)]
+        await evaluator.run(actions)
+
+        prompt_ids = [json.loads(line)["prompt_id"] for line in output_path.read_text().strip().split("\n")]
+        assert len(prompt_ids) == 6
+        assert prompt_ids == sorted(prompt_ids, key=prompt_ids.index)
+        assert not output_path.with_name("results.jsonl.tmp").exists()
+
+
+# ---------------------------------------------------------------------------
+# Sharding
+# ---------------------------------------------------------------------------
+
+
+class TestSharding:
+    @staticmethod
+    async def factory(action):
+        env = MagicMock()
+        env.reset = AsyncMock()
+        env.step = AsyncMock(return_value=StepResult(observation=Observation(), reward=RewardResult(reward=1.0)))
+        env.cleanup = AsyncMock()
+        return env
+
+    def test_shard_for_is_stable(self):
+        assert shard_for("aime-2024_1", 4) == shard_for("aime-2024_1", 4)
+        assert {shard_for(f"p{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+    def test_invalid_shard_index_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="shard_index"):
+            Evaluator(env_factory=self.factory, output_path=tmp_path / "r.jsonl", shard_index=2, num_shards=2)
+
+    async def test_shards_partition_and_merge(self, tmp_path):
+        """Shards evaluate disjoint prompts and merge into one checkpoint; re-merging gives the same file."""
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(10)]
+        output_path = tmp_path / "results.jsonl"
+
+        shard_evaluators = []
+        for i in range(3):
+            evaluator = Evaluator(
+                env_factory=self.factory,
+                n_samples_per_prompt=2,
+                output_path=shard_output_path(output_path, i, 3),
+                shard_index=i,
+                num_shards=3,
+            )
+            await evaluator.run(actions)
+            shard_evaluators.append(evaluator)
+
+        shard_ids = [e.completed_ids for e in shard_evaluators]
+        assert sum(len(ids) for ids in shard_ids) == 20
+        assert set.union(*shard_ids) == {f"p{i}_{j}" for i in range(10) for j in range(2)}
+
+        merged = Evaluator(env_factory=self.factory, n_samples_per_prompt=2, output_path=output_path)
+        assert merge_shards([e.store for e in shard_evaluators], merged.store) == 20
+        first = output_path.read_bytes()
+        merge_shards([e.store for e in shard_evaluators], merged.store)
+        assert output_path.read_bytes() == first
+        assert merged.compute_metrics(log=False)["pass@2"] == 1.0
+
+    async def test_merge_refuses_unrelated_results(self, tmp_path):
+        """Merging never silently replaces samples that are not in any shard."""
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(4)]
+        output_path = tmp_path / "results.jsonl"
+        await Evaluator(env_factory=self.factory, output_path=output_path).run(actions)
+
+        shard = Evaluator(
+            env_factory=self.factory, output_path=shard_output_path(output_path, 0, 2), shard_index=0, num_shards=2
+        )
+        await shard.run(actions)
+        target = Evaluator(env_factory=self.factory, output_path=output_path)
+        with pytest.raises(FileExistsError, match="not in any shard"):
+            merge_shards([shard.store], target.store)
+        assert len(target.store.completed_ids()) == 4
+
+        assert merge_shards([shard.store], target.store, overwrite=True, batch_size=1) == len(shard.completed_ids)
+        assert target.store.completed_ids() == shard.completed_ids
+
+
+# ---------------------------------------------------------------------------
+# Environment pool
+# ---------------------------------------------------------------------------
+
+
+class TestEnvironmentPool:
+    @staticmethod
+    def make_factory(created: list[MagicMock], reward: float = 1.0):
+        async def factory(action):
+            env = MagicMock(spec=Environment)
+            env.step_timeout = None
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+
+            async def step(action):
+                await asyncio.sleep(0.001)
+                return StepResult(observation=Observation(), reward=RewardResult(reward=reward))
+
+            env.step = AsyncMock(side_effect=step)
+            created.append(env)
+            return env
+
+        return factory
+
+    async def test_reuses_environments_per_key(self):
+        created: list[MagicMock] = []
+        pool = EnvironmentPool(self.make_factory(created), key_fn=lambda a: a.task_context.ground_truth)
+        a = Action(message="q", task_context=TaskContext(id="p0", ground_truth="a"))
+        b = Action(message="q", task_context=TaskContext(id="p1", ground_truth="b"))
+
+        for action in (a, a, b, a):
+            async with pool.acquire(action) as env:
+                assert env.reset.await_count >= 1
+
+        assert len(created) == 2
+        assert created[0].reset.await_count == 3
+        assert created[0].cleanup.await_count == 0
+        assert pool.metrics()["pool_hits"] == 2
+        assert pool.metrics()["pool_misses"] == 2
+
+        await pool.close()
+        assert all(env.cleanup.await_count == 1 for env in created)
+
+    async def test_evicts_unhealthy_environments(self):
+        created: list[MagicMock] = []
+        health = AsyncMock(return_value=False)
+        pool = EnvironmentPool(self.make_factory(created), max_uses=2, health_check=health)
+        action = Action(message="q")
+
+        with pytest.raises(RuntimeError):
+            async with pool.acquire(action):
+                raise RuntimeError("tool crashed")
+        assert created[0].cleanup.await_count == 1
+
+        async with pool.acquire(action) as env:
+            pool.mark_unhealthy(env)
+        assert created[1].cleanup.await_count == 1
+
+        async with pool.acquire(action):
+            pass
+        async with pool.acquire(action):  # Fails health check -> new environment
+            pass
+        health.assert_awaited_once_with(created[2])
+        assert len(created) == 4
+        assert pool.evictions == 3
+
+    async def test_evaluator_uses_pool(self, tmp_path):
+        created: list[MagicMock] = []
+        async with EnvironmentPool(self.make_factory(created)) as pool:
+            evaluator = Evaluator(
+                env_factory=self.make_factory([]),
+                max_concurrency=2,
+                n_samples_per_prompt=3,
+                output_path=tmp_path / "results.jsonl",
+                env_pool=pool,
+            )
+            actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(4)]
+            results = await evaluator.run(actions)
+
+            assert sum(len(s) for s in results.values()) == 12
+            assert len(created) == 2
+            assert sum(env.reset.await_count for env in created) == 12
+            assert all(env.cleanup.await_count == 0 for env in created)
+        assert all(env.cleanup.await_count == 1 for env in created)
+
+    async def test_hung_reset_counts_against_sample_timeout(self, tmp_path):
+        """A pooled environment whose reset hangs times out the sample and is evicted."""
+        created: list[MagicMock] = []
+        make_env = self.make_factory(created)
+
+        async def factory(action):
+            env = await make_env(action)
+            env.reset = AsyncMock(side_effect=asyncio.Event().wait)
+            return env
+
+        async with EnvironmentPool(factory) as pool:
+            evaluator = Evaluator(
+                env_factory=factory, output_path=tmp_path / "results.jsonl", env_pool=pool, sample_timeout=0.05
+            )
+            results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p0"))])
+
+            sample = results["p0"][0]
+            assert sample.step_result.termination_reason == TerminationReason.TIMEOUT
+            created[0].step.assert_not_awaited()
+            assert created[0].cleanup.await_count == 1
+            assert pool.metrics()["pool_idle"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Adaptive concurrency
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveConcurrencyLimiter:
+    async def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=2)
+        for _ in range(2):
+            await limiter.release(await limiter.acquire(), latency=0.1)
+        assert limiter.limit == 3
+        for _ in range(10):
+            await limiter.release(await limiter.acquire(), latency=0.1)
+        assert limiter.limit == 4
+
+    async def test_multiplicative_decrease_once_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, min_limit=2, initial_limit=16)
+        tokens = [await limiter.acquire() for _ in range(8)]
+
+        # A burst of timeouts from samples started in the same window backs off once
+        for token in tokens[:4]:
+            await limiter.release(token, latency=1.0, termination_reason=TerminationReason.TIMEOUT)
+        assert limiter.limit == 8
+        for token in tokens[4:]:
+            await limiter.release(token)  # Unused slots leave the limit unchanged
+        assert limiter.limit == 8
+
+        token = await limiter.acquire()
+        await limiter.release(token, latency=1.0, termination_reason=TerminationReason.THROTTLED)
+        assert limiter.limit == 4
+        token = await limiter.acquire()
+        await limiter.release(token, latency=1.0, termination_reason=TerminationReason.THROTTLED)
+        assert limiter.limit == 2  # min_limit
+
+        metrics = limiter.metrics()
+        assert metrics["concurrency_decreases"] == 3
+        assert metrics["congestion_timeout"] == 4
+        assert metrics["congestion_throttled"] == 2
+        assert metrics["concurrency_limit_min"] == 2
+
+    async def test_latency_threshold_and_errors(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8, latency_threshold=5.0)
+        await limiter.release(await limiter.acquire(), latency=1.0, error=ValueError("bad"))
+        assert limiter.limit == 8
+
+        class ReadTimeoutError(Exception):
+            pass
+
+        await limiter.release(await limiter.acquire(), latency=1.0, error=ReadTimeoutError())
+        assert limiter.limit == 4
+        await limiter.release(await limiter.acquire(), latency=10.0)
+        assert limiter.limit == 2
+        assert limiter.signals == {"timeout": 1, "throttled": 0, "slow": 1, "error": 1}
+
+    async def test_bounds_in_flight_in_run(self, tmp_path):
+        """Evaluator.run never exceeds the limiter's current limit."""
+        in_flight = 0
+        peak = 0
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+
+            async def step(action):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+                return StepResult(
+                    observation=Observation(),
+                    reward=RewardResult(reward=1.0),
+                    termination_reason=TerminationReason.THROTTLED,
+                )
+
+            env.step = step
+            return env
+
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=4)
+        evaluator = Evaluator(
+            env_factory=factory, max_concurrency=8, output_path=tmp_path / "results.jsonl", concurrency_limiter=limiter
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(20)]
+        results = await evaluator.run(actions)
+
+        assert sum(len(s) for s in results.values()) == 20
+        assert peak <= 4
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# Prompt-grouped scheduling
+# ---------------------------------------------------------------------------
+
+
+class TestPromptSchedule:
+    @staticmethod
+    def make_factory(events: list[tuple[str, str]], delays: dict[str, float] | None = None):
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+
+            async def prefill(action):
+                events.append(("prefill", action.task_context.id))
+
+            async def step(action):
+                sample_id = action.task_context.id
+                events.append(("start", sample_id))
+                await asyncio.sleep((delays or {}).get(sample_id, 0.001))
+                events.append(("end", sample_id))
+                return StepResult(observation=Observation(), reward=RewardResult(reward=1.0))
+
+            env.prefill = prefill
+            env.step = step
+            return env
+
+        return factory
+
+    def test_invalid_schedule_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="schedule"):
+            Evaluator(env_factory=self.make_factory([]), output_path=tmp_path / "r.jsonl", schedule="random")
+
+    async def test_samples_of_a_prompt_dispatched_together(self, tmp_path):
+        events: list[tuple[str, str]] = []
+        # p0_0 is slow: in sample mode a free worker would start p1_0 before p0 finishes
+        factory = self.make_factory(events, delays={"p0_0": 0.05})
+        evaluator = Evaluator(
+            env_factory=factory,
+            max_concurrency=3,
+            n_samples_per_prompt=2,
+            output_path=tmp_path / "results.jsonl",
+            schedule="prompt",
+            prefix_warmup=True,
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3)]
+        results = await evaluator.run(actions)
+
+        assert sum(len(s) for s in results.values()) == 6
+        order = [sample_id for kind, sample_id in events if kind in ("prefill", "start")]
+        # Each prompt is prefilled once, then both samples start back to back
+        assert order[:3] == ["p0_0", "p0_0", "p0_1"]
+        for i in range(3):
+            idx = order.index(f"p{i}_0", order.index(f"p{i}_0") + 1)
+            assert order[idx + 1] == f"p{i}_1"
+        # p1 needs two free slots, so it waits for the slow p0_0
+        assert events.index(("start", "p1_0")) > events.index(("end", "p0_1"))
+
+    async def test_warmup_failures_are_ignored(self, tmp_path):
+        """A failing environment factory during warm-up is logged; the samples still run."""
+        events: list[tuple[str, str]] = []
+        factory = self.make_factory(events)
+        calls = 0
+
+        async def flaky_factory(action):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("sandbox unavailable")
+            return await factory(action)
+
+        evaluator = Evaluator(
+            env_factory=flaky_factory,
+            n_samples_per_prompt=2,
+            output_path=tmp_path / "results.jsonl",
+            schedule="prompt",
+            prefix_warmup=True,
+        )
+        results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p0"))])
+
+        assert len(results["p0"]) == 2
+        assert ("prefill", "p0_0") not in events
+
+    async def test_large_group_chunked_by_concurrency(self, tmp_path):
+        events: list[tuple[str, str]] = []
+        evaluator = Evaluator(
+            env_factory=self.make_factory(events),
+            max_concurrency=2,
+            n_samples_per_prompt=5,
+            output_path=tmp_path / "results.jsonl",
+            schedule="prompt",
+        )
+        results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p0"))])
+
+        assert len(results["p0"]) == 5
+        in_flight = peak = 0
+        for kind, _ in events:
+            in_flight += 1 if kind == "start" else -1
+            peak = max(peak, in_flight)
+        assert peak == 2
+
+    async def test_with_concurrency_limiter(self, tmp_path):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=4)
+        evaluator = Evaluator(
+            env_factory=self.make_factory([]),
+            max_concurrency=4,
+            n_samples_per_prompt=3,
+            output_path=tmp_path / "results.jsonl",
+            schedule="prompt",
+            concurrency_limiter=limiter,
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(4)]
+        results = await evaluator.run(actions)
+
+        assert sum(len(s) for s in results.values()) == 12
+        assert limiter.in_flight == 0
+
+    async def test_sample_error_propagates(self, tmp_path):
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+            env.step = AsyncMock(side_effect=RuntimeError("boom"))
+            return env
+
+        evaluator = Evaluator(env_factory=factory, output_path=tmp_path / "results.jsonl", schedule="prompt")
+        with pytest.raises(RuntimeError, match="boom"):
+            await evaluator.run([Action(message="q", task_context=TaskContext(id="p0"))])
+
+
+# ---------------------------------------------------------------------------
+# Reward batching
+# ---------------------------------------------------------------------------
+
+
+class BatchRecordingReward(RewardFunction):
+    batched = True
+
+    def __init__(self, fail: bool = False):
+        self.batch_sizes = []
+        self.fail = fail
+
+    async def compute(self, action, step_result):
+        raise AssertionError("compute_batch expected")
+
+    async def compute_batch(self, pairs):
+        self.batch_sizes.append(len(pairs))
+        if self.fail:
+            raise RuntimeError("judge down")
+        return [RewardResult(reward=1.0) for _ in pairs]
+
+
+class TestRewardBatching:
+    async def test_coalesces_concurrent_calls(self):
+        reward_fn = BatchRecordingReward()
+        batcher = RewardBatcher(reward_fn, max_batch_size=3, max_wait=0.05)
+        step_result = StepResult(observation=Observation())
+        results = await asyncio.gather(*(batcher.compute(Action(message="q"), step_result) for _ in range(5)))
+
+        assert [r.reward for r in results] == [1.0] * 5
+        assert reward_fn.batch_sizes == [3, 2]
+        assert batcher.metrics() == {"reward_batches": 2, "reward_batch_size_mean": 2.5}
+
+    async def test_errors_propagate_to_batch(self):
+        batcher = RewardBatcher(BatchRecordingReward(fail=True), max_wait=0.01)
+        step_result = StepResult(observation=Observation())
+        results = await asyncio.gather(
+            *(batcher.compute(Action(message="q"), step_result) for _ in range(2)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_short_batch_result_fails_every_caller(self):
+        reward_fn = BatchRecordingReward()
+        reward_fn.compute_batch = AsyncMock(return_value=[RewardResult(reward=1.0)])
+        batcher = RewardBatcher(reward_fn, max_wait=0.01)
+        step_result = StepResult(observation=Observation())
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(batcher.compute(Action(message="q"), step_result) for _ in range(3)), return_exceptions=True
+            ),
+            timeout=5,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_evaluator_batches_rewards(self, tmp_path):
+        reward_fn = BatchRecordingReward()
+
+        class RolloutEnv(Environment):
+            async def rollout(self, action):
+                await asyncio.sleep(0.01)
+                return StepResult(observation=Observation(), termination_reason=TerminationReason.TASK_COMPLETE)
+
+        envs = []
+
+        async def factory(action):
+            envs.append(RolloutEnv(model_factory=MagicMock(), reward_fn=reward_fn))
+            return envs[-1]
+
+        evaluator = Evaluator(
+            env_factory=factory, n_samples_per_prompt=4, max_concurrency=4, output_path=tmp_path / "results.jsonl"
+        )
+        results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p1"))])
+
+        assert reward_fn.batch_sizes == [4]
+        assert all(s.step_result.reward.reward == 1.0 for s in results["p1"])
+        # The batcher is scoped to the samples using it
+        assert all(env.reward_fn is reward_fn for env in envs)
+        assert evaluator._reward_batchers == {}
+        assert evaluator._reward_batch_totals == {"BatchRecordingReward": [1, 4]}
+
+    async def test_pooled_environments_get_their_reward_fn_back(self, tmp_path):
+        reward_fn = BatchRecordingReward()
+        envs = []
+
+        class RolloutEnv(Environment):
+            async def rollout(self, action):
+                return StepResult(observation=Observation(), termination_reason=TerminationReason.TASK_COMPLETE)
+
+        async def factory(action):
+            envs.append(RolloutEnv(model_factory=MagicMock(), reward_fn=reward_fn))
+            return envs[-1]
+
+        evaluator = Evaluator(
+            env_factory=factory,
+            env_pool=EnvironmentPool(factory),
+            n_samples_per_prompt=3,
+            max_concurrency=2,
+            output_path=tmp_path / "results.jsonl",
+        )
+        await evaluator.run([Action(message="q", task_context=TaskContext(id=f"p{i}")) for i in range(3)])
+
+        assert sum(reward_fn.batch_sizes) == 9
+        assert envs and all(env.reward_fn is reward_fn for env in envs)
+        assert evaluator._reward_batchers == {}
+
+
+# ---------------------------------------------------------------------------
+# Early stopping
+# ---------------------------------------------------------------------------
+
+
+class TestEarlyStopping:
+    @staticmethod
+    def make_factory(calls: list[str]):
+        """p0 always passes, p1 always fails, p2 alternates."""
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+
+            async def step(action):
+                sample_id = action.task_context.id
+                calls.append(sample_id)
+                prompt_id, _, idx = sample_id.rpartition("_")
+                reward = {"p0": 1.0, "p1": 0.0}.get(prompt_id, float(int(idx) % 2))
+                return StepResult(observation=Observation(), reward=RewardResult(reward=reward))
+
+            env.step = step
+            return env
+
+        return factory
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(5, 10, 0.95)
+        assert low == pytest.approx(0.2366, abs=1e-3)
+        assert high == pytest.approx(0.7634, abs=1e-3)
+        assert wilson_interval(0, 0, 0.95) == (0.0, 1.0)
+
+    def test_is_decided(self):
+        policy = EarlyStopping(min_samples=4)
+        assert not policy.is_decided(3, 3)
+        assert not policy.is_decided(6, 6)
+        assert policy.is_decided(7, 7)
+        assert policy.is_decided(7, 0)
+        assert not policy.is_decided(20, 10)
+
+    def test_invalid_policy_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="tolerance"):
+            EarlyStopping(tolerance=0.5)
+        with pytest.raises(ValueError, match="schedule"):
+            Evaluator(
+                env_factory=self.make_factory([]),
+                output_path=tmp_path / "r.jsonl",
+                schedule="prompt",
+                early_stopping=EarlyStopping(),
+            )
+
+    async def test_stops_decided_prompts(self, tmp_path):
+        calls: list[str] = []
+        evaluator = Evaluator(
+            env_factory=self.make_factory(calls),
+            max_concurrency=1,
+            n_samples_per_prompt=10,
+            output_path=tmp_path / "results.jsonl",
+            early_stopping=EarlyStopping(),
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3)]
+        results = await evaluator.run(actions)
+
+        assert {pid: len(samples) for pid, samples in results.items()} == {"p0": 7, "p1": 7, "p2": 10}
+        # Samples are issued round by round
+        assert calls[:3] == ["p0_0", "p1_0", "p2_0"]
+
+        metrics = evaluator.compute_metrics(results, log=False)
+        assert metrics["pass@1"] == pytest.approx((1.0 + 0.0 + 0.5) / 3)
+        assert metrics["pass@10"] == pytest.approx((1.0 + 0.0 + 1.0) / 3)
+
+    async def test_second_run_starts_from_fresh_outcomes(self, tmp_path):
+        calls: list[str] = []
+        evaluator = Evaluator(
+            env_factory=self.make_factory(calls),
+            max_concurrency=1,
+            n_samples_per_prompt=10,
+            output_path=tmp_path / "results.jsonl",
+            early_stopping=EarlyStopping(),
+        )
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3)]
+        await evaluator.run(actions)
+        evaluator.store.clear()
+
+        results = await evaluator.run(actions)
+        assert {pid: len(samples) for pid, samples in results.items()} == {"p0": 7, "p1": 7, "p2": 10}
+
+    async def test_streaming_dispatches_round_by_round_in_windows(self, tmp_path):
+        """Streaming keeps early stopping effective by issuing rounds within windows of prompts."""
+        calls: list[str] = []
+        evaluator = Evaluator(
+            env_factory=self.make_factory(calls),
+            max_concurrency=1,
+            n_samples_per_prompt=10,
+            output_path=tmp_path / "results.jsonl",
+            streaming=True,
+            early_stopping=EarlyStopping(),
+        )
+        actions = (Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(3))
+        await evaluator.run(actions)
+
+        # With one worker the window is two prompts: p0 and p1 are interleaved and decided, then p2 runs
+        assert calls[:4] == ["p0_0", "p1_0", "p0_1", "p1_1"]
+        assert sum(c.startswith(("p0", "p1")) for c in calls) == 14
+        assert sum(c.startswith("p2") for c in calls) == 10
+
+    async def test_resumed_samples_count(self, tmp_path):
+        output_path = tmp_path / "results.jsonl"
+        actions = [Action(message="q", task_context=TaskContext(id="p0"))]
+        await Evaluator(env_factory=self.make_factory([]), n_samples_per_prompt=7, output_path=output_path).run(actions)
+
+        calls: list[str] = []
+        evaluator = Evaluator(
+            env_factory=self.make_factory(calls),
+            n_samples_per_prompt=10,
+            output_path=output_path,
+            early_stopping=EarlyStopping(),
+        )
+        results = await evaluator.run(actions)
+        assert calls == []
+        assert len(results["p0"]) == 7
+
+
+# ---------------------------------------------------------------------------
+# Distributed work queue
+# ---------------------------------------------------------------------------
+
+
+class TestWorkQueue:
+    @staticmethod
+    def make_sample(sample_id: str) -> EvalSample:
+        return EvalSample(
+            action=Action(message="q", task_context=TaskContext(id=sample_id)),
+            step_result=StepResult(observation=Observation(), reward=RewardResult(reward=1.0)),
+        )
+
+    def test_enqueue_is_idempotent(self, tmp_path):
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        units = [WorkUnit("p1", 0), WorkUnit("p1", 1)]
+        assert queue.enqueue(units) == 2
+        assert queue.enqueue(units) == 0
+        assert queue.counts() == {"pending": 2}
+
+    def test_lease_is_exclusive_and_expires(self, tmp_path):
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        queue.enqueue([WorkUnit("p1", 0), WorkUnit("p1", 1)])
+
+        assert queue.lease("w1", 1, lease_seconds=60) == [WorkUnit("p1", 0)]
+        assert queue.lease("w2", 5, lease_seconds=60) == [WorkUnit("p1", 1)]
+        assert queue.lease("w3", 5, lease_seconds=60) == []
+
+        # Expired leases are handed to other workers
+        queue.heartbeat("w1", ["p1_0"], lease_seconds=-1)
+        assert queue.lease("w3", 5, lease_seconds=60) == [WorkUnit("p1", 0)]
+
+    def test_complete_first_wins(self, tmp_path):
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        queue.enqueue([WorkUnit("p1", 0)])
+        unit = queue.lease("w1", 1, lease_seconds=60)[0]
+
+        assert queue.complete("w1", unit, self.make_sample("p1_0"))
+        assert not queue.complete("w2", unit, self.make_sample("p1_0"))
+        assert queue.is_finished()
+        assert [(pid, s.action.task_context.id) for pid, s in queue.iter_results()] == [("p1", "p1_0")]
+
+    def test_fail_retries_until_max_attempts(self, tmp_path):
+        queue = SQLiteWorkQueue(tmp_path / "queue.db", max_attempts=2)
+        queue.enqueue([WorkUnit("p1", 0)])
+
+        queue.fail("w1", queue.lease("w1", 1, lease_seconds=60)[0], "boom")
+        assert queue.counts() == {"pending": 1}
+        queue.fail("w1", queue.lease("w1", 1, lease_seconds=60)[0], "boom")
+        assert queue.counts() == {"failed": 1}
+        assert queue.is_finished()
+
+    async def test_workers_drain_queue(self, tmp_path):
+        """Concurrent workers share the queue; a failing sample is retried and results are collected once."""
+        calls: list[str] = []
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.cleanup = AsyncMock()
+
+            async def step(action):
+                calls.append(action.task_context.id)
+                if calls.count("p0_0") == 1 and action.task_context.id == "p0_0":
+                    raise RuntimeError("transient")
+                return StepResult(observation=Observation(), reward=RewardResult(reward=1.0))
+
+            env.step = step
+            return env
+
+        actions = [Action(message=f"q{i}", task_context=TaskContext(id=f"p{i}")) for i in range(5)]
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        evaluators = [
+            Evaluator(
+                env_factory=factory, max_concurrency=2, n_samples_per_prompt=2, output_path=tmp_path / f"w{i}.jsonl"
+            )
+            for i in range(2)
+        ]
+        for evaluator in evaluators:
+            enqueue(evaluator, queue, actions)
+
+        completed = await asyncio.gather(
+            *(run_worker(e, queue, actions, worker_id=f"w{i}", poll_interval=0.01) for i, e in enumerate(evaluators))
+        )
+
+        assert sum(completed) == 10
+        assert calls.count("p0_0") == 2
+        assert queue.counts() == {"done": 10}
+        # Exactly one worker collects
+        assert [queue.claim_collection(f"w{i}") for i in range(2)] == [True, False]
+        assert queue.claim_collection("w0")
+        assert collect(evaluators[0], queue) == 10
+        assert evaluators[0].compute_metrics(log=False)["pass@2"] == 1.0
+
+        # Reusing the queue for more samples: a new worker collects them
+        evaluator = Evaluator(
+            env_factory=factory, n_samples_per_prompt=3, output_path=tmp_path / "w2.jsonl", max_concurrency=2
+        )
+        assert enqueue(evaluator, queue, actions) == 5
+        assert queue.claim_collection("w2") is False  # Nothing new has finished yet
+        assert await run_worker(evaluator, queue, actions, worker_id="w2", poll_interval=0.01) == 5
+        assert [queue.claim_collection(w) for w in ["w2", "w0"]] == [True, False]
+
 
 # ---------------------------------------------------------------------------
 # pass@k metric
@@ -271,6 +1212,15 @@ class TestPassAtKMetric:
         result = compute_pass_at_k(results, k_values=[5])
         assert result["pass@5"] == 0.0  # No problems have enough samples
 
+    def test_extrapolate_fewer_samples_than_k(self):
+        results = {
+            "p1": [self._make_sample(1.0, i) for i in range(3)],
+            "p2": [self._make_sample(1.0 if i == 0 else 0.0, i) for i in range(2)],
+        }
+        result = compute_pass_at_k(results, k_values=[4], extrapolate=True)
+        # p1: all pass -> 1.0; p2: 1 - (1 - 1/2)^4 = 0.9375
+        assert result["pass@4"] == pytest.approx((1.0 + 0.9375) / 2)
+
     def test_none_reward_handled(self):
         """Samples with None reward are treated as incorrect."""
         sample = EvalSample(
@@ -294,6 +1244,22 @@ class TestPassAtKMetric:
         # pass@5 = 1 - C(9,5)/C(10,5) = 0.5
         assert result["pass@5"] == pytest.approx(0.5)
 
+    def test_vectorized_scores_match_scalar_estimator(self):
+        n = [10, 10, 7, 3, 0]
+        c = [1, 0, 7, 2, 0]
+        scores, valid = pass_at_k_scores(n, c, [1, 5, 8])
+        assert scores[0].tolist() == pytest.approx([0.1, 0.5, 0.8])
+        assert scores[1].tolist() == [0.0, 0.0, 0.0]
+        assert scores[2].tolist() == [1.0, 1.0, 0.0]
+        assert valid.tolist() == [[True] * 3, [True] * 3, [True, True, False], [True, False, False], [False] * 3]
+
+    def test_bootstrap_interval(self):
+        results = {f"p{j}": [self._make_sample(1.0 if i < j % 4 else 0.0, i) for i in range(4)] for j in range(40)}
+        result = compute_pass_at_k(results, k_values=[1, 4], bootstrap=200, seed=1)
+        for k in (1, 4):
+            assert result[f"pass@{k}_ci_low"] < result[f"pass@{k}"] < result[f"pass@{k}_ci_high"]
+        assert compute_pass_at_k(results, k_values=[1, 4], bootstrap=200, seed=1) == result
+
 
 class TestComputeMetrics:
     def _make_sample(self, reward: float, idx: int = 0) -> EvalSample:
@@ -327,6 +1293,109 @@ class TestComputeMetrics:
         assert metrics["pass@1"] == 1.0
 
 
+# ---------------------------------------------------------------------------
+# Metric accumulators
+# ---------------------------------------------------------------------------
+
+
+class TestMetricAccumulators:
+    @staticmethod
+    def make_sample(reward: float | None, reason=TerminationReason.TASK_COMPLETE, metrics=None) -> EvalSample:
+        return EvalSample(
+            action=Action(message="q"),
+            step_result=StepResult(
+                observation=Observation(metrics=metrics or {}),
+                reward=RewardResult(reward=reward) if reward is not None else None,
+                termination_reason=reason,
+            ),
+        )
+
+    def test_pass_at_k_matches_batch_computation(self):
+        rng = random.Random(0)
+        results = {
+            f"p{j}": [self.make_sample(float(rng.random() < 0.4)) for _ in range(rng.randint(1, 8))] for j in range(30)
+        }
+        accumulator = PassAtKAccumulator(k_values=[1, 4, 8], extrapolate=True)
+        for prompt_id, samples in results.items():
+            for sample in samples:
+                accumulator.update(prompt_id, sample)
+        expected = compute_pass_at_k(results, k_values=[1, 4, 8], extrapolate=True)
+        assert accumulator.snapshot() == pytest.approx(expected)
+        assert accumulator(results) == pytest.approx(expected)
+
+    def test_reward_termination_and_usage(self):
+        samples = [
+            self.make_sample(1.0, metrics={"model_calls": 2, "input_tokens": {"total": 100}}),
+            self.make_sample(0.0, metrics={"model_calls": 4, "input_tokens": None}),
+            self.make_sample(None, reason=TerminationReason.TIMEOUT),
+        ]
+        results = {"p1": samples}
+        assert RewardAccumulator()(results) == {"reward_mean": 0.5, "reward_missing": pytest.approx(1 / 3)}
+        assert TerminationAccumulator()(results) == {
+            "termination/task_complete": pytest.approx(2 / 3),
+            "termination/timeout": pytest.approx(1 / 3),
+        }
+        assert UsageAccumulator()(results) == {"model_calls_mean": 3.0, "input_tokens_mean": 100.0}
+
+    async def test_evaluator_live_metrics_include_resumed_samples(self, tmp_path):
+        rewards = iter([1.0, 0.0, 1.0, 1.0])
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.step = AsyncMock(
+                return_value=StepResult(observation=Observation(), reward=RewardResult(reward=next(rewards)))
+            )
+            env.cleanup = AsyncMock()
+            return env
+
+        output_path = tmp_path / "results.jsonl"
+        actions = [Action(message="q", task_context=TaskContext(id="p1"))]
+        await Evaluator(env_factory=factory, n_samples_per_prompt=2, output_path=output_path).run(actions)
+
+        evaluator = Evaluator(env_factory=factory, n_samples_per_prompt=4, output_path=output_path, streaming=True)
+        await evaluator.run(actions)
+        live = evaluator.live_metrics()
+        assert live["reward_mean"] == 0.75
+        assert live["termination/not_terminated"] == 1.0
+        assert live["pass@1"] == pytest.approx(evaluator.compute_metrics(log=False)["pass@1"])
+
+    async def test_resume_reads_only_the_index(self, tmp_path, monkeypatch):
+        """Resuming with early stopping and accumulators parses no saved sample until live metrics are read."""
+        import strands_env.eval.storage as storage
+
+        async def factory(action):
+            env = MagicMock()
+            env.reset = AsyncMock()
+            env.step = AsyncMock(return_value=StepResult(observation=Observation(), reward=RewardResult(reward=1.0)))
+            env.cleanup = AsyncMock()
+            return env
+
+        output_path = tmp_path / "results.jsonl"
+        actions = [Action(message="q", task_context=TaskContext(id=f"p{i}")) for i in range(5)]
+        await Evaluator(env_factory=factory, n_samples_per_prompt=7, output_path=output_path).run(actions)
+
+        parsed = []
+        sample_from_dict = storage._sample_from_dict
+        monkeypatch.setattr(
+            storage, "_sample_from_dict", lambda data, **kwargs: parsed.append(1) or sample_from_dict(data, **kwargs)
+        )
+        evaluator = Evaluator(
+            env_factory=factory,
+            n_samples_per_prompt=10,
+            output_path=output_path,
+            streaming=True,
+            early_stopping=EarlyStopping(),
+        )
+        await evaluator.run(actions)
+        assert parsed == []
+        # The resumed all-pass samples decided every prompt
+        assert len(evaluator.completed_ids) == 35
+
+        assert evaluator.live_metrics()["reward_mean"] == 1.0
+        assert len(parsed) == 35
+
+
 # ---------------------------------------------------------------------------
 # AIMEEvaluator
 # ---------------------------------------------------------------------------
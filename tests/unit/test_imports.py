@@ -0,0 +1,100 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cold-start import tests: heavy dependencies stay unloaded until used."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Generous wall-clock budget (seconds) for a cold import in a fresh interpreter
+IMPORT_TIME_BUDGET_S = 2.0
+
+HEAVY_MODULES = [
+    "boto3",
+    "botocore",
+    "httpx",
+    "transformers",
+    "numpy",
+    "trafilatura",
+    "tiktoken",
+    "html2text",
+    "strands.models.bedrock",
+    "strands.models.openai",
+    "strands_env.core.environment",
+    "strands_env.eval.evaluator",
+]
+
+
+def cold_import(*statements: str) -> dict:
+    """Run `statements` in a fresh interpreter; return elapsed seconds and loaded heavy modules."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        + "\n".join(statements)
+        + "\nelapsed = time.perf_counter() - start\n"
+        + f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+# ---------------------------------------------------------------------------
+# Lazy imports
+# ---------------------------------------------------------------------------
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import strands_env.core.models",
+            "import strands_env.tools",
+            "from strands_env.eval import list_benchmarks",
+            "import strands_env.cli",
+        ],
+    )
+    def test_no_heavy_imports(self, statement):
+        result = cold_import(statement)
+        assert result["loaded"] == []
+        assert result["elapsed"] < IMPORT_TIME_BUDGET_S
+
+    def test_core_types_add_nothing_beyond_strands(self):
+        # The core types are pydantic models over Strands message types, and importing any
+        # `strands` module runs its package `__init__`, which loads boto3 and the Bedrock model
+        baseline = cold_import("import strands")
+        result = cold_import("from strands_env.core import Action, ModelFactory, StepResult")
+        assert set(result["loaded"]) <= set(baseline["loaded"])
+
+    def test_lazy_attributes_resolve(self):
+        result = cold_import(
+            "from strands_env.core import Environment, TokenArrays",
+            "from strands_env.eval import Evaluator, ResultStore",
+            "from strands_env.core.models import DEFAULT_BOTO_CLIENT_CONFIG, DEFAULT_OPENAI_CLIENT_ARGS",
+            "assert DEFAULT_BOTO_CLIENT_CONFIG.max_pool_connections == 100",
+            "assert DEFAULT_OPENAI_CLIENT_ARGS['max_retries'] == 5",
+        )
+        assert {"numpy", "strands_env.core.environment", "strands_env.eval.evaluator"} <= set(result["loaded"])
+
+    def test_unknown_attribute_raises(self):
+        import strands_env.core
+        import strands_env.tools
+
+        with pytest.raises(AttributeError):
+            strands_env.core.NotAThing
+        with pytest.raises(AttributeError):
+            strands_env.tools.NotAToolkit
+        assert "WebScraperToolkit" in dir(strands_env.tools)
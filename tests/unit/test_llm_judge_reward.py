@@ -0,0 +1,227 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for LLMJudgeReward."""
+
+import asyncio
+from typing import Literal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+from strands.types.exceptions import ModelThrottledException
+
+from strands_env.core.types import Action, Observation, StepResult, TaskContext
+from strands_env.rewards.llm_judge_reward import LLMJudgeReward
+
+
+class Grade(BaseModel):
+    grade: Literal["correct", "incorrect"]
+
+
+class GradeReward(LLMJudgeReward):
+    judgment_format = Grade
+
+    def __init__(self, *args, delay: float = 0.0, fail: bool = False, throttle: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+        self.throttle = throttle
+        self.active = 0
+        self.max_active = 0
+
+    async def get_judge_prompt(self, action, step_result):
+        return f"Q: {action.message}\nA: {step_result.observation.final_response}"
+
+    async def get_reward(self, judgment):
+        return 1.0 if judgment.grade == "correct" else 0.0
+
+    async def invoke_judge(self, prompt):
+        self.calls += 1
+        if self.throttle:
+            self.throttle -= 1
+            raise ModelThrottledException("Too many requests")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("judge unavailable")
+        return Grade(grade="correct" if prompt.endswith("Paris") else "incorrect")
+
+
+def make_judge_model(model_id: str = "judge-v1"):
+    model = MagicMock()
+    model.get_config.return_value = {"model_id": model_id}
+    return model
+
+
+def make_sample(answer: str, question: str = "Capital of France?") -> tuple[Action, StepResult]:
+    action = Action(message=question, task_context=TaskContext(ground_truth="Paris"))
+    messages = [{"role": "assistant", "content": [{"text": answer}]}]
+    return action, StepResult(observation=Observation(messages=messages))
+
+
+# ---------------------------------------------------------------------------
+# Judgment cache
+# ---------------------------------------------------------------------------
+
+
+class TestJudgmentCache:
+    async def test_identical_prompts_reuse_judgment(self):
+        fn = GradeReward(make_judge_model(), cache_size=100)
+        results = [await fn.compute(*make_sample(answer)) for answer in ["Paris", "Paris", "Lyon"]]
+
+        assert [r.reward for r in results] == [1.0, 1.0, 0.0]
+        assert [r.info["judge_cache"] for r in results] == ["miss", "hit", "miss"]
+        assert results[1].info["judgment"] == {"grade": "correct"}
+        assert fn.calls == 2
+        assert fn.cache_stats()["judge_calls"] == 2
+
+    async def test_concurrent_identical_prompts_coalesce(self):
+        fn = GradeReward(make_judge_model(), delay=0.05, throttle=1, retry_base_delay=0.001, cache_size=100)
+        results = await asyncio.gather(*(fn.compute(*make_sample("Paris")) for _ in range(4)))
+
+        assert fn.calls == 2
+        assert sorted(r.info["judge_cache"] for r in results) == ["coalesced"] * 3 + ["miss"]
+        assert fn.cache_stats()["judge_coalesced"] == 3
+        # Merged callers report the stats of the shared call
+        assert [r.info["judge_retries"] for r in results] == [1] * 4
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        fn = GradeReward(make_judge_model(), delay=0.05, cache_size=100)
+        first = asyncio.create_task(fn.compute(*make_sample("Paris")))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(fn.compute(*make_sample("Paris")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert (await second).reward == 1.0
+        assert fn.calls == 1
+
+    async def test_failures_not_cached(self):
+        fn = GradeReward(make_judge_model(), fail=True, cache_size=100)
+        result = await fn.compute(*make_sample("Paris"))
+        assert result.info["reason"] == "judge_error"
+        fn.fail = False
+        assert (await fn.compute(*make_sample("Paris"))).reward == 1.0
+        assert fn.calls == 2
+
+    def test_key_depends_on_model_and_system_prompt(self):
+        base = GradeReward(make_judge_model()).cache_key("p")
+        assert GradeReward(make_judge_model()).cache_key("p") == base
+        assert GradeReward(make_judge_model("judge-v2")).cache_key("p") != base
+        assert GradeReward(make_judge_model(), system_prompt="Be strict.").cache_key("p") != base
+
+    async def test_disabled_by_default(self):
+        fn = GradeReward(make_judge_model())
+        results = [await fn.compute(*make_sample("Paris")) for _ in range(2)]
+        assert fn.calls == 2
+        assert "judge_cache" not in results[0].info
+
+    async def test_disk_cache_persists(self, tmp_path):
+        path = tmp_path / "judge.sqlite"
+        first = GradeReward(make_judge_model(), cache_path=path)
+        await first.compute(*make_sample("Paris"))
+
+        second = GradeReward(make_judge_model(), cache_path=path)
+        result = await second.compute(*make_sample("Paris"))
+        assert result.info["judge_cache"] == "disk_hit"
+        assert result.reward == 1.0
+        assert second.calls == 0
+
+
+# ---------------------------------------------------------------------------
+# Concurrency, rate limits and retries
+# ---------------------------------------------------------------------------
+
+
+class TestJudgeLimits:
+    async def test_max_concurrency(self):
+        fn = GradeReward(make_judge_model(), delay=0.02, max_concurrency=2, cache_size=0)
+        results = await asyncio.gather(*(fn.compute(*make_sample("Paris", f"Q{i}")) for i in range(6)))
+
+        assert fn.max_active == 2
+        assert all(r.reward == 1.0 for r in results)
+        assert max(r.info["judge_queue_time"] for r in results) > 0.03
+        assert fn.limit_stats()["judge_attempts"] == 6
+
+    async def test_requests_per_minute(self):
+        fn = GradeReward(make_judge_model(), requests_per_minute=1200, cache_size=0)
+        fn.request_bucket.tokens = 1  # Start with an almost empty bucket
+        results = await asyncio.gather(*(fn.compute(*make_sample("Paris", f"Q{i}")) for i in range(3)))
+        # 20 requests/s: the second and third wait ~50ms and ~100ms
+        assert sorted(r.info["judge_queue_time"] for r in results)[-1] > 0.08
+
+    async def test_tokens_per_minute_charges_estimate(self):
+        fn = GradeReward(make_judge_model(), tokens_per_minute=60_000, cache_size=0)
+        await fn.compute(*make_sample("Paris"))
+        prompt = await fn.get_judge_prompt(*make_sample("Paris"))
+        # The bucket refills at 1000 tokens/s, so allow for a few ms of refill
+        assert fn.token_bucket.tokens == pytest.approx(60_000 - fn.estimate_tokens(prompt), abs=20)
+
+    async def test_throttled_calls_are_retried(self):
+        fn = GradeReward(make_judge_model(), throttle=2, retry_base_delay=0.001)
+        result = await fn.compute(*make_sample("Paris"))
+
+        assert result.reward == 1.0
+        assert result.info["judge_retries"] == 2
+        assert fn.calls == 3
+        assert fn.limit_stats()["judge_retries"] == 2
+
+    async def test_retries_exhausted(self):
+        fn = GradeReward(make_judge_model(), throttle=5, max_retries=1, retry_base_delay=0.001)
+        result = await fn.compute(*make_sample("Paris"))
+
+        assert result.info["reason"] == "judge_error"
+        assert result.info["judge_retries"] == 1
+        assert fn.calls == 2
+
+    async def test_other_errors_not_retried(self):
+        fn = GradeReward(make_judge_model(), fail=True)
+        result = await fn.compute(*make_sample("Paris"))
+        assert result.info["judge_retries"] == 0
+        assert fn.calls == 1
+
+    async def test_cache_hits_report_no_call_metrics(self):
+        fn = GradeReward(make_judge_model(), cache_size=100)
+        await fn.compute(*make_sample("Paris"))
+        result = await fn.compute(*make_sample("Paris"))
+        assert "judge_queue_time" not in result.info
+
+
+# ---------------------------------------------------------------------------
+# Judge invocation
+# ---------------------------------------------------------------------------
+
+
+class TestInvokeJudge:
+    @patch("strands_env.rewards.llm_judge_reward.Agent")
+    async def test_text_judgment(self, mock_agent_cls):
+        class TextReward(LLMJudgeReward):
+            async def get_judge_prompt(self, action, step_result):
+                return "Rate it."
+
+            async def get_reward(self, judgment):
+                return float(judgment)
+
+        mock_agent_cls.return_value.invoke_async = AsyncMock(
+            return_value=MagicMock(message={"content": [{"text": "0.5"}]})
+        )
+        fn = TextReward(make_judge_model())
+        result = await fn.compute(*make_sample("Paris"))
+        assert result.reward == 0.5
+        assert result.info["judgment"] == "0.5"
@@ -16,8 +16,11 @@
 
 from dataclasses import dataclass
 
+import pytest
+
 from strands_env.core.types import Action, TaskContext, TerminationReason
 from strands_env.rewards.math_verify_reward import MathVerifyReward
+from strands_env.utils.process_pool import WorkerCrashedError
 
 
 @dataclass
@@ -159,3 +162,102 @@ class TestEdgeCases:
         assert "gold_parsed" in result.info
         assert "answer_parsed" in result.info
         assert "ground_truth" in result.info
+
+
+class TestCaching:
+    """Ground-truth parse cache and outcome cache."""
+
+    async def test_outcome_cached_per_answer(self):
+        fn = MathVerifyReward()
+        for _ in range(3):
+            result = await fn.compute(make_action("4"), make_step_result("$\\boxed{4}$"))
+            assert result.reward == 1.0
+        await fn.compute(make_action("4"), make_step_result("$\\boxed{5}$"))
+        stats = fn.cache_stats()
+        assert stats["verify_cache_hits"] == 2
+        assert stats["verify_cache_misses"] == 2
+        assert stats["verify_cache_hit_rate"] == 0.5
+
+    async def test_gold_parsed_once(self, monkeypatch):
+        from strands_env.rewards import math_verify_reward
+
+        monkeypatch.setattr(math_verify_reward, "_GOLD_CACHE", math_verify_reward.LRUCache(16))
+        fn = MathVerifyReward(verify_cache_size=0)
+        for answer in ["4", "5", "6"]:
+            await fn.compute(make_action("4"), make_step_result(f"$\\boxed{{{answer}}}$"))
+        stats = fn.cache_stats()
+        assert (stats["gold_cache_hits"], stats["gold_cache_misses"]) == (2, 1)
+
+    async def test_gold_failure_cached(self, monkeypatch):
+        from strands_env.rewards import math_verify_reward
+
+        monkeypatch.setattr(math_verify_reward, "_GOLD_CACHE", math_verify_reward.LRUCache(16))
+        fn = MathVerifyReward(verify_cache_size=0)
+        for _ in range(2):
+            result = await fn.compute(make_action("no math here"), make_step_result("$\\boxed{4}$"))
+            assert result.info["reason"] == "gold_parse_failed"
+        assert fn.cache_stats()["gold_cache_hits"] == 1
+
+    async def test_cached_result_reports_own_response(self):
+        fn = MathVerifyReward(answer_tail_chars=10)
+        first = await fn.compute(make_action("4"), make_step_result("First thoughts. I don't know."))
+        second = await fn.compute(make_action("4"), make_step_result("Other thoughts. I don't know."))
+        assert fn.cache_stats()["verify_cache_hits"] == 1
+        assert first.info["response"] == "First thoughts. I don't know."
+        assert second.info["response"] == "Other thoughts. I don't know."
+
+
+class TestComputeBatch:
+    async def test_dedupes_identical_answers(self):
+        fn = MathVerifyReward()
+        responses = ["$\\boxed{4}$", "$\\boxed{5}$", "$\\boxed{4}$", "$\\boxed{4}$"]
+        results = await fn.compute_batch([(make_action("4"), make_step_result(r)) for r in responses])
+
+        assert [r.reward for r in results] == [1.0, 0.0, 1.0, 1.0]
+        stats = fn.cache_stats()
+        assert stats["verify_cache_misses"] == 2
+        assert stats["verify_cache_hits"] == 2
+
+    async def test_invalid_samples_in_batch(self):
+        fn = MathVerifyReward()
+        results = await fn.compute_batch(
+            [(make_action(None), make_step_result("4")), (make_action("4"), make_step_result("4"))]
+        )
+        assert [r.reward for r in results] == [0.0, 1.0]
+
+
+class TestWorkerProcesses:
+    """Parsing and verification in worker processes."""
+
+    @pytest.fixture
+    async def fn(self):
+        fn = MathVerifyReward(num_workers=1)
+        yield fn
+        await fn.aclose()
+
+    async def test_matches_inline(self, fn):
+        inline = MathVerifyReward()
+        for gold, response in [("4", "$\\boxed{4}$"), ("4", "$\\boxed{5}$"), ("4", "I don't know.")]:
+            action, step = make_action(gold), make_step_result(response)
+            assert await fn.compute(action, step) == await inline.compute(action, step)
+
+    async def test_timeout_returns_zero(self, fn, monkeypatch):
+        async def never_finishes(*args, timeout=None, **kwargs):
+            raise TimeoutError
+
+        monkeypatch.setattr(fn.pool, "run", never_finishes)
+        result = await fn.compute(make_action("4"), make_step_result("$\\boxed{4}$"))
+        assert result.reward == 0.0
+        assert result.info["reason"] == "timeout"
+
+    async def test_worker_crash_returns_zero(self, fn, monkeypatch):
+        async def crashes(*args, timeout=None, **kwargs):
+            raise WorkerCrashedError("Worker died while running the task; worker replaced")
+
+        monkeypatch.setattr(fn.pool, "run", crashes)
+        result = await fn.compute(make_action("4"), make_step_result("$\\boxed{4}$"))
+        assert result.reward == 0.0
+        assert result.info["reason"] == "worker_crashed"
+
+    def test_default_task_timeout(self):
+        assert MathVerifyReward(parse_timeout=2, verify_timeout=3).task_timeout == 12
@@ -69,7 +69,7 @@ class TestSGLangModelFactory:
 
 
 class TestBedrockModelFactory:
-    @patch("strands_env.core.models.BedrockModel")
+    @patch("strands.models.bedrock.BedrockModel")
     def test_returns_callable(self, mock_bedrock_cls):
         import boto3
 
@@ -79,7 +79,7 @@ class TestBedrockModelFactory:
         )
         assert callable(factory)
 
-    @patch("strands_env.core.models.BedrockModel")
+    @patch("strands.models.bedrock.BedrockModel")
     def test_remaps_max_new_tokens(self, mock_bedrock_cls):
         import boto3
 
@@ -96,7 +96,7 @@ class TestBedrockModelFactory:
         assert call_kwargs["max_tokens"] == 2048
         assert call_kwargs["temperature"] == 0.7
 
-    @patch("strands_env.core.models.BedrockModel")
+    @patch("strands.models.bedrock.BedrockModel")
     def test_does_not_mutate_default_params(self, mock_bedrock_cls):
         import boto3
 
@@ -107,7 +107,7 @@ class TestBedrockModelFactory:
         )
         assert DEFAULT_SAMPLING_PARAMS == original
 
-    @patch("strands_env.core.models.BedrockModel")
+    @patch("strands.models.bedrock.BedrockModel")
     def test_shared_client_across_instances(self, mock_bedrock_cls):
         """All models from the same factory should share a single boto3 client."""
         import boto3
@@ -131,12 +131,12 @@ class TestBedrockModelFactory:
 
 
 class TestOpenAIModelFactory:
-    @patch("strands_env.core.models.OpenAIModel")
+    @patch("strands.models.openai.OpenAIModel")
     def test_returns_callable(self, mock_openai_cls):
         factory = openai_model_factory(model_id="gpt-4o")
         assert callable(factory)
 
-    @patch("strands_env.core.models.OpenAIModel")
+    @patch("strands.models.openai.OpenAIModel")
     def test_remaps_max_new_tokens(self, mock_openai_cls):
         factory = openai_model_factory(
             model_id="gpt-4o",
@@ -148,7 +148,7 @@ class TestOpenAIModelFactory:
         assert call_kwargs["params"]["max_tokens"] == 4096
         assert "max_new_tokens" not in call_kwargs["params"]
 
-    @patch("strands_env.core.models.OpenAIModel")
+    @patch("strands.models.openai.OpenAIModel")
     def test_does_not_mutate_default_params(self, mock_openai_cls):
         original = dict(DEFAULT_SAMPLING_PARAMS)
         openai_model_factory(model_id="gpt-4o")
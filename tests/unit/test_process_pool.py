@@ -0,0 +1,131 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the asyncio process pool."""
+
+import asyncio
+import atexit
+import math
+import os
+import time
+
+import pytest
+
+from strands_env.utils.process_pool import WorkerCrashedError, WorkerPool, WorkerPoolFullError
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def factory(*args, **kwargs) -> WorkerPool:
+        pool = WorkerPool(*args, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+class TestWorkerPool:
+    async def test_runs_in_worker_process(self, make_pool):
+        pool = make_pool(2)
+        assert await pool.run(math.sqrt, 16.0) == 4.0
+        assert await pool.run(os.getpid) != os.getpid()
+
+    async def test_exception_propagates(self, make_pool):
+        pool = make_pool(1)
+        with pytest.raises(ValueError):
+            await pool.run(int, "not a number")
+        assert await pool.run(int, "7") == 7
+
+    async def test_timeout_kills_worker(self, make_pool):
+        pool = make_pool(1)
+        pid = await pool.run(os.getpid)
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await pool.run(time.sleep, 30, timeout=0.5)
+        assert time.perf_counter() - start < 5
+        assert pool.timeouts == 1
+        assert await pool.run(os.getpid) != pid
+
+    async def test_does_not_block_event_loop(self, make_pool):
+        pool = make_pool(1)
+        await pool.run(os.getpid)  # Wait for the worker to start
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await pool.run(time.sleep, 0.5)
+        task.cancel()
+        assert ticks >= 20
+
+    async def test_recycles_workers(self, make_pool):
+        pool = make_pool(1, max_tasks_per_worker=2)
+        pids = [await pool.run(os.getpid) for _ in range(4)]
+        assert pids[0] == pids[1] != pids[2] == pids[3]
+        assert pool.recycled == 2
+
+    async def test_slow_exiting_worker_does_not_block_event_loop(self, make_pool):
+        pool = make_pool(1, max_tasks_per_worker=1)
+        await pool.run(os.getpid)  # Wait for the worker to start
+        start = time.perf_counter()
+        # The recycled worker sleeps in an exit handler, so it outlives the stop grace period
+        await pool.run(atexit.register, time.sleep, 30)
+        assert time.perf_counter() - start < 0.5
+        assert await pool.run(math.sqrt, 9.0) == 3.0
+
+    async def test_max_pending_rejects(self, make_pool):
+        pool = make_pool(1, max_pending=1)
+        busy = asyncio.create_task(pool.run(time.sleep, 1.0))
+        await asyncio.sleep(0.1)
+        waiting = asyncio.create_task(pool.run(os.getpid))
+        await asyncio.sleep(0.1)
+        with pytest.raises(WorkerPoolFullError):
+            await pool.run(os.getpid)
+        await asyncio.gather(busy, waiting)
+
+    async def test_cancelled_task_replaces_worker(self, make_pool):
+        pool = make_pool(1)
+        pid = await pool.run(os.getpid)
+        task = asyncio.create_task(pool.run(time.sleep, 30))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await pool.run(os.getpid) != pid
+
+    async def test_crashed_worker_raises_and_is_replaced(self, make_pool):
+        pool = make_pool(1)
+        with pytest.raises(WorkerCrashedError):
+            await pool.run(os._exit, 1)
+        assert await pool.run(math.sqrt, 4.0) == 2.0
+
+    async def test_aclose_stops_workers(self, make_pool):
+        pool = make_pool(2, max_tasks_per_worker=1)
+        await pool.run(os.getpid)  # Leaves one worker retiring in the background
+        processes = [worker.process for worker in [*pool._workers, *pool._retiring.values()]]
+        await pool.aclose()
+        assert not any(process.is_alive() for process in processes)
+        assert await pool.run(math.sqrt, 9.0) == 3.0
+
+    def test_invalid_num_workers(self):
+        with pytest.raises(ValueError):
+            WorkerPool(0)
@@ -0,0 +1,63 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from strands_env.utils.rate_limit import TokenBucket
+
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+
+class TestTokenBucket:
+    async def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        waits = [await bucket.acquire() for _ in range(3)]
+        assert max(waits) < 0.05
+
+    async def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        waited = await bucket.acquire()
+        assert waited == pytest.approx(0.05, abs=0.03)
+        assert time.monotonic() - start >= 0.04
+
+    async def test_amount_clamped_to_capacity(self):
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        assert await bucket.acquire(50) < 0.05
+
+    async def test_concurrent_waiters_are_spaced(self):
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        # One token at start, then one every 20ms
+        assert time.monotonic() - start >= 0.07
+
+    def test_per_minute(self):
+        bucket = TokenBucket.per_minute(120)
+        assert bucket.rate == 2.0
+        assert bucket.capacity == 120
+
+    def test_invalid_rate_raises(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1.0, capacity=0)
@@ -14,12 +14,16 @@
 
 """Unit tests for benchmark registry."""
 
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
 import pytest
 from click.testing import CliRunner
 
 from strands_env.cli import cli
-from strands_env.eval import Evaluator, get_benchmark, list_benchmarks
-from strands_env.eval.registry import _BENCHMARKS
+from strands_env.eval import Evaluator, get_benchmark, list_benchmarks, registry
+from strands_env.eval.registry import _BENCHMARKS, ENTRY_POINT_GROUP, MANIFEST_PATH, render_manifest
 from strands_env.eval.registry import register_eval as register_benchmark
 
 
@@ -72,6 +76,40 @@ class TestBenchmarkRegistry:
             _BENCHMARKS.pop(name, None)
 
 
+class TestLazyRegistry:
+    def test_manifest_up_to_date(self):
+        """The checked-in manifest matches the benchmark modules (regenerate with `python -m strands_env.eval.benchmarks`)."""
+        assert MANIFEST_PATH.read_text(encoding="utf-8") == render_manifest()
+
+    def test_list_imports_no_benchmark_module(self):
+        code = (
+            "import sys; from strands_env.eval import list_benchmarks, get_benchmark; "
+            "assert 'aime-2024' in list_benchmarks(); "
+            "assert not any(m.startswith('strands_env.eval.benchmarks.') and m != 'strands_env.eval.benchmarks._manifest' for m in sys.modules); "
+            "get_benchmark('aime-2024'); "
+            "assert 'strands_env.eval.benchmarks.aime' in sys.modules; "
+            "assert 'strands_env.eval.benchmarks.terminal_bench' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_entry_point_benchmark(self, monkeypatch):
+        name = "_test_entry_point_benchmark"
+        ep = EntryPoint(name=name, value="strands_env.eval.evaluator:Evaluator", group=ENTRY_POINT_GROUP)
+        monkeypatch.setattr(registry, "_ENTRY_POINTS", {name: ep})
+        try:
+            assert name in list_benchmarks()
+            assert get_benchmark(name) is Evaluator
+        finally:
+            _BENCHMARKS.pop(name, None)
+
+    def test_missing_requirement_marks_unavailable(self, monkeypatch):
+        monkeypatch.setattr(
+            registry, "_missing_requirements", lambda module: ["harbor"] if "terminal" in module else []
+        )
+        assert "terminal-bench-2" not in list_benchmarks()
+        assert registry.list_unavailable_benchmarks() == {"terminal_bench": "No module named 'harbor'"}
+
+
 class TestListCommand:
     @pytest.fixture
     def runner(self):
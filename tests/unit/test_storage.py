@@ -0,0 +1,273 @@
+# Copyright 2025 Horizon RL Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for evaluation result stores."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from strands_env.core import (
+    Action,
+    Observation,
+    RewardResult,
+    StepResult,
+    TaskContext,
+    TerminationReason,
+    TokenObservation,
+)
+from strands_env.eval import EvalSample, Evaluator
+from strands_env.eval.sharding import merge_shards
+from strands_env.eval.storage import (
+    JsonlResultStore,
+    PackedTokenStore,
+    ParquetResultStore,
+    create_result_store,
+    token_sidecar_path,
+)
+
+
+def make_sample(sample_id: str, reward: float | None = 1.0) -> EvalSample:
+    return EvalSample(
+        action=Action(message="q", task_context=TaskContext(id=sample_id, ground_truth="4")),
+        step_result=StepResult(
+            observation=Observation(
+                messages=[{"role": "assistant", "content": [{"text": "4"}]}],
+                metrics={"model_calls": 1},
+            ),
+            reward=RewardResult(reward=reward) if reward is not None else None,
+            termination_reason=TerminationReason.TASK_COMPLETE,
+        ),
+    )
+
+
+class TestCreateResultStore:
+    def test_jsonl_by_default(self, tmp_path):
+        assert isinstance(create_result_store(tmp_path / "results.jsonl"), JsonlResultStore)
+
+    def test_parquet_by_suffix(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        assert isinstance(create_result_store(tmp_path / "results.parquet"), ParquetResultStore)
+
+
+class TestJsonlResultStore:
+    def test_roundtrip_without_messages(self, tmp_path):
+        store = JsonlResultStore(tmp_path / "results.jsonl")
+        store.append([("p1", make_sample("p1_0")), ("p1", make_sample("p1_1", reward=None))])
+
+        results = store.read_results(include_messages=False)
+        assert [s.action.task_context.id for s in results["p1"]] == ["p1_0", "p1_1"]
+        assert results["p1"][0].step_result.observation.messages == []
+        assert results["p1"][1].step_result.reward is None
+        assert store.completed_ids() == {"p1_0", "p1_1"}
+
+
+class TestJsonlIndex:
+    def test_index_written_on_append(self, tmp_path):
+        store = JsonlResultStore(tmp_path / "results.jsonl")
+        store.append([("p1", make_sample("p1_0")), ("p1", make_sample("p1_1", reward=0.0))])
+
+        entries = JsonlResultStore(tmp_path / "results.jsonl").index
+        assert [(e.sample_id, e.prompt_id, e.reward) for e in entries] == [("p1_0", "p1", 1.0), ("p1_1", "p1", 0.0)]
+        assert entries[1].offset == entries[0].length
+
+    def test_resume_skips_validation(self, tmp_path, mocker):
+        """completed_ids comes from the index without validating samples."""
+        JsonlResultStore(tmp_path / "results.jsonl").append([("p1", make_sample("p1_0"))])
+        validate = mocker.patch.object(EvalSample, "model_validate", side_effect=AssertionError)
+
+        assert JsonlResultStore(tmp_path / "results.jsonl").completed_ids() == {"p1_0"}
+        validate.assert_not_called()
+
+    def test_missing_and_stale_index_rebuilt(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        JsonlResultStore(path).append([("p1", make_sample("p1_0")), ("p2", make_sample("p2_0"))])
+        index_path = tmp_path / "results.jsonl.idx"
+
+        # Index lost one entry (e.g. crash between data fsync and index write)
+        index_path.write_text(index_path.read_text().splitlines(keepends=True)[0])
+        assert JsonlResultStore(path).completed_ids() == {"p1_0", "p2_0"}
+        assert len(index_path.read_text().splitlines()) == 2
+
+        # Index points at offsets that no longer match the data file
+        path.write_text(path.read_text().splitlines(keepends=True)[1])
+        assert JsonlResultStore(path).completed_ids() == {"p2_0"}
+
+    def test_load_samples_hydrates_requested_only(self, tmp_path):
+        store = JsonlResultStore(tmp_path / "results.jsonl")
+        store.append([("p1", make_sample("p1_0")), ("p1", make_sample("p1_1")), ("p2", make_sample("p2_0"))])
+
+        samples = JsonlResultStore(tmp_path / "results.jsonl").load_samples({"p1_1", "p2_0"})
+        assert {pid: [s.action.task_context.id for s in ss] for pid, ss in samples.items()} == {
+            "p1": ["p1_1"],
+            "p2": ["p2_0"],
+        }
+
+    def test_compact_rewrites_index(self, tmp_path):
+        store = JsonlResultStore(tmp_path / "results.jsonl")
+        store.append([("p1", make_sample("p1_0")), ("p2", make_sample("p2_0")), ("p1", make_sample("p1_1"))])
+        store.compact()
+
+        fresh = JsonlResultStore(tmp_path / "results.jsonl")
+        assert [e.sample_id for e in fresh.index] == ["p1_0", "p1_1", "p2_0"]
+        assert fresh.load_samples({"p2_0"})["p2"][0] == make_sample("p2_0")
+
+
+class TestParquetResultStore:
+    @pytest.fixture(autouse=True)
+    def _requires_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_roundtrip(self, tmp_path):
+        store = ParquetResultStore(tmp_path / "results.parquet")
+        store.append([("p1", make_sample("p1_0"))])
+        store.append([("p1", make_sample("p1_1", reward=0.0)), ("p2", make_sample("p2_0", reward=None))])
+
+        assert len(list((tmp_path / "results.parquet").glob("part-*.parquet"))) == 2
+        results = store.read_results()
+        assert set(results) == {"p1", "p2"}
+        sample = results["p1"][0]
+        assert sample == make_sample("p1_0")
+        assert results["p2"][0].step_result.reward is None
+
+    def test_reads_only_requested_columns(self, tmp_path):
+        store = ParquetResultStore(tmp_path / "results.parquet")
+        store.append([("p1", make_sample("p1_0")), ("p1", make_sample("p1_1", reward=0.0))])
+
+        table = store.read_table(columns=["sample_id", "reward", "termination_reason"])
+        assert table.column_names == ["sample_id", "reward", "termination_reason"]
+        assert table.column("reward").to_pylist() == [1.0, 0.0]
+        assert store.completed_ids() == {"p1_0", "p1_1"}
+
+    def test_appends_merge_into_few_parts(self, tmp_path):
+        store = ParquetResultStore(tmp_path / "results.parquet", merge_factor=3)
+        for i in range(10):
+            store.append([("p1", make_sample(f"p1_{i}"))])
+        store.append([("p1", make_sample("p1_0", reward=0.0))])  # Duplicate: the first copy wins
+
+        # 11 appends in base 3: one part of 9 rows and two single-row parts
+        parts = sorted((tmp_path / "results.parquet").glob("part-*.parquet"))
+        assert [store._pq.read_metadata(part).num_rows for part in parts] == [9, 1, 1]
+        samples = store.read_results()["p1"]
+        assert [s.action.task_context.id for s in samples] == [f"p1_{i}" for i in range(10)]
+        assert samples[0].step_result.reward.reward == 1.0
+
+    def test_compact_merges_parts_and_dedupes(self, tmp_path):
+        store = ParquetResultStore(tmp_path / "results.parquet")
+        store.append([("p1", make_sample("p1_0")), ("p2", make_sample("p2_0"))])
+        store.append([("p1", make_sample("p1_1")), ("p1", make_sample("p1_0"))])
+
+        store.compact()
+
+        assert len(list((tmp_path / "results.parquet").glob("part-*.parquet"))) == 1
+        table = store.read_table(columns=["prompt_id", "sample_id"])
+        assert table.column("sample_id").to_pylist() == ["p1_0", "p1_1", "p2_0"]
+
+    async def test_evaluator_resume(self, tmp_path):
+        """Evaluator checkpoints to Parquet and resumes from it."""
+        env = MagicMock()
+        env.reset = AsyncMock()
+        env.step = AsyncMock(return_value=StepResult(observation=Observation(), reward=RewardResult(reward=1.0)))
+        env.cleanup = AsyncMock()
+
+        async def factory(action):
+            return env
+
+        output_path = tmp_path / "results.parquet"
+        actions = [Action(message="q", task_context=TaskContext(id="p1"))]
+        await Evaluator(env_factory=factory, n_samples_per_prompt=2, output_path=output_path).run(actions)
+        assert env.step.await_count == 2
+
+        evaluator = Evaluator(env_factory=factory, n_samples_per_prompt=3, output_path=output_path, streaming=True)
+        await evaluator.run(actions)
+        assert env.step.await_count == 3
+        assert evaluator.compute_metrics(evaluator.read_results(include_messages=False), log=False)["pass@3"] == 1.0
+
+
+def make_tokens(n: int) -> TokenObservation:
+    return TokenObservation(
+        token_ids=list(range(n)),
+        prompt_length=1,
+        loss_mask=[0] + [1] * (n - 1),
+        logprobs=[None] + [-0.5] * (n - 1),
+    )
+
+
+class TestPackedTokenStore:
+    def test_roundtrip_memory_mapped(self, tmp_path):
+        store = PackedTokenStore(tmp_path / "results.jsonl.tokens")
+        store.append([("p1_0", make_tokens(3))])
+        store.append([("p1_1", make_tokens(5))])
+
+        fresh = PackedTokenStore(tmp_path / "results.jsonl.tokens")
+        arrays = fresh.get("p1_1")
+        assert isinstance(arrays.token_ids.base, np.memmap)
+        assert arrays.rollout_token_ids.tolist() == [1, 2, 3, 4]
+        assert arrays.to_token_observation() == make_tokens(5)
+        assert [sample_id for sample_id, _ in fresh.iter_arrays()] == ["p1_0", "p1_1"]
+        assert fresh.get("missing") is None
+
+    def test_repair_discards_uncommitted_arrays(self, tmp_path):
+        store = PackedTokenStore(tmp_path / "tokens")
+        store.append([("p1_0", make_tokens(3))])
+        with open(tmp_path / "tokens" / "token_ids.bin", "ab") as f:
+            f.write(b"\x00" * 8)  # Arrays written but index line never committed
+        with open(store.index_path, "a") as f:
+            f.write('["p1_1", 3, ')
+
+        store = PackedTokenStore(tmp_path / "tokens")
+        store.append([("p1_1", make_tokens(2))])
+        assert store.get("p1_1").to_token_observation() == make_tokens(2)
+        assert (tmp_path / "tokens" / "token_ids.bin").stat().st_size == 5 * 4
+
+    def test_repair_after_read_before_append(self, tmp_path):
+        """Reading the index first (as on resume) must not skip the repair of a torn write."""
+        store = PackedTokenStore(tmp_path / "tokens")
+        store.append([("p1_0", make_tokens(3))])
+        for name in PackedTokenStore.ARRAYS:
+            with open(tmp_path / "tokens" / f"{name}.bin", "ab") as f:
+                f.write(b"\xff" * 16)  # Arrays written but index line never committed
+
+        store = PackedTokenStore(tmp_path / "tokens")
+        assert store.get("p1_0").to_token_observation() == make_tokens(3)
+        store.append([("p1_1", make_tokens(4))])
+        assert store.get("p1_1").to_token_observation() == make_tokens(4)
+        assert PackedTokenStore(tmp_path / "tokens").get("p1_1").to_token_observation() == make_tokens(4)
+
+    async def test_evaluator_packs_tokens(self, tmp_path):
+        """Saved samples carry no tokens; they are read back from the sidecar."""
+        env = MagicMock()
+        env.reset = AsyncMock()
+        env.step = AsyncMock(side_effect=lambda action: StepResult(observation=Observation(tokens=make_tokens(4))))
+        env.cleanup = AsyncMock()
+
+        async def factory(action):
+            return env
+
+        output_path = tmp_path / "results.jsonl"
+        evaluator = Evaluator(env_factory=factory, output_path=output_path, keep_tokens=True, pack_tokens=True)
+        results = await evaluator.run([Action(message="q", task_context=TaskContext(id="p1"))])
+        assert results["p1"][0].step_result.observation.tokens == make_tokens(4)
+        assert b"token_ids" not in output_path.read_bytes()
+        assert evaluator.store.read_results()["p1"][0].step_result.observation.tokens is None
+        assert evaluator.token_store.get("p1_0").to_token_observation() == make_tokens(4)
+
+        merged = JsonlResultStore(tmp_path / "merged.jsonl")
+        merge_shards([evaluator.store], merged)
+        assert PackedTokenStore(token_sidecar_path(merged.path)).get("p1_0").to_token_observation() == make_tokens(4)
+
+    def test_pack_tokens_requires_keep_tokens(self, tmp_path):
+        with pytest.raises(ValueError, match="keep_tokens"):
+            Evaluator(env_factory=AsyncMock(), output_path=tmp_path / "results.jsonl", pack_tokens=True)
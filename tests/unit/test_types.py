@@ -14,12 +14,16 @@
 
 """Unit tests for core types."""
 
-from strands.types.exceptions import EventLoopException, MaxTokensReachedException
+import numpy as np
+import pytest
+from strands.types.exceptions import EventLoopException, MaxTokensReachedException, ModelThrottledException
 from strands_sglang import MaxToolCallsReachedError, MaxToolIterationsReachedError, TokenManager
 
+from strands_env.core.tokens import TokenArrays, collate_rollouts
 from strands_env.core.types import (
     Action,
     Observation,
+    RewardFunction,
     RewardResult,
     StepResult,
     TaskContext,
@@ -106,6 +110,96 @@ class TestTokenObservation:
         assert obs.initial_prompt_token_ids == [10, 20]
 
 
+# ---------------------------------------------------------------------------
+# TokenArrays
+# ---------------------------------------------------------------------------
+
+
+class TestTokenArrays:
+    @pytest.fixture
+    def obs(self):
+        return TokenObservation(
+            token_ids=[10, 20, 30, 40, 50],
+            prompt_length=2,
+            loss_mask=[0, 0, 1, 1, 1],
+            logprobs=[None, None, -0.5, -0.25, -0.125],
+        )
+
+    def test_compact_dtypes_and_nan_sentinel(self, obs):
+        arrays = obs.to_arrays()
+        assert arrays.token_ids.dtype == np.int32
+        assert arrays.loss_mask.dtype == np.int8
+        assert arrays.logprobs.dtype == np.float32
+        assert np.isnan(arrays.logprobs[:2]).all()
+        assert arrays.nbytes == 5 * (4 + 1 + 4)
+
+    def test_rollout_properties_are_views(self, obs):
+        arrays = obs.to_arrays()
+        assert arrays.rollout_token_ids.tolist() == [30, 40, 50]
+        assert arrays.initial_prompt_token_ids.tolist() == [10, 20]
+        assert arrays.rollout_loss_mask.tolist() == [1, 1, 1]
+        for view, base in [
+            (arrays.rollout_token_ids, arrays.token_ids),
+            (arrays.rollout_loss_mask, arrays.loss_mask),
+            (arrays.rollout_logprobs, arrays.logprobs),
+        ]:
+            assert np.shares_memory(view, base)
+
+    def test_round_trip(self, obs):
+        assert obs.to_arrays().to_token_observation() == obs
+
+    def test_length_mismatch_rejected(self):
+        with pytest.raises(ValueError, match="Length mismatch"):
+            TokenArrays.from_lists([1, 2], 1, [0], [None, None])
+        with pytest.raises(ValueError, match="prompt_length"):
+            TokenArrays.from_lists([1], 2, [0], [None])
+
+
+# ---------------------------------------------------------------------------
+# collate_rollouts
+# ---------------------------------------------------------------------------
+
+
+class TestCollateRollouts:
+    @pytest.fixture
+    def observations(self):
+        return [
+            TokenObservation(token_ids=[1, 2, 3], prompt_length=1, loss_mask=[0, 1, 1], logprobs=[None, -0.5, -1.0]),
+            TokenObservation(token_ids=[4, 5], prompt_length=1, loss_mask=[0, 1], logprobs=[None, -0.25]),
+        ]
+
+    def test_padded(self, observations):
+        batch = collate_rollouts(observations, [1.0, None], pad_token_id=-1)
+        assert batch.token_ids.tolist() == [[1, 2, 3], [4, 5, -1]]
+        assert batch.loss_mask.tolist() == [[0, 1, 1], [0, 1, 0]]
+        assert batch.logprobs.tolist() == [[0.0, -0.5, -1.0], [0.0, -0.25, 0.0]]
+        assert batch.position_ids.tolist() == [[0, 1, 2], [0, 1, 0]]
+        assert batch.attention_mask.tolist() == [[1, 1, 1], [1, 1, 0]]
+        assert batch.rewards.tolist() == [[1.0, 1.0, 1.0], [0.0, 0.0, 0.0]]
+        assert batch.cu_seqlens.tolist() == [0, 3, 5]
+        assert batch.prompt_lengths.tolist() == [1, 1]
+
+    def test_packed_matches_padded(self, observations):
+        packed = collate_rollouts(observations, [1.0, 0.5], packed=True)
+        padded = collate_rollouts(observations, [1.0, 0.5])
+        assert packed.token_ids.tolist() == [1, 2, 3, 4, 5]
+        assert packed.position_ids.tolist() == [0, 1, 2, 0, 1]
+        assert packed.rewards.tolist() == [1.0, 1.0, 1.0, 0.5, 0.5]
+        assert packed.seqlens.tolist() == [3, 2]
+        for name in ["token_ids", "loss_mask", "logprobs", "position_ids", "rewards"]:
+            assert np.array_equal(getattr(packed, name), getattr(padded, name)[padded.attention_mask.astype(bool)])
+
+    def test_token_arrays_and_pad_to_multiple(self, observations):
+        batch = collate_rollouts([obs.to_arrays() for obs in observations], packed=True, pad_to_multiple_of=4)
+        assert batch.token_ids.tolist() == [1, 2, 3, 4, 5, 0, 0, 0]
+        assert batch.attention_mask.tolist() == [1, 1, 1, 1, 1, 0, 0, 0]
+        assert batch.sequence_rewards.tolist() == [0.0, 0.0]
+
+    def test_rewards_length_mismatch(self, observations):
+        with pytest.raises(ValueError, match="Expected 2 rewards"):
+            collate_rollouts(observations, [1.0])
+
+
 # ---------------------------------------------------------------------------
 # Observation
 # ---------------------------------------------------------------------------
@@ -167,6 +261,11 @@ class TestTerminationReason:
         error.__cause__ = MaxTokensReachedException("max tokens reached")
         assert TerminationReason.from_error(error) == TerminationReason.MAX_TOKENS_REACHED
 
+    def test_throttled(self):
+        error = EventLoopException(Exception())
+        error.__cause__ = ModelThrottledException("rate exceeded")
+        assert TerminationReason.from_error(error) == TerminationReason.THROTTLED
+
     def test_timeout(self):
         class ReadTimeoutError(Exception):
             pass
@@ -212,3 +311,20 @@ class TestStepResult:
         result = StepResult(observation=obs, reward=reward)
         assert result.reward.reward == 1.0
         assert result.reward.info["exact_match"] is True
+
+
+# ---------------------------------------------------------------------------
+# RewardFunction
+# ---------------------------------------------------------------------------
+
+
+class TestRewardFunction:
+    async def test_compute_batch_defaults_to_compute(self):
+        class LengthReward(RewardFunction):
+            async def compute(self, action, step_result):
+                return RewardResult(reward=float(len(action.message)))
+
+        fn = LengthReward()
+        pairs = [(Action(message=m), StepResult(observation=Observation())) for m in ["a", "bbb", "cc"]]
+        assert fn.batched is False
+        assert [r.reward for r in await fn.compute_batch(pairs)] == [1.0, 3.0, 2.0]